@@ -0,0 +1,83 @@
+"""
+Compare parse throughput of compressed archives against raw logs
+
+Usage:
+    python -m benchmarks.compressed --size-mb 5
+"""
+
+import argparse
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+from functools import partial
+from typing import IO, cast
+
+from src.utils.log_archive import CHUNK_SIZE, iter_log_lines
+
+from .harness import measure
+from .log_reader import write_marathon_log
+
+COMPRESSIONS = ("gz", "bz2", "xz")
+
+
+def _open_compressed(path: str, suffix: str) -> IO[bytes]:
+    if suffix == "gz":
+        return cast(IO[bytes], gzip.open(path, "wb"))
+    if suffix == "bz2":
+        return bz2.open(path, "wb")
+    return lzma.open(path, "wb")
+
+
+def compress(path: str, suffix: str) -> str:
+    """Write a compressed copy of ``path`` next to it"""
+    archive = f"{path}.{suffix}"
+    with open(path, "rb") as src, _open_compressed(archive, suffix) as dst:
+        shutil.copyfileobj(src, dst, CHUNK_SIZE)
+    return archive
+
+
+def stream_lines(path: str) -> None:
+    """Decompress and decode every line without parsing"""
+    for _ in iter_log_lines(path):
+        pass
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark compressed log parsing")
+    parser.add_argument("--size-mb", type=float, default=5.0, help="Raw size of the test log")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per format")
+    parser.add_argument(
+        "--stream-only",
+        action="store_true",
+        help="Only measure decompression and line splitting, not the log parser",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.stream_only:
+        from src.utils.game_state import parse_log_status
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        raw = os.path.join(temp_dir, "game.txt")
+        raw_mb = write_marathon_log(raw, args.size_mb) / (1024 * 1024)
+        paths = {"raw": raw, **{suffix: compress(raw, suffix) for suffix in COMPRESSIONS}}
+
+        print(f"Raw log size: {raw_mb:.1f} MB")
+        for name, path in paths.items():
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            stream = measure(f"stream_{name}", partial(stream_lines, path), args.repeat, 1)
+            line = (
+                f"{name:4} {size_mb:7.2f} MB on disk  "
+                f"stream {raw_mb / (stream.median_ms / 1000):8.1f} MB/s"
+            )
+            if not args.stream_only:
+                parse = measure(f"parse_{name}", partial(parse_log_status, path), args.repeat, 1)
+                line += f"  parse {raw_mb / (parse.median_ms / 1000):8.1f} MB/s"
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
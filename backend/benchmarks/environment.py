@@ -0,0 +1,92 @@
+"""
+Temporary log directory and configuration for benchmarks
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from types import SimpleNamespace, TracebackType
+from typing import Any
+
+from src.config.config_manager import ConfigManager, config_manager
+
+from .log_generator import CARD_CATALOG, write_log
+
+
+class BenchmarkEnvironment:
+    """
+    Creates a temporary log directory and config file and points the backend's
+    global config manager at it for the lifetime of the context.
+    """
+
+    def __init__(self, turns: tuple[int, ...] = (3, 7, 10), filler_logs: int = 50) -> None:
+        self.turns = turns
+        self.filler_logs = filler_logs
+        self.root = ""
+        self.log_directory = ""
+        self.logs: dict[int, str] = {}
+        self.config_manager = ConfigManager()
+        self._original_config_file = config_manager.config_file
+
+    def __enter__(self) -> "BenchmarkEnvironment":
+        self.root = tempfile.mkdtemp(prefix="twilight-bench-")
+        self.log_directory = os.path.join(self.root, "logs")
+        os.makedirs(self.log_directory)
+
+        for i in range(self.filler_logs):
+            path = write_log(os.path.join(self.log_directory, f"old-game-{i:03d}.txt"), turns=1)
+            os.utime(path, (i, i))
+        for turns in self.turns:
+            self.logs[turns] = write_log(
+                os.path.join(self.log_directory, f"game-{turns:02d}-turns.txt"),
+                turns=turns,
+                seed=turns,
+            )
+
+        config_file = os.path.join(self.root, "config.json")
+        self.config_manager.config_file = config_file
+        config_manager.config_file = config_file
+        self.use_log(None)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        config_manager.config_file = self._original_config_file
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def use_log(self, path: str | None) -> None:
+        """Configure a specific log file, or None for the most recent one"""
+        with open(self.config_manager.config_file, "w") as f:
+            json.dump({"log_file_path": path, "log_directory": self.log_directory}, f)
+
+
+def synthetic_game(deck_size: int = 60, discarded: int = 30, removed: int = 10) -> Any:
+    """
+    Build a parsed-game stand-in with a full card catalog for formatter benchmarks
+
+    Args:
+        deck_size: Number of cards in the draw deck
+        discarded: Number of discarded cards
+        removed: Number of removed cards
+
+    Returns:
+        object: Object with ``CARDS`` and ``current_play`` like a parsed game
+    """
+    cards = {
+        name: SimpleNamespace(name=name, side=side, ops=ops)
+        for name, (side, ops) in CARD_CATALOG.items()
+    }
+    names = list(cards)
+    play = SimpleNamespace(
+        turn=10,
+        possible_draw_cards=names[:deck_size],
+        discarded_cards=names[deck_size : deck_size + discarded],
+        removed_cards=names[deck_size + discarded : deck_size + discarded + removed],
+        cards_in_hands=names[deck_size + discarded + removed :],
+    )
+    return SimpleNamespace(CARDS=cards, current_play=play)
@@ -0,0 +1,133 @@
+"""
+Timing, result storage and baseline comparison helpers for benchmarks
+"""
+
+import json
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing summary for one benchmark"""
+
+    name: str
+    runs: int
+    median_ms: float
+    mean_ms: float
+    min_ms: float
+    max_ms: float
+
+    @classmethod
+    def from_timings(cls, name: str, timings_ns: list[int]) -> "BenchmarkResult":
+        timings_ms = [t / 1_000_000 for t in timings_ns]
+        return cls(
+            name=name,
+            runs=len(timings_ms),
+            median_ms=statistics.median(timings_ms),
+            mean_ms=statistics.fmean(timings_ms),
+            min_ms=min(timings_ms),
+            max_ms=max(timings_ms),
+        )
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    repeat: int = 20,
+    warmup: int = 2,
+    setup: Callable[[], Any] | None = None,
+) -> BenchmarkResult:
+    """
+    Time repeated calls of a function
+
+    Args:
+        name: Benchmark name used in results and baselines
+        func: Zero-argument callable to time
+        repeat: Number of timed calls
+        warmup: Number of untimed calls made first
+        setup: Untimed callable run before every call, e.g. to drop caches
+
+    Returns:
+        BenchmarkResult: Timing summary
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        func()
+
+    timings: list[int] = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter_ns()
+        func()
+        timings.append(time.perf_counter_ns() - started)
+    return BenchmarkResult.from_timings(name, timings)
+
+
+def save_results(path: str, results: list[BenchmarkResult]) -> None:
+    """Write benchmark results to a JSON file"""
+    with open(path, "w") as f:
+        json.dump({"results": [asdict(r) for r in results]}, f, indent=2)
+        f.write("\n")
+
+
+def load_results(path: str) -> dict[str, BenchmarkResult]:
+    """Read benchmark results from a JSON file, keyed by benchmark name"""
+    with open(path) as f:
+        data = json.load(f)
+    return {r["name"]: BenchmarkResult(**r) for r in data.get("results", [])}
+
+
+def compare_to_baseline(
+    results: list[BenchmarkResult],
+    baseline: dict[str, BenchmarkResult],
+    tolerance: float,
+) -> list[str]:
+    """
+    Compare results against a baseline
+
+    Args:
+        results: Current benchmark results
+        baseline: Baseline results keyed by name
+        tolerance: Allowed relative slowdown of the median (0.25 means 25%)
+
+    Returns:
+        list: Human-readable descriptions of every regression found
+    """
+    regressions: list[str] = []
+    for result in results:
+        reference = baseline.get(result.name)
+        if reference is None or reference.median_ms <= 0:
+            continue
+        limit = reference.median_ms * (1 + tolerance)
+        if result.median_ms > limit:
+            regressions.append(
+                f"{result.name}: median {result.median_ms:.3f} ms exceeds baseline "
+                f"{reference.median_ms:.3f} ms by more than {tolerance:.0%}"
+            )
+    return regressions
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Compute a percentile with linear interpolation
+
+    Args:
+        values: Sample values (need not be sorted)
+        q: Percentile in the range 0-100
+
+    Returns:
+        float: The interpolated percentile, or 0.0 for no values
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
@@ -0,0 +1,248 @@
+"""
+Concurrent load test for the status and config endpoints
+
+Fires N concurrent clients at the backend for a fixed duration while a
+simulated game appends to the log, then reports throughput and latency
+percentiles per endpoint.
+
+Usage:
+    python -m benchmarks.load_test --clients 16 --duration 30
+    python -m benchmarks.load_test --url http://localhost:8000 --log-dir "/path/to/logs"
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from .environment import BenchmarkEnvironment
+from .harness import percentile
+from .log_generator import iter_log_lines
+
+DEFAULT_ENDPOINTS = ("/api/current-status", "/api/config/")
+
+# A client fetches a path and returns the HTTP status code
+Fetch = Callable[[str], int]
+
+
+@dataclass
+class EndpointStats:
+    """Latencies and failures recorded for one endpoint"""
+
+    latencies_ms: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, duration: float) -> dict[str, Any]:
+        return {
+            "requests": len(self.latencies_ms),
+            "errors": self.errors,
+            "throughput_rps": len(self.latencies_ms) / duration if duration else 0.0,
+            "p50_ms": percentile(self.latencies_ms, 50),
+            "p95_ms": percentile(self.latencies_ms, 95),
+            "p99_ms": percentile(self.latencies_ms, 99),
+            "max_ms": max(self.latencies_ms, default=0.0),
+        }
+
+
+class SimulatedGame(threading.Thread):
+    """Appends a synthetic game to a log file line by line, like a game client"""
+
+    def __init__(self, path: str, lines_per_second: float, seed: int = 0) -> None:
+        super().__init__(name="simulated-game", daemon=True)
+        self.path = path
+        self.lines_per_second = lines_per_second
+        self.seed = seed
+        self.lines_written = 0
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        delay = 1.0 / self.lines_per_second if self.lines_per_second > 0 else 0.0
+        with open(self.path, "w", encoding="utf-8") as f:
+            for line in iter_log_lines(turns=10, seed=self.seed):
+                if self._stop_event.is_set():
+                    return
+                f.write(f"{line}\n")
+                f.flush()
+                self.lines_written += 1
+                self._stop_event.wait(delay)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+def http_fetcher(base_url: str, timeout: float = 10.0) -> Callable[[], Fetch]:
+    """Build per-client fetchers that talk to a live server"""
+
+    def make() -> Fetch:
+        def fetch(path: str) -> int:
+            try:
+                with urllib.request.urlopen(base_url.rstrip("/") + path, timeout=timeout) as r:
+                    r.read()
+                    return int(r.status)
+            except urllib.error.HTTPError as e:
+                return int(e.code)
+
+        return fetch
+
+    return make
+
+
+def flask_client_fetcher(app: Any) -> Callable[[], Fetch]:
+    """Build per-client fetchers that use the Flask test client"""
+
+    def make() -> Fetch:
+        client = app.test_client()
+
+        def fetch(path: str) -> int:
+            return int(client.get(path).status_code)
+
+        return fetch
+
+    return make
+
+
+def run_load(
+    make_fetch: Callable[[], Fetch],
+    clients: int,
+    duration: float,
+    endpoints: tuple[str, ...] = DEFAULT_ENDPOINTS,
+) -> dict[str, Any]:
+    """
+    Run concurrent clients against the endpoints for a fixed duration
+
+    Args:
+        make_fetch: Factory returning one fetch function per client thread
+        clients: Number of concurrent client threads
+        duration: How long to run, in seconds
+        endpoints: Paths each client cycles through
+
+    Returns:
+        dict: Overall and per-endpoint throughput and latency percentiles
+    """
+    stats = {endpoint: EndpointStats() for endpoint in endpoints}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client_loop(index: int) -> None:
+        fetch = make_fetch()
+        local = {endpoint: EndpointStats() for endpoint in endpoints}
+        i = index
+        while time.perf_counter() < deadline:
+            endpoint = endpoints[i % len(endpoints)]
+            i += 1
+            started = time.perf_counter()
+            try:
+                ok = fetch(endpoint) < 500
+            except Exception:
+                ok = False
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if ok:
+                local[endpoint].latencies_ms.append(elapsed_ms)
+            else:
+                local[endpoint].errors += 1
+        with lock:
+            for endpoint, endpoint_stats in local.items():
+                stats[endpoint].latencies_ms.extend(endpoint_stats.latencies_ms)
+                stats[endpoint].errors += endpoint_stats.errors
+
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(target=client_loop, args=(i,), name=f"load-client-{i}")
+        for i in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    overall = EndpointStats()
+    for endpoint_stats in stats.values():
+        overall.latencies_ms.extend(endpoint_stats.latencies_ms)
+        overall.errors += endpoint_stats.errors
+
+    return {
+        "clients": clients,
+        "duration_s": elapsed,
+        "overall": overall.summary(elapsed),
+        "endpoints": {endpoint: s.summary(elapsed) for endpoint, s in stats.items()},
+    }
+
+
+def print_report(report: dict[str, Any]) -> None:
+    """Print a load test report as a table"""
+    print(f"{report['clients']} clients for {report['duration_s']:.1f}s")
+    rows = [("overall", report["overall"]), *report["endpoints"].items()]
+    for name, row in rows:
+        print(
+            f"{name:24} {row['throughput_rps']:8.1f} req/s  "
+            f"p50 {row['p50_ms']:7.2f} ms  p95 {row['p95_ms']:7.2f} ms  "
+            f"p99 {row['p99_ms']:7.2f} ms  errors {row['errors']}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load test the backend")
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument(
+        "--url", default=None, help="Base URL of a live server (default: Flask test client)"
+    )
+    parser.add_argument(
+        "--log-dir",
+        default=None,
+        help="Log directory of the live server, where the simulated game is written",
+    )
+    parser.add_argument(
+        "--lines-per-second", type=float, default=5.0, help="Simulated game write rate"
+    )
+    parser.add_argument("--endpoint", action="append", help="Endpoint to hit (repeatable)")
+    parser.add_argument("--output", default=None, help="Write the report as JSON")
+    args = parser.parse_args(argv)
+
+    endpoints = tuple(args.endpoint) if args.endpoint else DEFAULT_ENDPOINTS
+
+    with BenchmarkEnvironment(turns=(), filler_logs=10) as env:
+        log_dir = args.log_dir if args.url else env.log_directory
+        game = None
+        try:
+            if log_dir:
+                game = SimulatedGame(
+                    os.path.join(log_dir, "load-test-game.txt"), args.lines_per_second
+                )
+                game.start()
+
+            if args.url:
+                make_fetch = http_fetcher(args.url)
+            else:
+                from src.app import create_app
+
+                app = create_app(config_manager=env.config_manager)
+                app.testing = True
+                make_fetch = flask_client_fetcher(app)
+
+            report = run_load(make_fetch, args.clients, args.duration, endpoints)
+        finally:
+            if game is not None:
+                game.stop()
+                game.join()
+                if args.url and os.path.exists(game.path):
+                    # Written into the live server's own log directory
+                    os.remove(game.path)
+        report["log_lines_appended"] = game.lines_written if game is not None else 0
+
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,335 @@
+"""
+Synthetic Twilight Struggle log generator for benchmarks
+
+Produces TSEspionage-style game logs of configurable length so that the
+backend can be benchmarked against realistic input without shipping real
+game logs.
+"""
+
+import argparse
+import os
+import random
+from collections.abc import Iterator
+
+# (name, side, ops) for the full card set, in deck order
+EARLY_WAR: list[tuple[str, str, int]] = [
+    ("Asia Scoring", "Neutral", 0),
+    ("Europe Scoring", "Neutral", 0),
+    ("Middle East Scoring", "Neutral", 0),
+    ("Duck and Cover", "US", 3),
+    ("Five Year Plan", "US", 3),
+    ("Socialist Governments", "USSR", 3),
+    ("Fidel", "USSR", 2),
+    ("Vietnam Revolts", "USSR", 2),
+    ("Blockade", "USSR", 1),
+    ("Korean War", "USSR", 2),
+    ("Romanian Abdication", "USSR", 1),
+    ("Arab-Israeli War", "USSR", 2),
+    ("COMECON", "USSR", 3),
+    ("Nasser", "USSR", 1),
+    ("Warsaw Pact Formed", "USSR", 3),
+    ("De Gaulle Leads France", "USSR", 3),
+    ("Captured Nazi Scientist", "Neutral", 1),
+    ("Truman Doctrine", "US", 1),
+    ("Olympic Games", "Neutral", 2),
+    ("NATO", "US", 4),
+    ("Independent Reds", "US", 2),
+    ("Marshall Plan", "US", 4),
+    ("Indo-Pakistani War", "Neutral", 2),
+    ("Containment", "US", 3),
+    ("CIA Created", "US", 1),
+    ("US/Japan Mutual Defense Pact", "US", 4),
+    ("Suez Crisis", "USSR", 3),
+    ("East European Unrest", "US", 3),
+    ("Decolonization", "USSR", 2),
+    ("Red Scare/Purge", "Neutral", 4),
+    ("UN Intervention", "Neutral", 1),
+    ("De-Stalinization", "USSR", 3),
+    ("Nuclear Test Ban", "Neutral", 4),
+    ("Formosan Resolution", "US", 2),
+    ("Defectors", "US", 2),
+    ("The Cambridge Five", "USSR", 2),
+    ("Special Relationship", "US", 2),
+    ("NORAD", "US", 3),
+]
+
+MID_WAR: list[tuple[str, str, int]] = [
+    ("Brush War", "Neutral", 3),
+    ("Central America Scoring", "Neutral", 0),
+    ("Southeast Asia Scoring", "Neutral", 0),
+    ("Arms Race", "Neutral", 3),
+    ("Cuban Missile Crisis", "Neutral", 3),
+    ("Nuclear Subs", "US", 2),
+    ("Quagmire", "USSR", 3),
+    ("Salt Negotiations", "Neutral", 3),
+    ("Bear Trap", "US", 3),
+    ("Summit", "Neutral", 1),
+    ("How I Learned to Stop Worrying", "Neutral", 2),
+    ("Junta", "Neutral", 2),
+    ("Kitchen Debates", "US", 1),
+    ("Missile Envy", "Neutral", 2),
+    ("We Will Bury You", "USSR", 4),
+    ("Brezhnev Doctrine", "USSR", 3),
+    ("Portuguese Empire Crumbles", "USSR", 2),
+    ("South African Unrest", "USSR", 2),
+    ("Allende", "USSR", 1),
+    ("Willy Brandt", "USSR", 2),
+    ("Muslim Revolution", "USSR", 4),
+    ("ABM Treaty", "Neutral", 4),
+    ("Cultural Revolution", "USSR", 3),
+    ("Flower Power", "USSR", 4),
+    ("U2 Incident", "USSR", 3),
+    ("OPEC", "USSR", 3),
+    ("Lone Gunman", "USSR", 1),
+    ("Colonial Rear Guards", "US", 2),
+    ("Panama Canal Returned", "US", 1),
+    ("Camp David Accords", "US", 2),
+    ("Puppet Governments", "US", 2),
+    ("Grain Sales to Soviets", "US", 2),
+    ("John Paul II Elected Pope", "US", 2),
+    ("Latin American Death Squads", "Neutral", 2),
+    ("OAS Founded", "US", 1),
+    ("Nixon Plays the China Card", "US", 2),
+    ("Sadat Expels Soviets", "US", 1),
+    ("Shuttle Diplomacy", "US", 3),
+    ("The Voice of America", "US", 2),
+    ("Liberation Theology", "USSR", 2),
+    ("Ussuri River Skirmish", "US", 3),
+    ("Ask Not What Your Country Can Do For You", "US", 3),
+    ("Alliance for Progress", "US", 3),
+    ("Africa Scoring", "Neutral", 0),
+    ("One Small Step", "Neutral", 2),
+    ("South America Scoring", "Neutral", 0),
+    ("Che", "USSR", 3),
+    ("Our Man in Tehran", "US", 2),
+]
+
+LATE_WAR: list[tuple[str, str, int]] = [
+    ("Iranian Hostage Crisis", "USSR", 3),
+    ("The Iron Lady", "US", 3),
+    ("Reagan Bombs Libya", "US", 2),
+    ("Star Wars", "US", 2),
+    ("North Sea Oil", "US", 3),
+    ("The Reformer", "USSR", 3),
+    ("Marine Barracks Bombing", "USSR", 2),
+    ("Soviets Shoot Down KAL-007", "US", 4),
+    ("Glasnost", "USSR", 4),
+    ("Ortega Elected in Nicaragua", "USSR", 2),
+    ("Terrorism", "Neutral", 2),
+    ("Iran-Contra Scandal", "USSR", 2),
+    ("Chernobyl", "US", 3),
+    ("Latin American Debt Crisis", "USSR", 2),
+    ("Tear Down This Wall", "US", 3),
+    ("An Evil Empire", "US", 3),
+    ("Aldrich Ames Remix", "USSR", 3),
+    ("Pershing II Deployed", "USSR", 3),
+    ("Wargames", "Neutral", 4),
+    ("Solidarity", "US", 2),
+    ("Iran-Iraq War", "Neutral", 2),
+    ("Yuri and Samantha", "USSR", 2),
+    ("AWACS Sale to Saudis", "US", 3),
+]
+
+CARD_CATALOG: dict[str, tuple[str, int]] = {
+    name: (side, ops) for name, side, ops in EARLY_WAR + MID_WAR + LATE_WAR
+}
+
+COUNTRIES = [
+    "Cuba", "Panama", "Mexico", "Angola", "Zaire", "South Africa", "Iran", "Iraq",
+    "Egypt", "Libya", "Israel", "Pakistan", "India", "Thailand", "Philippines",
+    "Japan", "South Korea", "North Korea", "Italy", "France", "West Germany",
+    "East Germany", "Poland", "Venezuela", "Brazil", "Argentina", "Chile",
+]  # fmt: skip
+
+HAND_SIZE_BY_TURN = {1: 8, 2: 8, 3: 8}
+DEFAULT_HAND_SIZE = 9
+
+
+def _hand_size(turn: int) -> int:
+    return HAND_SIZE_BY_TURN.get(turn, DEFAULT_HAND_SIZE)
+
+
+def _action_rounds(turn: int) -> int:
+    return 6 if turn <= 3 else 7
+
+
+def _play_line(rng: random.Random, player: str, card: str, event_rate: float) -> list[str]:
+    side, ops = CARD_CATALOG[card]
+    if side == "Neutral" and ops == 0:
+        return [f"{player} plays {card} for Event", f"Event: {card}: region scored."]
+    if rng.random() < event_rate:
+        return [
+            f"{player} plays {card}* for Event",
+            f"Event: {card}*: resolved.",
+        ]
+    country = rng.choice(COUNTRIES)
+    kind = rng.choice(["Influence", "Coup", "Realignment"])
+    lines = [f"{player} plays {card} for Operations: {ops} Ops"]
+    if kind == "Influence":
+        lines.append(f"{player} places influence in {country} [+{max(ops, 1)}]")
+    elif kind == "Coup":
+        roll = rng.randint(1, 6)
+        lines.append(f"{player} Coup in {country}: Die roll {roll}")
+    else:
+        lines.append(
+            f"{player} Realignment in {country}: US roll {rng.randint(1, 6)}, "
+            f"USSR roll {rng.randint(1, 6)}"
+        )
+    return lines
+
+
+class _Deck:
+    """Draw pile and discard pile with optional reshuffle limit"""
+
+    def __init__(self, rng: random.Random, reshuffles: int | None) -> None:
+        self.rng = rng
+        self.draw = [name for name, _, _ in EARLY_WAR]
+        self.discard: list[str] = []
+        self.reshuffles_left = reshuffles if reshuffles is not None else -1
+        rng.shuffle(self.draw)
+
+    def add_war_cards(self, turn: int) -> Iterator[str]:
+        cards = MID_WAR if turn == 4 else LATE_WAR if turn == 8 else []
+        if cards:
+            self.draw.extend(name for name, _, _ in cards)
+            self.rng.shuffle(self.draw)
+            yield f"{'Mid' if turn == 4 else 'Late'} War cards added to the deck"
+
+    def deal(self, hand: list[str], size: int) -> Iterator[str]:
+        while len(hand) < size:
+            if not self.draw:
+                if self.reshuffles_left == 0 or not self.discard:
+                    return
+                self.reshuffles_left -= 1
+                self.draw, self.discard = self.discard, []
+                self.rng.shuffle(self.draw)
+                yield "*RESHUFFLE*: Discard pile shuffled into draw deck"
+            hand.append(self.draw.pop())
+
+
+def iter_log_lines(
+    turns: int = 10,
+    events_per_turn: int | None = None,
+    reshuffles: int | None = None,
+    seed: int = 0,
+) -> Iterator[str]:
+    """
+    Generate the lines of a synthetic game log
+
+    Args:
+        turns: Number of turns to play (1-10)
+        events_per_turn: Approximate number of cards played for their event per turn;
+            defaults to roughly a third of all plays
+        reshuffles: Maximum number of reshuffles to emit; defaults to unlimited
+        seed: Random seed, so logs are reproducible
+
+    Yields:
+        str: Log lines without trailing newlines
+    """
+    rng = random.Random(seed)
+    deck = _Deck(rng, reshuffles)
+
+    yield "TSEspionage game log"
+    yield "USSR: Player 1"
+    yield "US: Player 2"
+
+    for turn in range(1, max(turns, 1) + 1):
+        yield from deck.add_war_cards(turn)
+
+        rounds = _action_rounds(turn)
+        plays = 2 * (rounds + 1)
+        event_rate = min(events_per_turn / plays, 1.0) if events_per_turn is not None else 1 / 3
+
+        hands: dict[str, list[str]] = {"USSR": [], "US": []}
+        for player in ("USSR", "US"):
+            yield from deck.deal(hands[player], _hand_size(turn))
+
+        yield f"Turn {turn}, Headline Phase"
+        for player in ("USSR", "US"):
+            if hands[player]:
+                card = hands[player].pop(rng.randrange(len(hands[player])))
+                yield f"{player} Headlines {card}"
+                yield f"Event: {card}: resolved."
+                deck.discard.append(card)
+
+        for action_round in range(1, rounds + 1):
+            for player in ("USSR", "US"):
+                if not hands[player]:
+                    continue
+                card = hands[player].pop(rng.randrange(len(hands[player])))
+                yield f"Turn {turn}, {player} AR{action_round}"
+                yield from _play_line(rng, player, card, event_rate)
+                deck.discard.append(card)
+
+        yield f"Turn {turn}, Cleanup"
+        yield f"DEFCON level is now {rng.randint(2, 5)}"
+        yield f"VP total: {rng.randint(-10, 10)}"
+
+
+def generate_log(
+    turns: int = 10,
+    events_per_turn: int | None = None,
+    reshuffles: int | None = None,
+    seed: int = 0,
+) -> str:
+    """
+    Generate a synthetic game log as a single string
+
+    Args:
+        turns: Number of turns to play
+        events_per_turn: Approximate number of event plays per turn
+        reshuffles: Maximum number of reshuffles
+        seed: Random seed
+
+    Returns:
+        str: The full log text
+    """
+    return "".join(f"{line}\n" for line in iter_log_lines(turns, events_per_turn, reshuffles, seed))
+
+
+def write_log(
+    path: str,
+    turns: int = 10,
+    events_per_turn: int | None = None,
+    reshuffles: int | None = None,
+    seed: int = 0,
+) -> str:
+    """
+    Write a synthetic game log to disk
+
+    Args:
+        path: Destination file path
+        turns: Number of turns to play
+        events_per_turn: Approximate number of event plays per turn
+        reshuffles: Maximum number of reshuffles
+        seed: Random seed
+
+    Returns:
+        str: The path that was written
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(generate_log(turns, events_per_turn, reshuffles, seed))
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic Twilight Struggle log")
+    parser.add_argument("output", help="Path of the log file to write")
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--events-per-turn", type=int, default=None)
+    parser.add_argument("--reshuffles", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    write_log(
+        args.output,
+        turns=args.turns,
+        events_per_turn=args.events_per_turn,
+        reshuffles=args.reshuffles,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
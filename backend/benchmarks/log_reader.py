@@ -0,0 +1,86 @@
+"""
+Compare scanning a large log through LogReader against a whole-file read
+
+Usage:
+    python -m benchmarks.log_reader --size-mb 20
+"""
+
+import argparse
+import os
+import re
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from src.utils.log_reader import LogReader
+
+from .log_generator import generate_log
+
+TURN_LINE = re.compile(r"Turn (\d+)\b")
+
+
+def write_marathon_log(path: str, size_mb: float) -> int:
+    """Write back-to-back synthetic games until the file reaches ``size_mb``"""
+    target = int(size_mb * 1024 * 1024)
+    written = 0
+    seed = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < target:
+            chunk = generate_log(turns=10, seed=seed)
+            f.write(chunk)
+            written += len(chunk)
+            seed += 1
+    return os.path.getsize(path)
+
+
+def scan_whole_file(path: str) -> dict[int, int]:
+    """Baseline: read the whole file into Python strings and split it"""
+    with open(path, encoding="utf-8", errors="replace") as f:
+        lines = f.read().splitlines()
+    boundaries: dict[int, int] = {}
+    for index, line in enumerate(lines):
+        match = TURN_LINE.match(line)
+        if match:
+            boundaries.setdefault(int(match.group(1)), index)
+    return boundaries
+
+
+def scan_log_reader(path: str) -> dict[int, int]:
+    """Scan the same file through the memory-mapped reader"""
+    with LogReader(path) as reader:
+        return reader.turn_boundaries()
+
+
+def profile(func: Callable[[str], dict[int, int]], path: str) -> dict[str, Any]:
+    """Measure wall time and peak traced Python allocations of one scan"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = func(path)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": elapsed, "peak_mb": peak / (1024 * 1024), "turns": len(result)}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the memory-mapped log reader")
+    parser.add_argument("--size-mb", type=float, default=20.0, help="Size of the test log")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "marathon.txt")
+        size = write_marathon_log(path, args.size_mb)
+        print(f"Log size: {size / (1024 * 1024):.1f} MB")
+        for name, func in (("whole-file read", scan_whole_file), ("LogReader", scan_log_reader)):
+            result = profile(func, path)
+            print(
+                f"{name:16} {result['seconds'] * 1000:9.1f} ms  "
+                f"peak {result['peak_mb']:8.2f} MB  turns {result['turns']}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
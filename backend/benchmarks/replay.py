@@ -0,0 +1,345 @@
+"""
+Replay a finished game log and measure how long each change takes to show up
+
+A writer thread re-writes the log line by line into a temporary log
+directory, like the game client does, while an observer polls the backend.
+Each state change is timed from the append that caused it to the first poll
+that returned it: "how long until the helper shows the card I just played".
+
+The states to expect are worked out first by feeding the same lines through
+a ``GameTracker`` one at a time, so only appends that change the status are
+timed and coalesced changes are still attributed to their own appends.
+
+Usage:
+    python -m benchmarks.replay --speed 20                 # synthetic 10-turn game, 20x speed
+    python -m benchmarks.replay --log game.txt --speed 1   # a real log, at about real speed
+    python -m benchmarks.replay --observer tracker         # GameTracker instead of HTTP polling
+    python -m benchmarks.replay --base-url http://127.0.0.1:8000 --log-dir ~/Documents/TS/logs
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.tracker import GameTracker
+
+from .environment import BenchmarkEnvironment
+from .harness import percentile
+from .log_generator import iter_log_lines
+
+# Name of the replayed log; the expected states are worked out under the same
+# name, since the status includes the log's filename
+LOG_NAME = "replay.txt"
+
+# A state observed by polling, as plain JSON data, or None if there was none
+Observer = Callable[[], Any]
+
+
+def _normalize(state: dict[str, Any]) -> Any:
+    """JSON round trip, so records and response bodies compare equal"""
+    return json.loads(json.dumps(state))
+
+
+def change_points(lines: list[str], directory: str) -> list[tuple[int, Any]]:
+    """
+    Find the appends that change the game status
+
+    The log parser only parses whole files, so every line re-parses the log
+    up to that line: the cost grows with the square of the log's length.
+    This is fine for a synthetic game or a single real log, but it is the
+    slow part of replaying a long tournament log.
+
+    Args:
+        lines: Log lines without trailing newlines
+        directory: Scratch directory for the partial log (not the replay's)
+
+    Returns:
+        list: ``(line index, status after that line)`` for every line that
+            changed the status, in order
+    """
+    path = os.path.join(directory, LOG_NAME)
+    points: list[tuple[int, Any]] = []
+    previous: Any = None
+    with open(path, "w") as log, GameTracker(path) as tracker:
+        for index, line in enumerate(lines):
+            log.write(line + "\n")
+            log.flush()
+            state = tracker.snapshot()
+            current = _normalize(state.to_dict()) if state is not None else None
+            if current is not None and current != previous:
+                points.append((index, current))
+            previous = current
+    return points
+
+
+class LogReplayer(threading.Thread):
+    """Appends a finished log to a log file on a fixed schedule, like a game client"""
+
+    def __init__(self, path: str, lines: list[str], line_delay: float) -> None:
+        super().__init__(name="log-replayer", daemon=True)
+        self.path = path
+        self.lines = lines
+        self.line_delay = line_delay
+        # perf_counter() just before each line was written, by line index; set
+        # first, so an observer can never see a line without its timestamp
+        self.written: list[float] = []
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        started = time.perf_counter()
+        with open(self.path, "a", encoding="utf-8") as f:
+            for index, line in enumerate(self.lines):
+                # Scheduled from the start, so slow writes don't stretch the replay
+                delay = started + index * self.line_delay - time.perf_counter()
+                if self._stop_event.wait(max(delay, 0.0)):
+                    return
+                self.written.append(time.perf_counter())
+                f.write(f"{line}\n")
+                f.flush()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+@dataclass
+class ReplayResult:
+    """Append-to-visible latencies of one replay"""
+
+    observer: str
+    lines: int
+    changes: int
+    polls: int
+    latencies_ms: list[float] = field(default_factory=list)
+
+    @property
+    def missed(self) -> int:
+        """Changes that were never observed before the replay timed out"""
+        return self.changes - len(self.latencies_ms)
+
+    def summary(self) -> dict[str, Any]:
+        latencies = sorted(self.latencies_ms)
+        result: dict[str, Any] = {
+            "observer": self.observer,
+            "lines": self.lines,
+            "changes": self.changes,
+            "observed": len(latencies),
+            "missed": self.missed,
+            "polls": self.polls,
+        }
+        if latencies:
+            result["median_ms"] = statistics.median(latencies)
+            result["p95_ms"] = percentile(latencies, 95)
+            result["max_ms"] = latencies[-1]
+        return result
+
+
+def replay(
+    lines: list[str],
+    observer: Observer,
+    log_path: str,
+    expected: list[tuple[int, Any]],
+    line_delay: float,
+    interval: float,
+    name: str = "",
+    timeout: float = 10.0,
+) -> ReplayResult:
+    """
+    Replay ``lines`` into ``log_path`` while polling ``observer``
+
+    Args:
+        lines: Log lines without trailing newlines
+        observer: Returns the backend's current state on every poll
+        log_path: Log the lines are appended to
+        expected: Change points from ``change_points``
+        line_delay: Seconds between appends
+        interval: Seconds between polls
+        name: Observer name for the result
+        timeout: Seconds to keep polling after the last append
+
+    Returns:
+        ReplayResult: Latency of every observed change
+    """
+    result = ReplayResult(observer=name, lines=len(lines), changes=len(expected), polls=0)
+    writer = LogReplayer(log_path, lines, line_delay)
+    seen = 0  # Change points observed so far
+    deadline: float | None = None
+    writer.start()
+    try:
+        while seen < len(expected):
+            state = observer()
+            observed_at = time.perf_counter()
+            written = len(writer.written)
+            result.polls += 1
+            if state is not None:
+                match = _match(expected, seen, written, _normalize(state))
+                if match is not None:
+                    for index, _ in expected[seen : match + 1]:
+                        result.latencies_ms.append((observed_at - writer.written[index]) * 1000)
+                    seen = match + 1
+            if not writer.is_alive():
+                deadline = deadline or observed_at + timeout
+                if observed_at > deadline:
+                    break
+            time.sleep(interval)
+    finally:
+        writer.stop()
+        writer.join()
+    return result
+
+
+def _match(expected: list[tuple[int, Any]], start: int, written: int, state: Any) -> int | None:
+    """
+    Index of the change point at or after ``start`` whose state was observed
+
+    Only lines already written count, so e.g. the empty log matching the
+    state after its header line is not mistaken for that line showing up.
+    """
+    for position in range(start, len(expected)):
+        index, expected_state = expected[position]
+        if index >= written:
+            break
+        if expected_state == state:
+            return position
+    return None
+
+
+def http_observer(env: BenchmarkEnvironment) -> Observer:
+    """Poll GET /api/current-status through the Flask test client"""
+    from src.app import create_app
+
+    app = create_app(config_manager=env.config_manager)
+    app.testing = True
+    client = app.test_client()
+
+    def observe() -> Any:
+        response = client.get("/api/current-status")
+        return response.get_json() if response.status_code == 200 else None
+
+    return observe
+
+
+def live_observer(base_url: str, timeout: float = 10.0) -> Observer:
+    """Poll GET /api/current-status of a running backend"""
+    url = base_url.rstrip("/") + "/api/current-status"
+
+    def observe() -> Any:
+        try:
+            with urllib.request.urlopen(url, timeout=timeout) as r:
+                return json.loads(r.read())
+        except urllib.error.HTTPError:
+            return None
+
+    return observe
+
+
+def tracker_observer(tracker: GameTracker) -> Observer:
+    """Poll an embedded GameTracker"""
+
+    def observe() -> Any:
+        try:
+            state = tracker.snapshot()
+        except Exception:
+            # e.g. a line caught half-written; the next poll retries
+            return None
+        return state.to_dict() if state is not None else None
+
+    return observe
+
+
+def _read_lines(path: str | None, turns: int, seed: int) -> list[str]:
+    if path is None:
+        return list(iter_log_lines(turns=turns, seed=seed))
+    with open(path, encoding="utf-8", errors="replace") as f:
+        return f.read().splitlines()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay a log and measure append-to-visible latency"
+    )
+    parser.add_argument("--log", help="Finished log to replay (default: a synthetic game)")
+    parser.add_argument("--turns", type=int, default=10, help="Turns of the synthetic game")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic game")
+    parser.add_argument(
+        "--line-delay", type=float, default=2.0, help="Seconds between lines at 1x (default 2)"
+    )
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed multiplier")
+    parser.add_argument(
+        "--interval", type=float, default=1.0, help="Seconds between polls (default 1)"
+    )
+    parser.add_argument(
+        "--observer",
+        choices=("http", "tracker"),
+        default="http",
+        help="Poll /api/current-status (default) or an embedded GameTracker",
+    )
+    parser.add_argument(
+        "--base-url",
+        help="Poll a running backend instead of an in-process app; needs --log-dir",
+    )
+    parser.add_argument("--log-dir", help="Log directory the running backend watches")
+    parser.add_argument("--output", help="Write the summary and all latencies as JSON")
+    args = parser.parse_args(argv)
+    if args.base_url and not args.log_dir:
+        parser.error("--base-url needs --log-dir")
+
+    lines = _read_lines(args.log, args.turns, args.seed)
+    scratch = tempfile.mkdtemp(prefix="twilight-replay-")
+    try:
+        expected = change_points(lines, scratch)
+        line_delay = args.line_delay / args.speed
+        print(
+            f"Replaying {len(lines)} lines ({len(expected)} status changes) "
+            f"every {line_delay * 1000:.0f} ms, polling every {args.interval * 1000:.0f} ms"
+        )
+        with BenchmarkEnvironment(turns=(), filler_logs=0) as env:
+            log_path = os.path.join(args.log_dir or env.log_directory, LOG_NAME)
+            open(log_path, "w").close()
+            tracker: GameTracker | None = None
+            if args.base_url:
+                observer = live_observer(args.base_url)
+            elif args.observer == "http":
+                env.use_log(log_path)
+                observer = http_observer(env)
+            else:
+                tracker = GameTracker(log_path)
+                observer = tracker_observer(tracker)
+            name = "live" if args.base_url else args.observer
+            try:
+                result = replay(
+                    lines,
+                    observer,
+                    log_path,
+                    expected,
+                    line_delay=line_delay,
+                    interval=args.interval,
+                    name=name,
+                )
+            finally:
+                if tracker is not None:
+                    tracker.close()
+                if args.log_dir:
+                    os.remove(log_path)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    summary = result.summary()
+    print(json.dumps(summary, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({**summary, "latencies_ms": result.latencies_ms}, f, indent=2)
+    return 0 if not result.missed else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+"""
+Run the backend benchmark suite and compare against the stored baseline
+
+Usage:
+    python -m benchmarks.run                    # run and compare with baseline.json
+    python -m benchmarks.run --save-baseline    # run and store a new baseline
+"""
+
+import argparse
+import os
+import sys
+from collections.abc import Callable
+
+from .environment import BenchmarkEnvironment, synthetic_game
+from .harness import BenchmarkResult, compare_to_baseline, load_results, measure, save_results
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, "results.json")
+
+
+def run_end_to_end(env: BenchmarkEnvironment, repeat: int) -> list[BenchmarkResult]:
+    """
+    Benchmark GET /api/current-status through the Flask test client
+
+    ``current_status_*`` times a cold request: every run gets a new game state
+    cache with an empty snapshot store, so the log is read and parsed each
+    time. ``current_status_cached_*`` times the same request served from a
+    warm cache.
+    """
+    from src.app import create_app
+    from src.utils.game_state import GameStateCache
+    from src.utils.snapshot_store import SnapshotStore
+
+    app = create_app(config_manager=env.config_manager)
+    app.testing = True
+    client = app.test_client()
+    store = SnapshotStore(os.path.join(env.root, "snapshots"))
+
+    def fresh_cache() -> None:
+        store.clear()
+        app.config["GAME_STATE_CACHE"] = GameStateCache(store=store)
+
+    def request() -> None:
+        response = client.get("/api/current-status")
+        if response.status_code != 200:
+            raise RuntimeError(f"current-status returned {response.status_code}")
+
+    results = []
+    for turns, path in sorted(env.logs.items()):
+        env.use_log(path)
+        results.append(
+            measure(f"current_status_{turns}_turns", request, repeat=repeat, setup=fresh_cache)
+        )
+        results.append(measure(f"current_status_cached_{turns}_turns", request, repeat=repeat))
+    env.use_log(None)
+    return results
+
+
+def run_micro(env: BenchmarkEnvironment, repeat: int) -> list[BenchmarkResult]:
+    """Benchmark the individual stages of the status pipeline"""
+    from src.models.game_data import GameDataFormatter
+    from src.utils.log_utils import get_latest_log_file
+
+    game = synthetic_game()
+    benchmarks: dict[str, Callable[[], object]] = {
+        "format_play_data": lambda: GameDataFormatter.format_play_data(game.current_play, game),
+        "load_config": env.config_manager.load_config,
+        "get_latest_log_file": get_latest_log_file,
+    }
+    return [measure(name, func, repeat=repeat * 5) for name, func in benchmarks.items()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the backend benchmark suite")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Where to write results")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative slowdown of a median before failing (default 0.25)",
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per benchmark")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Store these results as the new baseline"
+    )
+    args = parser.parse_args(argv)
+
+    with BenchmarkEnvironment() as env:
+        results = run_micro(env, args.repeat) + run_end_to_end(env, args.repeat)
+
+    for result in results:
+        print(
+            f"{result.name:32} median {result.median_ms:9.3f} ms  "
+            f"min {result.min_ms:9.3f} ms  max {result.max_ms:9.3f} ms"
+        )
+    save_results(args.output, results)
+
+    if args.save_baseline:
+        save_results(args.baseline, results)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    regressions = compare_to_baseline(results, load_results(args.baseline), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""
+Compare MessagePack and JSON encoding of a full game status
+
+Usage:
+    python -m benchmarks.serialization --repeat 200
+"""
+
+import argparse
+from functools import partial
+
+from flask import Flask, jsonify
+
+from src.models.game_data import GameDataFormatter, GameStatus
+from src.utils import msgpack_codec
+from src.utils.response_format import dumps_json
+
+from .environment import synthetic_game
+from .harness import measure
+
+
+def build_status() -> GameStatus:
+    """Format the ~110-card synthetic game the way /api/current-status does"""
+    game = synthetic_game()
+    return GameDataFormatter.format_play_data(game.current_play, game)
+
+
+def encode_json(app: Flask, status: GameStatus) -> bytes:
+    """The current path: model_dump() followed by jsonify()"""
+    with app.app_context():
+        return bytes(jsonify(status.model_dump()).get_data())
+
+
+def encode_fast_json(status: GameStatus) -> bytes:
+    """model_dump() followed by the response cache's JSON encoder (orjson if installed)"""
+    return dumps_json(status.model_dump())
+
+
+def encode_msgpack(status: GameStatus) -> bytes:
+    """model_dump() followed by MessagePack encoding"""
+    return msgpack_codec.packb(status.model_dump())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark response serialization formats")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed encodes per format")
+    args = parser.parse_args(argv)
+
+    app = Flask(__name__)
+    status = build_status()
+    card_count = sum(
+        len(cards)
+        for cards in (status.deck, status.discarded, status.removed, status.cards_in_hands)
+    )
+    print(f"Payload: {card_count} cards, MessagePack backend: {msgpack_codec.BACKEND}")
+
+    encoders = {
+        "json": partial(encode_json, app, status),
+        "fastjson": partial(encode_fast_json, status),
+        "msgpack": partial(encode_msgpack, status),
+    }
+    for name, encode in encoders.items():
+        size = len(encode())
+        result = measure(f"encode_{name}", encode, args.repeat, 5)
+        print(f"{name:8} {size:7d} bytes  median {result.median_ms * 1000:8.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,133 @@
+"""
+Simulate a long polling session and compare the pydantic and record-based status pipelines
+
+A client polls the status once per ``--hz`` for ``--hours`` hours while the
+game changes every ``--change-every`` polls. Each poll of an unchanged
+state reuses the cached body; each change builds the state and encodes it.
+Memory is measured for ``--retained`` cached states, the game state cache's
+default size.
+
+Usage:
+    python -m benchmarks.session --hours 8 --hz 1
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+from src.models.game_data import PLAY_SECTIONS, Card, GameDataFormatter, GameStatus
+from src.utils.response_format import dumps_json
+
+from .environment import synthetic_game
+
+
+def game_at(game: Any, version: int) -> Any:
+    """The synthetic game after ``version`` changes: one card moves from the deck per change"""
+    names = list(game.CARDS)
+    shift = version % len(names)
+    rotated = names[shift:] + names[:shift]
+    play = SimpleNamespace(
+        turn=1 + version // 40,
+        possible_draw_cards=rotated[:60],
+        discarded_cards=rotated[60:90],
+        removed_cards=rotated[90:100],
+        cards_in_hands=rotated[100:],
+    )
+    return SimpleNamespace(CARDS=game.CARDS, current_play=play)
+
+
+def build_pydantic(game: Any) -> GameStatus:
+    """The previous pipeline: validated pydantic models for every card"""
+    play = game.current_play
+    cards: dict[str, Any] = {
+        section: [
+            Card(name=c.name, side=c.side, ops=c.ops)
+            for c in (game.CARDS[name] for name in getattr(play, attr))
+        ]
+        for section, attr in PLAY_SECTIONS.items()
+    }
+    return GameStatus(status="ok", turn=play.turn, **cards)
+
+
+def build_record(game: Any) -> Any:
+    """The current pipeline: interned card records in an immutable status record"""
+    return GameDataFormatter.play_record(game.current_play, game)
+
+
+PIPELINES: dict[str, tuple[Callable[[Any], Any], Callable[[Any], bytes]]] = {
+    "pydantic": (build_pydantic, lambda status: dumps_json(status.model_dump())),
+    "record": (build_record, lambda record: dumps_json(record.to_dict())),
+}
+
+
+def run_session(name: str, polls: int, change_every: int, game: Any) -> dict[str, float]:
+    """Poll through a whole session and time it"""
+    build, encode = PIPELINES[name]
+    body = b""
+    version = -1
+    build_time = 0.0
+    started = time.perf_counter()
+    for poll in range(polls):
+        current = poll // change_every
+        if current != version:
+            version = current
+            changed = time.perf_counter()
+            body = encode(build(game_at(game, version)))
+            build_time += time.perf_counter() - changed
+        if not body:
+            raise RuntimeError("empty body")
+    elapsed = time.perf_counter() - started
+    return {
+        "seconds": elapsed,
+        "polls_per_second": polls / elapsed,
+        "changes": version + 1,
+        "ms_per_change": build_time / (version + 1) * 1000,
+    }
+
+
+def retained_bytes(name: str, retained: int, game: Any) -> tuple[int, int]:
+    """Memory held by ``retained`` cached states, and the peak while building them"""
+    build, _ = PIPELINES[name]
+    gc.collect()
+    tracemalloc.start()
+    try:
+        states = [build(game_at(game, version)) for version in range(retained)]
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del states
+    return current, peak
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark a long polling session")
+    parser.add_argument("--hours", type=float, default=8.0, help="Session length")
+    parser.add_argument("--hz", type=float, default=1.0, help="Polls per second")
+    parser.add_argument(
+        "--change-every", type=int, default=15, help="Polls between game state changes"
+    )
+    parser.add_argument("--retained", type=int, default=32, help="Cached states to measure")
+    args = parser.parse_args(argv)
+
+    game = synthetic_game()
+    polls = int(args.hours * 3600 * args.hz)
+    print(f"Session: {polls} polls, a change every {args.change_every} polls")
+    for name in PIPELINES:
+        # Warm up pydantic's validators and the card catalog
+        PIPELINES[name][1](PIPELINES[name][0](game))
+        result = run_session(name, polls, args.change_every, game)
+        current, peak = retained_bytes(name, args.retained, game)
+        print(
+            f"{name:8} {result['seconds']:7.2f} s  {result['polls_per_second']:10.0f} polls/s  "
+            f"{result['ms_per_change']:6.3f} ms/change  "
+            f"{args.retained} states: {current / 1024:8.1f} KiB (peak {peak / 1024:8.1f} KiB)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,22 +1,32 @@
 #!/usr/bin/env python3
 """
 Main entry point for Twilight Helper Backend
+
+Every launcher (Electron, the Procfile, dev.sh/dev.bat and the packaged
+builds) starts this file:
+
+    python main.py                 # port 8000, as the frontend expects
+    python main.py --debug         # with Flask's debugger and auto-reloader
 """
 
+import argparse
 import os
 import sys
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
-import signal
-
-from src.app import app, signal_handler
+from src.app import DEFAULT_PORT, app, serve
 
 if __name__ == "__main__":
-    # Set up signal handlers for graceful shutdown (important for Windows/Electron)
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    parser = argparse.ArgumentParser(description="Twilight Helper Backend")
+    parser.add_argument("--host", default="0.0.0.0", help="Interface to bind (default 0.0.0.0)")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default {DEFAULT_PORT})"
+    )
+    parser.add_argument(
+        "--debug", action="store_true", help="Run Flask's debugger and auto-reloader"
+    )
+    args = parser.parse_args()
 
-    # Simple Flask startup with auto-reloader
-    app.run(host="0.0.0.0", port=5001, debug=True)
+    serve(app, host=args.host, port=args.port, debug=args.debug)
@@ -34,7 +34,7 @@ def get_config(*args: Any, **kwargs: Any) -> Response | tuple[Response, int]:
         config: ConfigModel = config_manager.load_config()
         return jsonify({"success": True, "config": config.model_dump()})
     except Exception as e:
-        logger.error(f"Error getting config: {e}")
+        logger.error("Error getting config: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -60,7 +60,7 @@ def update_config(*args: Any, **kwargs: Any) -> Response | tuple[Response, int]:
         return jsonify({"success": True, "config": config.model_dump()})
 
     except Exception as e:
-        logger.error(f"Error updating config: {e}")
+        logger.error("Error updating config: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
 
 
@@ -73,5 +73,5 @@ def reset_config(*args: Any, **kwargs: Any) -> Response | tuple[Response, int]:
         return jsonify({"success": True, "config": config.model_dump()})
 
     except Exception as e:
-        logger.error(f"Error resetting config: {e}")
+        logger.error("Error resetting config: %s", e)
         return jsonify({"success": False, "error": str(e)}), 500
@@ -0,0 +1,122 @@
+"""
+Diagnostics API routes for Twilight Helper Backend
+"""
+
+import ipaddress
+import logging
+from typing import Any
+
+from flask import Blueprint, Response, current_app, jsonify, request
+
+from ..models.game_data import card_catalog_size
+from ..utils.game_state import GameStateCache
+from ..utils.memory_diagnostics import MemoryDiagnostics
+from ..utils.sampling_profiler import SamplingProfiler
+
+logger = logging.getLogger(__name__)
+
+# Create blueprint for debug routes
+debug_bp = Blueprint("debug", __name__, url_prefix="/api/debug")
+
+
+def _is_local(address: str | None) -> bool:
+    """Whether a request came from this machine"""
+    try:
+        ip = ipaddress.ip_address(address or "")
+    except ValueError:
+        return False
+    if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped is not None:
+        ip = ip.ipv4_mapped
+    return ip.is_loopback
+
+
+@debug_bp.before_request
+def require_local_client() -> tuple[Response, int] | None:
+    """
+    Refuse diagnostics to other machines
+
+    The server listens on every interface, and these endpoints expose
+    internals and can start tracemalloc.
+    """
+    if not _is_local(request.remote_addr):
+        logger.warning("Refused %s from %s", request.path, request.remote_addr)
+        return jsonify({"error": "Debug endpoints are only available from localhost"}), 403
+    return None
+
+
+@debug_bp.route("/flamegraph", methods=["GET"])
+def get_flamegraph(*args: Any, **kwargs: Any) -> Response | tuple[Response, int]:
+    """Export sampled stacks in collapsed-stack format"""
+    try:
+        profiler: SamplingProfiler = current_app.config["SAMPLING_PROFILER"]
+        body = profiler.collapsed()
+        stats = profiler.stats()
+        if request.args.get("reset") == "1":
+            profiler.reset()
+
+        response = Response(body, mimetype="text/plain")
+        response.headers["X-Profiler-Samples"] = str(stats["samples"])
+        response.headers["X-Profiler-Overhead"] = f"{stats['overhead']:.6f}"
+        return response
+    except Exception as e:
+        logger.error("Error exporting flamegraph: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+
+@debug_bp.route("/profiler", methods=["GET"])
+def get_profiler_stats(*args: Any, **kwargs: Any) -> Response | tuple[Response, int]:
+    """Get sampling profiler statistics"""
+    try:
+        profiler: SamplingProfiler = current_app.config["SAMPLING_PROFILER"]
+        return jsonify(profiler.stats())
+    except Exception as e:
+        logger.error("Error getting profiler stats: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+
+def _cache_stats() -> dict[str, Any]:
+    """Sizes and counters of every long-lived cache of the app"""
+    cache: GameStateCache = current_app.config["GAME_STATE_CACHE"]
+    stats: dict[str, Any] = {
+        "game_states": cache.stats(),
+        "poll_advisor": current_app.config["POLL_ADVISOR"].stats(),
+        "compressed_responses": current_app.config["RESPONSE_COMPRESSOR"].stats(),
+        "log_indexes": current_app.config["LOG_INDEX_CACHE"].stats(),
+        "card_catalog": {"records": card_catalog_size()},
+        "config_listeners": current_app.config["CONFIG_MANAGER"].listener_count,
+    }
+    if cache.store is not None:
+        stats["snapshots"] = cache.store.stats()
+    return stats
+
+
+@debug_bp.route("/memory", methods=["GET"])
+def get_memory(*args: Any, **kwargs: Any) -> Response | tuple[Response, int]:
+    """
+    Report RSS, cache sizes and, while tracing, the top allocation sites
+
+    ``?trace=1`` starts tracemalloc and ``?trace=0`` stops it; each report
+    while tracing also lists what changed since the previous report.
+    ``?top=N`` sets the number of allocation sites listed.
+    """
+    try:
+        try:
+            top = int(request.args["top"]) if "top" in request.args else None
+        except ValueError:
+            return jsonify({"error": "top must be an integer"}), 400
+        if top is not None and top < 0:
+            return jsonify({"error": "top must not be negative"}), 400
+
+        diagnostics: MemoryDiagnostics = current_app.config["MEMORY_DIAGNOSTICS"]
+        trace = request.args.get("trace")
+        if trace == "1":
+            diagnostics.start()
+        elif trace == "0":
+            diagnostics.stop()
+
+        report = diagnostics.report(top)
+        report["caches"] = _cache_stats()
+        return jsonify(report)
+    except Exception as e:
+        logger.error("Error building memory report: %s", e)
+        return jsonify({"error": str(e)}), 500
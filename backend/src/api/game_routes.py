@@ -7,11 +7,15 @@ import os
 from typing import Any
 
 from flask import Blueprint, Response, current_app, jsonify, request
-from twilight_log_parser import log_parser
 from werkzeug.exceptions import BadRequest, UnsupportedMediaType
 
 from ..models.game_data import ConfigModel, GameDataFormatter
+from ..utils.card_views import CardView
+from ..utils.game_state import GameStateCache, QuarantinedLogError
 from ..utils.log_utils import get_latest_log_file
+from ..utils.poll_hints import PollAdvisor, apply_poll_hint
+from ..utils.response_format import entry_response
+from ..utils.server_timing import ServerTiming, timed
 
 logger = logging.getLogger(__name__)
 
@@ -68,10 +72,27 @@ def test_endpoint(*args: Any, **kwargs: Any) -> Response | tuple[Response, int]:
 def get_current_status(*args: Any, **kwargs: Any) -> Response | tuple[Response, int]:
     """Get current game status from log file"""
     logger.debug("Received request for current status")
+    try:
+        view = CardView.from_args(request.args)
+    except ValueError as e:
+        return jsonify(GameDataFormatter.create_error_response(str(e)).model_dump()), 400
+
+    # Per-stage timings for browser devtools (see utils/server_timing.py)
+    timing = ServerTiming()
+    with timing.activate():
+        result = _current_status(view)
+    if isinstance(result, tuple):
+        return timing.apply(result[0]), result[1]
+    return timing.apply(result)
+
+
+def _current_status(view: CardView) -> Response | tuple[Response, int]:
     try:
         config_manager = current_app.config["CONFIG_MANAGER"]
-        config: ConfigModel = config_manager.load_config()
-        filepath = get_latest_log_file()
+        with timed("config"):
+            config: ConfigModel = config_manager.load_config()
+        with timed("discover"):
+            filepath = get_latest_log_file()
         if config.log_file_path and not filepath:
             configured_filename = os.path.basename(config.log_file_path)
             error_response = GameDataFormatter.create_error_response(
@@ -84,17 +105,16 @@ def get_current_status(*args: Any, **kwargs: Any) -> Response | tuple[Response,
                 "No log files found in Twilight Struggle directory"
             )
             return jsonify(error_response.model_dump()), 404
-        filename = os.path.basename(filepath)
-        parser = log_parser.LogParser()
-        game = parser.parse_game_log(filepath)
-        if not game:
-            no_data_response = GameDataFormatter.create_no_game_data_response(filename)
-            return jsonify(no_data_response.model_dump())
-        play_data = GameDataFormatter.format_play_data(game.current_play, game)
-        play_data.filename = filename
-        return jsonify(play_data.model_dump())
+        cache: GameStateCache = current_app.config["GAME_STATE_CACHE"]
+        entry = cache.get_entry(filepath)
+        advisor: PollAdvisor = current_app.config["POLL_ADVISOR"]
+        return apply_poll_hint(entry_response(entry, view), advisor, entry)
     except Exception as e:
-        logger.error(f"Error in get_current_status: {str(e)}", exc_info=True)
+        if isinstance(e, QuarantinedLogError):
+            # Already reported with a traceback when the log first failed to parse
+            logger.warning("Error in get_current_status: %s", e)
+        else:
+            logger.error("Error in get_current_status: %s", e, exc_info=True)
         error_response = GameDataFormatter.create_error_response(str(e))
         return jsonify(error_response.model_dump()), 500
 
@@ -110,3 +130,9 @@ def shutdown(*args: Any, **kwargs: Any) -> Response | tuple[Response, int]:
         return jsonify({"status": "shutting down"})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+
+
+@game_bp.route("/status", methods=["GET"])
+def status(*args: Any, **kwargs: Any) -> Response:
+    """Health check the frontend polls until the backend is up"""
+    return jsonify({"status": "ok"})
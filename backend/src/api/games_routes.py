@@ -0,0 +1,171 @@
+"""
+Multi-game tracking API routes for Twilight Helper Backend
+"""
+
+import logging
+import os
+import time
+from typing import Any
+
+from flask import Blueprint, Response, current_app, jsonify, request
+
+from ..models.game_data import ConfigModel, GameDataFormatter
+from ..utils.card_views import CardView
+from ..utils.game_state import GameStateCache, QuarantinedLogError
+from ..utils.log_archive import archive_info, is_archive, is_log_file, scan_log_page
+from ..utils.log_reader import LogIndexCache
+from ..utils.log_utils import list_log_files
+from ..utils.poll_hints import PollAdvisor, apply_poll_hint
+from ..utils.response_format import entry_response, payload_response
+
+logger = logging.getLogger(__name__)
+
+# Logs modified within this many seconds count as active games
+ACTIVE_WINDOW_SECONDS = 2 * 60 * 60
+
+# Maximum number of raw log lines returned per request
+MAX_LOG_LINES = 1000
+
+# Create blueprint for multi-game routes
+games_bp = Blueprint("games", __name__, url_prefix="/api/games")
+
+
+def _log_directory() -> str:
+    config_manager = current_app.config["CONFIG_MANAGER"]
+    config: ConfigModel = config_manager.load_config()
+    return config.log_directory or str(config_manager.get_default_log_directory())
+
+
+def _active_window() -> float:
+    try:
+        return float(request.args.get("window", ACTIVE_WINDOW_SECONDS))
+    except ValueError:
+        return ACTIVE_WINDOW_SECONDS
+
+
+@games_bp.route("", methods=["GET"])
+def list_games(*args: Any, **kwargs: Any) -> Response | tuple[Response, int]:
+    """List active game logs"""
+    try:
+        cache: GameStateCache = current_app.config["GAME_STATE_CACHE"]
+        log_dir = _log_directory()
+        entries = list_log_files(log_dir, modified_after=time.time() - _active_window())
+        games = [
+            {
+                "filename": entry.name,
+                "size": entry.stat().st_size,
+                "modified": entry.stat().st_mtime,
+                "tracked": entry.path in cache,
+                **archive_info(entry.name),
+            }
+            for entry in entries
+        ]
+        return jsonify({"log_directory": log_dir, "games": games})
+    except Exception as e:
+        logger.error("Error listing games: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+
+@games_bp.route("/dashboard", methods=["GET"])
+def get_dashboard(*args: Any, **kwargs: Any) -> Response | tuple[Response, int]:
+    """Get summaries of all active games in one response"""
+    try:
+        cache: GameStateCache = current_app.config["GAME_STATE_CACHE"]
+        entries = list_log_files(_log_directory(), modified_after=time.time() - _active_window())
+        summaries = []
+        for entry in entries:
+            modified = entry.stat().st_mtime
+            try:
+                # Counts only; the card lists are not looked up for a summary
+                summary = cache.get_entry(entry.path).snapshot.summary(entry.name, modified)
+            except Exception as e:
+                if isinstance(e, QuarantinedLogError):
+                    # Already reported with a traceback when the log first failed to parse
+                    logger.warning("Error parsing %s: %s", entry.name, e)
+                else:
+                    logger.error("Error parsing %s: %s", entry.name, e, exc_info=True)
+                error = GameDataFormatter.create_error_response(str(e), entry.name)
+                summary = GameDataFormatter.create_summary(error, entry.name, modified)
+            summaries.append(summary.model_dump())
+        return payload_response({"games": summaries})
+    except Exception as e:
+        logger.error("Error building dashboard: %s", e)
+        return jsonify({"error": str(e)}), 500
+
+
+def _resolve_log(filename: str) -> str | tuple[Response, int]:
+    """Resolve a log filename inside the log directory, or build an error response"""
+    if os.path.basename(filename) != filename or not is_log_file(filename):
+        error_response = GameDataFormatter.create_error_response("Invalid log filename")
+        return jsonify(error_response.model_dump()), 400
+    path = os.path.join(_log_directory(), filename)
+    if not os.path.isfile(path):
+        error_response = GameDataFormatter.create_error_response(
+            f"Log file not found: {filename}", filename
+        )
+        return jsonify(error_response.model_dump()), 404
+    return path
+
+
+@games_bp.route("/<filename>/status", methods=["GET"])
+def get_game_status(filename: str, *args: Any, **kwargs: Any) -> Response | tuple[Response, int]:
+    """Get the full status of one game log"""
+    try:
+        view = CardView.from_args(request.args)
+    except ValueError as e:
+        return jsonify(GameDataFormatter.create_error_response(str(e), filename).model_dump()), 400
+    try:
+        path = _resolve_log(filename)
+        if isinstance(path, tuple):
+            return path
+        cache: GameStateCache = current_app.config["GAME_STATE_CACHE"]
+        entry = cache.get_entry(path)
+        advisor: PollAdvisor = current_app.config["POLL_ADVISOR"]
+        return apply_poll_hint(entry_response(entry, view), advisor, entry)
+    except Exception as e:
+        if isinstance(e, QuarantinedLogError):
+            # Already reported with a traceback when the log first failed to parse
+            logger.warning("Error in get_game_status: %s", e)
+        else:
+            logger.error("Error in get_game_status: %s", e, exc_info=True)
+        error_response = GameDataFormatter.create_error_response(str(e), filename)
+        return jsonify(error_response.model_dump()), 500
+
+
+@games_bp.route("/<filename>/log", methods=["GET"])
+def get_game_log(filename: str, *args: Any, **kwargs: Any) -> Response | tuple[Response, int]:
+    """Get a page of raw log lines, starting at a line number or at a turn"""
+    try:
+        path = _resolve_log(filename)
+        if isinstance(path, tuple):
+            return path
+        try:
+            start = int(request.args.get("start", 0))
+            count = min(int(request.args.get("count", 100)), MAX_LOG_LINES)
+            turn = request.args.get("turn")
+            turn_number = int(turn) if turn is not None else None
+        except ValueError:
+            return jsonify({"error": "start, count and turn must be integers"}), 400
+        if start < 0 or count < 0:
+            return jsonify({"error": "start and count must not be negative"}), 400
+
+        if is_archive(path):
+            # Archives can't be memory-mapped; stream them once instead
+            page = scan_log_page(path, start, count, turn_number)
+        else:
+            indexes: LogIndexCache = current_app.config["LOG_INDEX_CACHE"]
+            with indexes.open(path) as (reader, turns):
+                if turn_number is not None:
+                    start = turns.get(turn_number, -1)
+                page = {
+                    "total_lines": len(reader),
+                    "start": start if start >= 0 else None,
+                    "lines": list(reader.lines(start, start + count)) if start >= 0 else [],
+                    "turns": turns,
+                }
+        if page["start"] is None:
+            return jsonify({"error": f"Turn {turn_number} not found"}), 404
+        return jsonify({"filename": filename, **page})
+    except Exception as e:
+        logger.error("Error in get_game_log: %s", e)
+        return jsonify({"error": str(e)}), 500
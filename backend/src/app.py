@@ -6,39 +6,48 @@ import logging
 import os
 import signal
 import sys
-from typing import Optional
 
 from flask import Flask
 from flask_cors import CORS
 
 # Import our modular components
 from .api.config_routes import config_bp
+from .api.debug_routes import debug_bp
 from .api.game_routes import game_bp
+from .api.games_routes import games_bp
 from .config.config_manager import ConfigManager
+from .config.config_watcher import ConfigWatcher
+from .utils.cache_warmer import start_cache_warmer
+from .utils.compression import ResponseCompressor
+from .utils.game_state import GameStateCache
+from .utils.log_reader import LogIndexCache
+from .utils.logging_config import LOG_FILE_NAME, configure_logging
+from .utils.memory_diagnostics import MemoryDiagnostics
+from .utils.poll_hints import POLL_AFTER_HEADER, PollAdvisor
+from .utils.sampling_profiler import SamplingProfiler, sampling_profiler
+from .utils.server_timing import SERVER_TIMING_HEADER
+from .utils.snapshot_store import SnapshotStore
 
 # Set up file logging only if DEBUG=1
 DEBUG = os.environ.get("DEBUG", "0") == "1"
 
+# The frontend and the Electron shell talk to the backend on this port
+DEFAULT_PORT = 8000
+
+# Logs go to a directory in the project root, which is only created when DEBUG=1
+logs_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "logs")
+configure_logging(DEBUG, logs_dir)
+logger = logging.getLogger(__name__)
+
 if DEBUG:
-    # Create logs directory in the project root if it doesn't exist
-    logs_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "logs")
-    os.makedirs(logs_dir, exist_ok=True)
-
-    log_file = os.path.join(logs_dir, "twilight-helper-backend.log")
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(levelname)s - %(message)s",
-        handlers=[logging.FileHandler(log_file), logging.StreamHandler(sys.stdout)],
-    )
-    logger = logging.getLogger(__name__)
-    logger.info(f"Logging to file: {log_file}")
+    logger.info("Logging to file: %s", os.path.join(logs_dir, LOG_FILE_NAME))
     logger.info("Flask application initialized")
-else:
-    logging.basicConfig(level=logging.CRITICAL)  # Effectively disables logging
-    logger = logging.getLogger(__name__)
 
 
-def create_app(config_manager: Optional[ConfigManager] = None) -> Flask:
+def create_app(
+    config_manager: ConfigManager | None = None,
+    profiler: SamplingProfiler | None = None,
+) -> Flask:
     """Create and configure the Flask application"""
     app = Flask(__name__)
 
@@ -50,6 +59,25 @@ def create_app(config_manager: Optional[ConfigManager] = None) -> Flask:
     else:
         app.config["CONFIG_MANAGER"] = config_manager
 
+    # Parsed state of every tracked log file, shared by the game endpoints and
+    # persisted under the app data directory so it survives restarts
+    snapshot_dir = os.path.join(app.config["CONFIG_MANAGER"].get_app_data_directory(), "snapshots")
+    app.config["GAME_STATE_CACHE"] = GameStateCache(store=SnapshotStore(snapshot_dir))
+    # Drops the states of logs a config change moves away from (held weakly)
+    app.config["CONFIG_MANAGER"].subscribe(app.config["GAME_STATE_CACHE"].on_config_change)
+
+    # Line indexes of logs paged through /api/games/<filename>/log
+    app.config["LOG_INDEX_CACHE"] = LogIndexCache()
+
+    # Recommends the next poll interval from how fast each log is growing
+    app.config["POLL_ADVISOR"] = PollAdvisor()
+
+    # Started with the other background services by the serving process only
+    app.config["SAMPLING_PROFILER"] = profiler if profiler is not None else sampling_profiler
+
+    # Memory reports for /api/debug/memory; tracemalloc only runs once asked for
+    app.config["MEMORY_DIAGNOSTICS"] = MemoryDiagnostics()
+
     # Configure CORS
     CORS(
         app,
@@ -59,33 +87,80 @@ def create_app(config_manager: Optional[ConfigManager] = None) -> Flask:
                 "origins": ["http://localhost:3000"],
                 "methods": ["GET", "POST", "OPTIONS", "PUT"],
                 "allow_headers": ["Content-Type"],
-                "expose_headers": ["Access-Control-Allow-Origin"],
+                "expose_headers": [
+                    "Access-Control-Allow-Origin",
+                    POLL_AFTER_HEADER,
+                    SERVER_TIMING_HEADER,
+                ],
                 "supports_credentials": True,
             }
         },
     )
 
+    # Compress large JSON bodies for clients that accept gzip or brotli
+    app.config["RESPONSE_COMPRESSOR"] = ResponseCompressor(app)
+
     # Register blueprints
     app.register_blueprint(config_bp)
     app.register_blueprint(game_bp)
+    app.register_blueprint(games_bp)
+    app.register_blueprint(debug_bp)
 
     return app
 
 
 def signal_handler(signum: int, frame: object) -> None:
     """Handle shutdown signals gracefully"""
-    logger.info(f"Received signal {signum} to shut down")
+    logger.info("Received signal %s to shut down", signum)
     print("Shutting down server...", flush=True)
     sys.exit(0)
 
 
-# Create the application instance
-app = create_app()
+def start_background_services(app: Flask) -> None:
+    """
+    Start the threads that keep an app's caches current
 
-if __name__ == "__main__":
+    Called once, by the process that serves requests: the cache warmer
+    parses the current log before the first request, the config watcher
+    publishes hand edits of config.json without waiting for one and the
+    sampling profiler collects stacks for /api/debug/flamegraph.
+
+    Args:
+        app: The app whose caches to keep current
+    """
+    start_cache_warmer(app)
+    ConfigWatcher(app.config["CONFIG_MANAGER"]).start()
+    app.config["SAMPLING_PROFILER"].start()
+
+
+def serve(app: Flask, host: str = "0.0.0.0", port: int = DEFAULT_PORT, debug: bool = False) -> None:
+    """
+    Run the server with its background services
+
+    Args:
+        app: The app to serve
+        host: Interface to bind
+        port: Port to listen on
+        debug: Run Flask's debugger and auto-reloader
+    """
     # Set up signal handlers for graceful shutdown (important for Windows/Electron)
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    # Simple Flask startup with auto-reloader
-    app.run(host="0.0.0.0", port=5001, debug=True)
+    # With the auto-reloader the parent process only watches the sources and
+    # its child (WERKZEUG_RUN_MAIN) serves requests; without it, this one does
+    if not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_background_services(app)
+    try:
+        app.run(host=host, port=port, debug=debug)
+    finally:
+        # Store the parsed states that haven't been idle long enough yet, so
+        # the next start doesn't have to parse them again
+        app.config["GAME_STATE_CACHE"].persist()
+
+
+# Create the application instance
+app = create_app()
+
+if __name__ == "__main__":
+    serve(app, debug=True)
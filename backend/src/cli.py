@@ -0,0 +1,114 @@
+"""
+Command line interface for Twilight Helper Backend
+
+Runs the tracking engine without the HTTP server:
+
+    python -m src.cli watch                    # follow the configured or latest log
+    python -m src.cli watch --log game.txt     # follow one log
+    python -m src.cli watch --ndjson | jq .    # one JSON object per state change
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from collections.abc import Callable
+from typing import Any, TextIO
+
+from .models.game_data import StatusRecord
+from .tracker import GameTracker, TrackedState
+from .utils.log_utils import get_latest_log_file
+
+
+def format_text(state: TrackedState) -> str:
+    """One human-readable line summarizing a state"""
+    record = state.record
+    if record.status != "ok":
+        detail = f": {record.error}" if record.error else ""
+        return f"{record.filename or state.path} v{state.version} {record.status}{detail}"
+    return (
+        f"{record.filename} v{state.version} turn {record.turn}: "
+        f"deck {len(record.deck)}, discarded {len(record.discarded)}, "
+        f"removed {len(record.removed)}, in hands {len(record.cards_in_hands)}"
+    )
+
+
+def format_ndjson(state: TrackedState) -> str:
+    """The full state as one line of JSON, with the log path, version and time"""
+    record: StatusRecord = state.record
+    line: dict[str, Any] = {"path": state.path, "version": state.version, "time": time.time()}
+    line.update(record.to_dict())
+    return json.dumps(line, ensure_ascii=False, separators=(",", ":"))
+
+
+def watch(
+    log_path: str | None = None,
+    interval: float = 1.0,
+    output: Callable[[TrackedState], str] = format_text,
+    out: TextIO | None = None,
+    count: int | None = None,
+    resolve: Callable[[], str | None] = get_latest_log_file,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """
+    Print every new state of a log as it grows
+
+    Args:
+        log_path: Log to follow; without it the configured or latest log is
+            re-resolved on every poll, so a new game is picked up
+        interval: Seconds between polls
+        output: Formats a state as one line
+        out: Stream the lines are written to (stdout by default)
+        count: Stop after this many states (None follows forever)
+        resolve: Finds the log to follow when ``log_path`` is not given
+        sleep: Waits between polls
+
+    Returns:
+        int: Exit status
+    """
+    out = out or sys.stdout
+    printed = 0
+    with GameTracker(log_path, interval=interval, resolve=resolve, sleep=sleep) as tracker:
+        for state in tracker.changes():
+            out.write(output(state) + "\n")
+            out.flush()
+            printed += 1
+            if count is not None and printed >= count:
+                break
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.cli", description=__doc__.split("\n")[1])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    watch_parser = subcommands.add_parser("watch", help="Print game state changes as a log grows")
+    watch_parser.add_argument("--log", help="Log file to follow (default: configured or latest)")
+    watch_parser.add_argument(
+        "--interval", type=float, default=1.0, help="Seconds between polls (default 1)"
+    )
+    watch_parser.add_argument(
+        "--ndjson", action="store_true", help="Print each state as one line of JSON"
+    )
+    watch_parser.add_argument("--count", type=int, help="Exit after this many states")
+    args = parser.parse_args(argv)
+
+    # Diagnostics go to stderr so stdout stays machine-readable
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr, format="%(message)s")
+    try:
+        return watch(
+            log_path=args.log,
+            interval=args.interval,
+            output=format_ndjson if args.ndjson else format_text,
+            count=args.count,
+        )
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        # e.g. piped into `head`
+        return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
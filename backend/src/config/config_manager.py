@@ -6,20 +6,70 @@ import json
 import logging
 import os
 import sys
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from ..models.game_data import ConfigModel
 
 logger = logging.getLogger(__name__)
 
+# A config file modified this recently may be rewritten again within the
+# filesystem's mtime resolution without its (inode, size, mtime) changing,
+# so its bytes are compared as well
+RACY_WINDOW_SECONDS = 2.0
+
+
+@dataclass(frozen=True)
+class ConfigChange:
+    """A change of the effective configuration"""
+
+    old: ConfigModel | None
+    new: ConfigModel
+    # "save", "update", "reset" or "external" (config.json edited on disk)
+    source: str
+
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        """Names of the ConfigModel fields whose value changed"""
+        new = self.new.model_dump()
+        if self.old is None:
+            return frozenset(new)
+        old = self.old.model_dump()
+        return frozenset(name for name in new if old.get(name) != new[name])
+
+
+ConfigListener = Callable[[ConfigChange], None]
+
+
+class _LoadedConfig(NamedTuple):
+    config_file: str
+    # (inode, size, mtime_ns) of the file, None if it did not exist
+    stat_key: tuple[int, int, int] | None
+    raw: bytes | None
+    config: ConfigModel
+
 
 class ConfigManager:
-    """Manages application configuration"""
+    """
+    Manages application configuration
+
+    The validated configuration is kept in memory and only re-read when a
+    ``stat`` of config.json shows the file changed. Every change, whether
+    made through this manager or by editing the file, is published to the
+    listeners registered with ``subscribe``.
+    """
 
     def __init__(self) -> None:
         self.config_file = self._get_config_file_path()
         self._ensure_config_directory()
+        self._loaded: _LoadedConfig | None = None
+        self._listeners: list[Callable[[], ConfigListener | None]] = []
+        self._lock = threading.RLock()
 
     def _get_config_file_path(self) -> str:
         """Get the configuration file path based on platform"""
@@ -47,6 +97,10 @@ class ConfigManager:
         config_dir = os.path.dirname(self.config_file)
         os.makedirs(config_dir, exist_ok=True)
 
+    def get_app_data_directory(self) -> str:
+        """Get the directory holding the configuration and other app data"""
+        return os.path.dirname(self.config_file)
+
     def get_default_log_directory(self) -> str:
         """Get the default log directory based on platform"""
         if sys.platform.startswith("win"):
@@ -68,41 +122,167 @@ class ConfigManager:
         # For macOS and Linux, use Desktop instead of Documents
         return str(Path(os.path.expanduser("~")) / "Desktop" / "Twilight Struggle")
 
-    def load_config(self) -> ConfigModel:
-        """Load configuration from file"""
-        default_config = ConfigModel(
-            log_file_path=None, log_directory=self.get_default_log_directory()
+    def subscribe(self, listener: ConfigListener) -> Callable[[], None]:
+        """
+        Register a listener called with a ConfigChange after every change
+
+        Bound methods are held weakly, so subscribing an object does not keep
+        it alive; plain functions are held strongly.
+
+        Args:
+            listener: Callable taking the ConfigChange
+
+        Returns:
+            Callable: Function that unsubscribes the listener
+        """
+        ref: Callable[[], ConfigListener | None]
+        if hasattr(listener, "__self__") and hasattr(listener, "__func__"):
+            ref = weakref.WeakMethod(listener)
+        else:
+            ref = lambda: listener  # noqa: E731
+        with self._lock:
+            self._listeners.append(ref)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if ref in self._listeners:
+                    self._listeners.remove(ref)
+
+        return unsubscribe
+
+    @property
+    def listener_count(self) -> int:
+        """Number of registered change listeners (dead weak references included)"""
+        with self._lock:
+            return len(self._listeners)
+
+    def _publish(self, change: ConfigChange | None) -> None:
+        if change is None or not change.changed_fields:
+            return
+        with self._lock:
+            listeners = [ref() for ref in self._listeners]
+            self._listeners = [
+                ref
+                for ref, listener in zip(self._listeners, listeners, strict=True)
+                if listener is not None
+            ]
+        logger.info(
+            "Configuration changed (%s): %s",
+            change.source,
+            ", ".join(sorted(change.changed_fields)),
         )
+        for listener in listeners:
+            if listener is None:
+                continue
+            try:
+                listener(change)
+            except Exception as e:
+                logger.error("Config listener %r failed: %s", listener, e, exc_info=True)
+
+    def _default_config(self) -> ConfigModel:
+        return ConfigModel(log_file_path=None, log_directory=self.get_default_log_directory())
+
+    def _stat_key(self) -> tuple[int, int, int] | None:
+        try:
+            stat = os.stat(self.config_file)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _read(self, stat_key: tuple[int, int, int] | None) -> _LoadedConfig | None:
+        """Read and validate config.json; None if it could not be read"""
+        default_config = self._default_config()
+        if stat_key is None:
+            return _LoadedConfig(self.config_file, None, None, default_config)
 
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file) as f:
-                    config = json.load(f)
-                    # Merge with defaults to ensure all keys exist
-                    data = {**default_config.model_dump(), **config}
-                    return ConfigModel(**data)
+            with open(self.config_file, "rb") as f:
+                raw = f.read()
         except Exception as e:
-            logger.error(f"Error loading config: {e}")
+            logger.error("Error loading config: %s", e)
+            return None
 
-        return default_config
+        loaded = self._loaded
+        if loaded is not None and loaded.config_file == self.config_file and loaded.raw == raw:
+            return loaded._replace(stat_key=stat_key)
 
-    def save_config(self, config: ConfigModel) -> bool:
-        """Save configuration to file"""
         try:
-            with open(self.config_file, "w") as f:
-                json.dump(config.model_dump(), f, indent=2)
-            return True
+            config = json.loads(raw)
+            # Merge with defaults to ensure all keys exist
+            data = {**default_config.model_dump(), **config}
+            return _LoadedConfig(self.config_file, stat_key, raw, ConfigModel(**data))
         except Exception as e:
-            logger.error(f"Error saving config: {e}")
-            return False
+            logger.error("Error loading config: %s", e)
+            return _LoadedConfig(self.config_file, stat_key, raw, default_config)
+
+    def _refresh(self) -> tuple[ConfigModel, ConfigChange | None]:
+        with self._lock:
+            loaded = self._loaded
+            stat_key = self._stat_key()
+            if (
+                loaded is not None
+                and loaded.config_file == self.config_file
+                and loaded.stat_key == stat_key
+                and (stat_key is None or time.time() - stat_key[2] / 1e9 > RACY_WINDOW_SECONDS)
+            ):
+                return loaded.config, None
+
+            current = self._read(stat_key)
+            if current is None:
+                return (loaded.config if loaded is not None else self._default_config()), None
+            self._loaded = current
+            if loaded is None or loaded.config_file != current.config_file:
+                return current.config, None
+            return current.config, ConfigChange(loaded.config, current.config, "external")
+
+    def load_config(self) -> ConfigModel:
+        """
+        Get the current configuration
+
+        Only a ``stat`` of the config file is needed while it is unchanged;
+        an edited file is re-read, validated and published as an
+        "external" change.
+        """
+        config, change = self._refresh()
+        self._publish(change)
+        return config
+
+    def check_for_changes(self) -> ConfigChange | None:
+        """
+        Re-read config.json if it changed on disk and publish the change
+
+        Returns:
+            ConfigChange: The published change, or None if nothing changed
+        """
+        _, change = self._refresh()
+        if change is not None and not change.changed_fields:
+            return None
+        self._publish(change)
+        return change
+
+    def _store(self, config: ConfigModel, source: str) -> bool:
+        with self._lock:
+            old = self._loaded.config if self._loaded is not None else None
+            try:
+                raw = json.dumps(config.model_dump(), indent=2).encode("utf-8")
+                with open(self.config_file, "wb") as f:
+                    f.write(raw)
+            except Exception as e:
+                logger.error("Error saving config: %s", e)
+                return False
+            self._loaded = _LoadedConfig(self.config_file, self._stat_key(), raw, config)
+        self._publish(ConfigChange(old, config, source))
+        return True
+
+    def save_config(self, config: ConfigModel) -> bool:
+        """Save configuration to file"""
+        return self._store(config, "save")
 
     def reset_config(self) -> ConfigModel:
         """Reset configuration to defaults"""
-        default_config = ConfigModel(
-            log_file_path=None, log_directory=self.get_default_log_directory()
-        )
+        default_config = self._default_config()
 
-        if self.save_config(default_config):
+        if self._store(default_config, "reset"):
             return default_config
         else:
             raise RuntimeError("Failed to save configuration")
@@ -120,7 +300,7 @@ class ConfigManager:
 
         new_config = ConfigModel(**data)
         # Save the updated config
-        if self.save_config(new_config):
+        if self._store(new_config, "update"):
             return new_config
         else:
             raise RuntimeError("Failed to save configuration")
@@ -0,0 +1,55 @@
+"""
+Background watcher for external edits of config.json
+"""
+
+import logging
+import threading
+
+from .config_manager import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigWatcher:
+    """
+    Polls config.json with a ``stat`` and publishes external edits.
+
+    Listeners of the ConfigManager hear about a hand-edited config file
+    within ``interval`` seconds, even when no request arrives to notice it.
+    """
+
+    def __init__(self, config_manager: ConfigManager, interval: float = 1.0) -> None:
+        self.config_manager = config_manager
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background watcher thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the background watcher thread (no-op if already running)"""
+        if self.is_running:
+            return
+        # Prime the manager so the first poll compares against the current file
+        self.config_manager.load_config()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="config-watcher", daemon=True)
+        self._thread.start()
+        logger.info("Watching %s for changes", self.config_manager.config_file)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the background watcher thread"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.config_manager.check_for_changes()
+            except Exception as e:
+                logger.error("Config watcher failed to check for changes: %s", e)
@@ -3,11 +3,16 @@ Game data models and formatting for Twilight Helper Backend
 """
 
 import logging
-from typing import Any
+from collections.abc import Collection, Mapping
+from typing import Any, NamedTuple
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from ..utils.logging_config import SampledDebugFilter
+
 logger = logging.getLogger(__name__)
+# Formatting logs one DEBUG line per card; only keep a sample of them
+logger.addFilter(SampledDebugFilter())
 
 
 class Card(BaseModel):
@@ -38,6 +43,24 @@ class GameStatus(BaseModel):
     your_hand: list[Card] = Field(default_factory=list, description="Your hand")
     opponent_hand: list[Card] = Field(default_factory=list, description="Opponent hand")
     error: str | None = Field(default=None, description="Error message if status is error")
+    stale: bool = Field(
+        default=False,
+        description="The log's latest contents failed to parse; this is its last good state",
+    )
+
+
+class GameSummary(BaseModel):
+    """Represents a compact summary of one tracked game"""
+
+    filename: str = Field(..., description="Log filename")
+    status: str = Field(..., description="Game status (ok, error, no game data)")
+    turn: int | None = Field(default=None, description="Current turn number")
+    deck_count: int = Field(default=0, description="Number of cards in deck")
+    discarded_count: int = Field(default=0, description="Number of discarded cards")
+    removed_count: int = Field(default=0, description="Number of removed cards")
+    cards_in_hands_count: int = Field(default=0, description="Number of cards in hands")
+    modified: float | None = Field(default=None, description="Log modification time (epoch)")
+    error: str | None = Field(default=None, description="Error message if status is error")
 
 
 class ConfigModel(BaseModel):
@@ -49,71 +72,259 @@ class ConfigModel(BaseModel):
     log_directory: str = Field(..., description="Directory containing log files")
 
 
+# Card list fields of GameStatus and the play attributes they are formatted from
+PLAY_SECTIONS = {
+    "deck": "possible_draw_cards",
+    "discarded": "discarded_cards",
+    "removed": "removed_cards",
+    "cards_in_hands": "cards_in_hands",
+}
+
+# Card list fields of GameStatus, in field order
+CARD_LIST_FIELDS = ("deck", "discarded", "removed", "cards_in_hands", "your_hand", "opponent_hand")
+
+
+class CardRecord(NamedTuple):
+    """
+    Internal, immutable form of a ``Card``
+
+    Records are interned (see ``intern_card``), so the card lists of every
+    cached state are tuples of references into one shared catalog.
+    """
+
+    name: str
+    side: str
+    ops: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """The card as ``Card.model_dump()`` would return it"""
+        return {"name": self.name, "side": self.side, "ops": self.ops}
+
+    def to_model(self) -> Card:
+        """Build the pydantic ``Card`` without re-validating our own data"""
+        return Card.model_construct(name=self.name, side=self.side, ops=self.ops)
+
+
+# Interned card records; bounded so unexpected card names can't grow it forever
+_CARD_CATALOG: dict[CardRecord, CardRecord] = {}
+MAX_CATALOG_SIZE = 4096
+
+
+def intern_card(name: str, side: str, ops: int) -> CardRecord:
+    """
+    Get the shared record of a card
+
+    Args:
+        name: Card name
+        side: Card side (US, USSR, Neutral or "" if unknown)
+        ops: Card operations value
+
+    Returns:
+        CardRecord: The one record instance for these values
+    """
+    record = CardRecord(name, side, ops)
+    interned = _CARD_CATALOG.get(record)
+    if interned is not None:
+        return interned
+    if len(_CARD_CATALOG) < MAX_CATALOG_SIZE:
+        _CARD_CATALOG[record] = record
+    return record
+
+
+def card_catalog_size() -> int:
+    """Number of interned card records"""
+    return len(_CARD_CATALOG)
+
+
+class StatusRecord(NamedTuple):
+    """
+    Internal, immutable form of a ``GameStatus``
+
+    The whole pipeline (parsing, caching, the snapshot store, views and
+    encoding) passes these around; pydantic models are only built at the
+    API boundary with ``to_model()``, and response bodies are encoded
+    straight from ``to_dict()``.
+    """
+
+    status: str
+    filename: str | None = None
+    turn: int | None = None
+    deck: tuple[CardRecord, ...] = ()
+    discarded: tuple[CardRecord, ...] = ()
+    removed: tuple[CardRecord, ...] = ()
+    cards_in_hands: tuple[CardRecord, ...] = ()
+    your_hand: tuple[CardRecord, ...] = ()
+    opponent_hand: tuple[CardRecord, ...] = ()
+    error: str | None = None
+    stale: bool = False
+
+    def to_dict(self, fields: Collection[str] | None = None) -> dict[str, Any]:
+        """
+        The status as ``GameStatus.model_dump()`` would return it
+
+        Args:
+            fields: Only include these fields (all of them by default)
+
+        Returns:
+            dict: Snake-case keys, cards as dicts
+        """
+        return {
+            name: [card.to_dict() for card in value] if name in CARD_LIST_FIELDS else value
+            for name, value in self._asdict().items()
+            if fields is None or name in fields
+        }
+
+    def to_model(self) -> GameStatus:
+        """Build the pydantic ``GameStatus`` without re-validating our own data"""
+        data: dict[str, Any] = self._asdict()
+        for name in CARD_LIST_FIELDS:
+            data[name] = [card.to_model() for card in data[name]]
+        return GameStatus.model_construct(**data)
+
+    @classmethod
+    def from_model(cls, status: GameStatus) -> "StatusRecord":
+        """Convert a pydantic ``GameStatus``"""
+        return cls.from_dict(status.model_dump())
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "StatusRecord":
+        """
+        Convert the output of ``to_dict()`` or ``GameStatus.model_dump()``
+
+        Raises:
+            KeyError, TypeError: If ``data`` is not shaped like a status
+        """
+        values = {name: data[name] for name in cls._fields if name in data}
+        for name in CARD_LIST_FIELDS:
+            values[name] = tuple(
+                intern_card(card["name"], card["side"], card["ops"])
+                for card in values.get(name, ())
+            )
+        return cls(**values)
+
+
 class GameDataFormatter:
     """Handles formatting of game data for API responses"""
 
     @staticmethod
-    def format_play_data(play: Any, game: Any) -> GameStatus:
+    def card_record(card_name: str, game: Any) -> CardRecord:
         """
-        Format play data to match frontend expectations
+        Look up one card in the game's card definitions
 
         Args:
-            play: The current play object from the game
+            card_name: Name of the card
             game: The game object containing card definitions
 
         Returns:
-            GameStatus: Formatted play data
+            CardRecord: The interned card (with empty side and 0 ops if unknown)
         """
+        if not hasattr(game, "CARDS"):
+            return intern_card(card_name, "", 0)
+
+        card = game.CARDS.get(card_name)
+        if not card:
+            logger.warning("Card not found in CARDS: %s", card_name)
+            return intern_card(card_name, "", 0)
 
-        def format_card(card_name: str) -> Card:
-            if not hasattr(game, "CARDS"):
-                return Card(name=card_name, side="", ops=0)
+        # Handle real card objects
+        try:
+            name = str(getattr(card, "name", card_name))
+            side = str(getattr(card, "side", ""))
+            ops = int(getattr(card, "ops", 0) or 0)
+        except Exception:
+            # Fallback - use card name and defaults
+            name = str(card_name)
+            side = ""
+            ops = 0
+
+        logger.debug("Formatting card: %s (side: %s, ops: %s)", name, side, ops)
+        return intern_card(name, side, ops)
+
+    @staticmethod
+    def format_card(card_name: str, game: Any) -> Card:
+        """
+        Format one card from the game's card definitions
 
-            card = game.CARDS.get(card_name)
-            if not card:
-                logger.warning(f"Card not found in CARDS: {card_name}")
-                return Card(name=card_name, side="", ops=0)
+        Args:
+            card_name: Name of the card
+            game: The game object containing card definitions
 
-            # Handle real card objects
-            try:
-                name = str(getattr(card, "name", card_name))
-                side = str(getattr(card, "side", ""))
-                ops = int(getattr(card, "ops", 0) or 0)
-            except Exception:
-                # Fallback - use card name and defaults
-                name = str(card_name)
-                side = ""
-                ops = 0
+        Returns:
+            Card: The formatted card (with empty side and 0 ops if unknown)
+        """
+        return GameDataFormatter.card_record(card_name, game).to_model()
 
-            logger.debug(f"Formatting card: {name} (side: {side}, ops: {ops})")
-            return Card(name=name, side=side, ops=ops)
+    @staticmethod
+    def section_records(play: Any, game: Any, section: str) -> tuple[CardRecord, ...]:
+        """
+        Look up the cards of one card list of a play
 
+        Args:
+            play: The current play object from the game
+            game: The game object containing card definitions
+            section: A key of ``PLAY_SECTIONS`` (e.g. "deck")
+
+        Returns:
+            tuple: The interned cards, empty if the play has none
+        """
         # Guard against None for all lists
-        possible_draw_cards = (
-            play.possible_draw_cards
-            if getattr(play, "possible_draw_cards", None) is not None
-            else []
-        )
-        discarded_cards = (
-            play.discarded_cards if getattr(play, "discarded_cards", None) is not None else []
-        )
-        removed_cards = (
-            play.removed_cards if getattr(play, "removed_cards", None) is not None else []
-        )
-        cards_in_hands = (
-            play.cards_in_hands if getattr(play, "cards_in_hands", None) is not None else []
-        )
+        card_names = getattr(play, PLAY_SECTIONS[section], None)
+        if card_names is None:
+            return ()
+        return tuple(GameDataFormatter.card_record(card, game) for card in card_names)
 
-        return GameStatus(
-            status="ok",
-            turn=play.turn if hasattr(play, "turn") else None,
-            deck=[format_card(card) for card in possible_draw_cards],
-            discarded=[format_card(card) for card in discarded_cards],
-            removed=[format_card(card) for card in removed_cards],
-            cards_in_hands=[format_card(card) for card in cards_in_hands],
-            your_hand=[],
-            opponent_hand=[],
-        )
+    @staticmethod
+    def format_section(play: Any, game: Any, section: str) -> list[Card]:
+        """
+        Format one card list of a play
+
+        Args:
+            play: The current play object from the game
+            game: The game object containing card definitions
+            section: A key of ``PLAY_SECTIONS`` (e.g. "deck")
+
+        Returns:
+            list[Card]: The formatted cards, empty if the play has none
+        """
+        return [card.to_model() for card in GameDataFormatter.section_records(play, game, section)]
+
+    @staticmethod
+    def play_record(play: Any, game: Any, sections: Collection[str] | None = None) -> StatusRecord:
+        """
+        Build the internal status record of a play
+
+        Args:
+            play: The current play object from the game
+            game: The game object containing card definitions
+            sections: Card lists to look up (all by default); the others are left empty
+
+        Returns:
+            StatusRecord: The play's status
+        """
+        wanted = PLAY_SECTIONS if sections is None else sections
+        cards: dict[str, Any] = {
+            section: GameDataFormatter.section_records(play, game, section)
+            for section in PLAY_SECTIONS
+            if section in wanted
+        }
+        return StatusRecord(status="ok", turn=getattr(play, "turn", None), **cards)
+
+    @staticmethod
+    def format_play_data(
+        play: Any, game: Any, sections: Collection[str] | None = None
+    ) -> GameStatus:
+        """
+        Format play data to match frontend expectations
+
+        Args:
+            play: The current play object from the game
+            game: The game object containing card definitions
+            sections: Card lists to format (all by default); the others are left empty
+
+        Returns:
+            GameStatus: Formatted play data
+        """
+        return GameDataFormatter.play_record(play, game, sections).to_model()
 
     @staticmethod
     def create_error_response(error_message: str | None, filename: str | None = None) -> GameStatus:
@@ -160,3 +371,37 @@ class GameDataFormatter:
             your_hand=[],
             opponent_hand=[],
         )
+
+    @staticmethod
+    def create_summary(
+        status: GameStatus | StatusRecord,
+        filename: str,
+        modified: float | None,
+        counts: Mapping[str, int] | None = None,
+    ) -> GameSummary:
+        """
+        Summarize a game status for dashboards
+
+        Args:
+            status: The full game status or its internal record
+            filename: The log filename
+            modified: Log modification time, if known
+            counts: Card list lengths by ``PLAY_SECTIONS`` key, read from
+                ``status`` when not given
+
+        Returns:
+            GameSummary: Counts instead of full card lists
+        """
+        if counts is None:
+            counts = {name: len(getattr(status, name)) for name in PLAY_SECTIONS}
+        return GameSummary(
+            filename=filename,
+            status=status.status,
+            turn=status.turn,
+            deck_count=counts["deck"],
+            discarded_count=counts["discarded"],
+            removed_count=counts["removed"],
+            cards_in_hands_count=counts["cards_in_hands"],
+            modified=modified,
+            error=status.error,
+        )
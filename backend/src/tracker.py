@@ -0,0 +1,208 @@
+"""
+Embeddable game tracking API for Twilight Helper Backend
+
+Tools and bots can follow a game without running the HTTP server:
+
+    with GameTracker("/path/to/game.txt") as tracker:
+        for state in tracker.changes():
+            print(state.version, state.record.turn)
+
+or, from asyncio code:
+
+    async with GameTracker() as tracker:
+        async for state in tracker.achanges():
+            ...
+"""
+
+import asyncio
+import logging
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+from .models.game_data import GameStatus, StatusRecord
+from .utils.fingerprint import Fingerprint
+from .utils.game_state import GameStateCache, QuarantinedLogError
+from .utils.log_utils import get_latest_log_file
+
+logger = logging.getLogger(__name__)
+
+
+class TrackerClosedError(RuntimeError):
+    """Raised by ``GameTracker.snapshot()`` after ``close()``"""
+
+
+@dataclass(frozen=True)
+class TrackedState:
+    """One version of a tracked game's state"""
+
+    path: str
+    # Increases every time the log's contents change; starts at 1 per log
+    version: int
+    fingerprint: Fingerprint
+    record: StatusRecord
+
+    @property
+    def status(self) -> GameStatus:
+        """The state as the pydantic model the API returns"""
+        return self.record.to_model()
+
+    def to_dict(self) -> dict[str, Any]:
+        """The state as the API's JSON payload"""
+        return self.record.to_dict()
+
+
+class GameTracker:
+    """
+    Follows one log, or the configured/latest log, and reports new states.
+
+    The log is only re-parsed when its fingerprint changes. A tracker holds
+    a parsed game in memory; ``close()`` (or leaving a ``with`` block)
+    releases it and ends any running ``changes()`` loop.
+    """
+
+    def __init__(
+        self,
+        log_path: str | None = None,
+        interval: float = 1.0,
+        resolve: Callable[[], str | None] = get_latest_log_file,
+        sleep: Callable[[float], None] | None = None,
+    ) -> None:
+        """
+        Args:
+            log_path: Log to follow; without it the configured or latest log
+                is re-resolved on every poll, so a new game is picked up
+            interval: Seconds between polls in ``changes()``
+            resolve: Finds the log to follow when ``log_path`` is not given
+            sleep: Waits between polls (by default a wait that ``close()``
+                interrupts)
+        """
+        self.log_path = log_path
+        self.interval = interval
+        self._resolve = resolve
+        self._sleep = sleep
+        self._cache = GameStateCache(max_entries=4)
+        self._closed = threading.Event()
+        self._waiting_reported = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether ``close()`` was called"""
+        return self._closed.is_set()
+
+    def close(self) -> None:
+        """Stop any ``changes()`` loop and drop the parsed state"""
+        self._closed.set()
+        self._cache.invalidate()
+
+    def __enter__(self) -> "GameTracker":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "GameTracker":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def snapshot(self) -> TrackedState | None:
+        """
+        Get the current state, parsing the log only if it changed
+
+        Returns:
+            TrackedState: The current state, or None if there is no log to follow
+
+        Raises:
+            TrackerClosedError: If the tracker is closed
+            Exception: Whatever the parser raises for an unreadable log
+        """
+        if self.closed:
+            raise TrackerClosedError("GameTracker is closed")
+        path = self.log_path or self._resolve()
+        if not path:
+            return None
+        entry = self._cache.get_entry(path)
+        return TrackedState(
+            path=entry.path,
+            version=entry.version,
+            fingerprint=entry.fingerprint,
+            record=entry.record,
+        )
+
+    def _poll(self, last: TrackedState | None) -> TrackedState | None:
+        """The current state if it is new since ``last``, logging read errors"""
+        try:
+            state = self.snapshot()
+        except TrackerClosedError:
+            # Closed from another thread while this poll was starting
+            return None
+        except QuarantinedLogError:
+            # Reported when the log first failed; waits for the log to change
+            return None
+        except Exception as e:
+            logger.error("Error reading %s: %s", self.log_path or "latest log", e)
+            return None
+        if state is None:
+            if not self._waiting_reported:
+                logger.warning("No log file found, waiting for one")
+                self._waiting_reported = True
+            return None
+        self._waiting_reported = False
+        if last is not None and (state.path, state.version) == (last.path, last.version):
+            return None
+        return state
+
+    def changes(self) -> Iterator[TrackedState]:
+        """
+        Yield the current state, then every new version as the log changes
+
+        Blocks between polls and ends once the tracker is closed. Read and
+        parse errors are logged and retried on the next poll.
+
+        Yields:
+            TrackedState: Each new state, in order
+        """
+        last: TrackedState | None = None
+        while not self.closed:
+            state = self._poll(last)
+            if state is not None:
+                last = state
+                yield state
+                continue
+            if self._sleep is not None:
+                self._sleep(self.interval)
+            else:
+                self._closed.wait(self.interval)
+
+    async def achanges(self) -> AsyncIterator[TrackedState]:
+        """
+        Async version of ``changes()``
+
+        Parsing runs in a worker thread, so the event loop is never blocked
+        by a large log.
+
+        Yields:
+            TrackedState: Each new state, in order
+        """
+        last: TrackedState | None = None
+        while not self.closed:
+            state = await asyncio.to_thread(self._poll, last)
+            if state is not None:
+                last = state
+                yield state
+                continue
+            await asyncio.sleep(self.interval)
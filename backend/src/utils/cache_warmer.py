@@ -0,0 +1,71 @@
+"""
+Startup cache warming for Twilight Helper Backend
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from flask import Flask
+
+from .game_state import GameStateCache
+from .log_utils import get_latest_log_file
+from .response_format import encode_entry
+
+logger = logging.getLogger(__name__)
+
+
+def warm_cache(
+    cache: GameStateCache, resolve: Callable[[], str | None] = get_latest_log_file
+) -> str | None:
+    """
+    Parse, format and serialize the current log so the first request is a cache hit
+
+    Args:
+        cache: The app's game state cache
+        resolve: Returns the log to warm (the configured or latest log by default)
+
+    Returns:
+        str: Path of the warmed log, or None if there is no log to warm
+    """
+    started = time.perf_counter()
+    path = resolve()
+    if not path:
+        logger.info("Cache warm-up skipped: no log file found")
+        return None
+    entry = cache.get_entry(path)
+    # Formats every card list and builds the default JSON body, which also
+    # builds pydantic's serialization schemas ahead of the first request
+    encode_entry(entry, "json")
+    logger.info("Cache warmed for %s in %.1f ms", path, (time.perf_counter() - started) * 1000)
+    return path
+
+
+def start_cache_warmer(
+    app: Flask, resolve: Callable[[], str | None] = get_latest_log_file
+) -> threading.Thread:
+    """
+    Warm an app's game state cache in a background thread
+
+    Requests that arrive while warming is still running wait for the same
+    parse instead of starting their own (see ``GameStateCache``).
+
+    Args:
+        app: The Flask app whose cache to warm
+        resolve: Returns the log to warm
+
+    Returns:
+        threading.Thread: The started daemon thread
+    """
+    cache: GameStateCache = app.config["GAME_STATE_CACHE"]
+
+    def run() -> None:
+        try:
+            warm_cache(cache, resolve)
+        except Exception as e:
+            logger.warning("Cache warm-up failed: %s", e, exc_info=True)
+
+    thread = threading.Thread(target=run, name="cache-warmer", daemon=True)
+    thread.start()
+    return thread
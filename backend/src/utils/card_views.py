@@ -0,0 +1,143 @@
+"""
+Server-side sorted and grouped card views for Twilight Helper Backend
+
+Thin clients and overlays can ask for the card lists already sorted the way
+the frontend sorts them (``SortOption``) and split by side, instead of
+re-grouping and re-sorting on every poll.
+"""
+
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from ..models.game_data import CARD_LIST_FIELDS, Card, CardRecord, GameStatus, StatusRecord
+
+VIEWS = ("flat", "grouped")
+SORT_OPTIONS = ("name", "ops-asc", "ops-desc")
+
+# Group keys by card side, in display order (matching the frontend's deck-us/deck-ussr/deck-neutral)
+SIDE_GROUPS = {"US": "us", "USSR": "ussr", "Neutral": "neutral"}
+_SIDE_ORDER = {side: index for index, side in enumerate(SIDE_GROUPS)}
+
+
+# Sorting and grouping only read name, side and ops, so they work on both
+# pydantic cards and the internal records
+AnyCard = Card | CardRecord
+C = TypeVar("C", Card, CardRecord)
+
+
+def _name_key(card: AnyCard) -> tuple[str, str]:
+    return (card.name.casefold(), card.name)
+
+
+def _side_key(card: AnyCard) -> int:
+    return _SIDE_ORDER.get(card.side, len(_SIDE_ORDER))
+
+
+SORT_KEYS: dict[str, Callable[[AnyCard], tuple[Any, ...]]] = {
+    "name": lambda card: _name_key(card),
+    "ops-asc": lambda card: (card.ops, _side_key(card), *_name_key(card)),
+    "ops-desc": lambda card: (-card.ops, _side_key(card), *_name_key(card)),
+}
+
+
+@dataclass(frozen=True)
+class CardView:
+    """A requested presentation of a game status"""
+
+    view: str = "flat"
+    sort: str | None = None
+    # GameStatus fields to return; None returns all of them
+    fields: tuple[str, ...] | None = None
+
+    @property
+    def is_default(self) -> bool:
+        """Whether this is the plain, unsorted, unprojected status"""
+        return self.view == "flat" and self.sort is None and self.fields is None
+
+    @property
+    def key(self) -> str:
+        """Cache key of this view"""
+        if self.is_default:
+            return ""
+        return f"{self.view}:{self.sort or ''}:{','.join(self.fields or ())}"
+
+    @classmethod
+    def from_args(cls, args: Mapping[str, str]) -> "CardView":
+        """
+        Read a view from request query arguments
+
+        Args:
+            args: Query arguments with optional ``view``, ``sort`` and
+                ``fields`` (comma-separated GameStatus field names)
+
+        Returns:
+            CardView: The requested view
+
+        Raises:
+            ValueError: If ``view``, ``sort`` or a field has an unsupported value
+        """
+        view = args.get("view", "flat")
+        sort = args.get("sort")
+        fields = None
+        if args.get("fields"):
+            requested = {name.strip() for name in args["fields"].split(",") if name.strip()}
+            unknown = requested - set(GameStatus.model_fields)
+            if unknown:
+                raise ValueError(f"Unsupported fields: {', '.join(sorted(unknown))}")
+            # Canonical order, so equivalent requests share one cache entry
+            fields = tuple(name for name in GameStatus.model_fields if name in requested)
+        if view not in VIEWS:
+            raise ValueError(f"Unsupported view: {view} (expected one of {', '.join(VIEWS)})")
+        if sort is not None and sort not in SORT_OPTIONS:
+            raise ValueError(
+                f"Unsupported sort: {sort} (expected one of {', '.join(SORT_OPTIONS)})"
+            )
+        return cls(view=view, sort=sort, fields=fields)
+
+
+def _split_by_side(cards: Sequence[C]) -> dict[str, list[C]]:
+    grouped: dict[str, list[C]] = {key: [] for key in SIDE_GROUPS.values()}
+    for card in cards:
+        grouped.setdefault(SIDE_GROUPS.get(card.side, "unknown"), []).append(card)
+    return grouped
+
+
+def render_view(status: StatusRecord | GameStatus, view: CardView) -> dict[str, Any]:
+    """
+    Build the response payload of a status in the requested view
+
+    Args:
+        status: The status record (or a pydantic status, which is converted)
+        view: The requested view
+
+    Returns:
+        dict: The status payload with sorted card lists and, for the grouped
+            view, a ``groups`` entry mapping each card list to its side groups.
+            With ``fields``, only those fields and ``status`` are included.
+    """
+    record = status if isinstance(status, StatusRecord) else StatusRecord.from_model(status)
+    names = [n for n in CARD_LIST_FIELDS if view.fields is None or n in view.fields]
+    sections = {name: list(getattr(record, name)) for name in names}
+    if view.sort is not None:
+        for cards in sections.values():
+            cards.sort(key=SORT_KEYS[view.sort])
+
+    scalars = [n for n in record._fields if n not in CARD_LIST_FIELDS]
+    if view.fields is not None:
+        scalars = [n for n in scalars if n == "status" or n in view.fields]
+    payload = record.to_dict(scalars)
+    payload.update({name: [c.to_dict() for c in cards] for name, cards in sections.items()})
+    if view.view == "grouped":
+        payload["groups"] = {
+            name: {
+                key: {
+                    "cards": [c.to_dict() for c in group],
+                    "count": len(group),
+                    "ops_total": sum(c.ops for c in group),
+                }
+                for key, group in _split_by_side(cards).items()
+            }
+            for name, cards in sections.items()
+        }
+    return payload
@@ -0,0 +1,150 @@
+"""
+Negotiated response compression for Twilight Helper Backend
+"""
+
+import gzip
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from flask import Flask, Response, request
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Bodies smaller than this are sent uncompressed
+DEFAULT_MIN_SIZE = 1024
+
+COMPRESSIBLE_MIMETYPES = frozenset({"application/json", "application/msgpack", "text/plain"})
+
+
+class ResponseCompressor:
+    """
+    Compresses response bodies according to the client's Accept-Encoding.
+
+    Polling clients receive the same body over and over until the game state
+    changes, so compressed bodies are cached by a digest of the uncompressed
+    bytes and each distinct body is compressed only once per encoding.
+    """
+
+    def __init__(
+        self,
+        app: Flask | None = None,
+        min_size: int = DEFAULT_MIN_SIZE,
+        cache_size: int = 64,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+    ) -> None:
+        self.min_size = min_size
+        self.cache_size = cache_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self._cache: OrderedDict[tuple[str, bytes], bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        if app is not None:
+            self.init_app(app)
+
+    @property
+    def encodings(self) -> tuple[str, ...]:
+        """Supported encodings in order of preference"""
+        return ("br", "gzip") if brotli is not None else ("gzip",)
+
+    def init_app(self, app: Flask) -> None:
+        """Register the compressor on a Flask app"""
+        app.after_request(self.compress_response)
+
+    def choose_encoding(self, accept_encoding: Any) -> str | None:
+        """
+        Pick the best supported encoding the client accepts
+
+        Args:
+            accept_encoding: The request's parsed Accept-Encoding header
+
+        Returns:
+            str: The encoding to use, or None to send the body uncompressed
+        """
+        best: str | None = None
+        best_quality = 0.0
+        for encoding in self.encodings:
+            quality = accept_encoding.quality(encoding)
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """
+        Compress a body, reusing the result for identical bodies
+
+        Args:
+            body: The uncompressed bytes
+            encoding: "gzip" or "br"
+
+        Returns:
+            bytes: The compressed bytes
+        """
+        key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        if encoding == "br" and brotli is not None:
+            compressed: bytes = brotli.compress(body, quality=self.brotli_quality)
+        else:
+            compressed = gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+        with self._lock:
+            self._cache[key] = compressed
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return compressed
+
+    def compress_response(self, response: Response) -> Response:
+        """after_request hook that compresses eligible responses"""
+        response.vary.add("Accept-Encoding")
+        if (
+            response.status_code != 200
+            or response.direct_passthrough
+            or response.is_streamed
+            or "Content-Encoding" in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        ):
+            return response
+
+        encoding = self.choose_encoding(request.accept_encodings)
+        if encoding is None:
+            return response
+
+        body = response.get_data()
+        if len(body) < self.min_size:
+            return response
+
+        response.set_data(self.compress(body, encoding))
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get compression cache statistics
+
+        Returns:
+            dict: Cached body count and hit/miss counters
+        """
+        with self._lock:
+            return {
+                "encodings": list(self.encodings),
+                "cached_bodies": len(self._cache),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
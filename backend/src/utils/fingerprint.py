@@ -0,0 +1,99 @@
+"""
+Cheap content fingerprints of log files for Twilight Helper Backend
+
+A fingerprint answers "did this log change?" without reading or parsing
+the whole file: one ``open``, one ``fstat`` and a read of the last few KB.
+"""
+
+import hashlib
+import os
+from typing import NamedTuple
+
+# How much of the end of the file is hashed
+TAIL_BYTES = 4096
+
+
+class Fingerprint(NamedTuple):
+    """Identity of a log file's contents"""
+
+    inode: int
+    size: int
+    mtime_ns: int
+    # 64-bit hash of the last TAIL_BYTES bytes
+    tail_hash: int
+
+    @property
+    def mtime(self) -> float:
+        """Modification time in epoch seconds"""
+        return self.mtime_ns / 1e9
+
+    @property
+    def token(self) -> str:
+        """Compact opaque string form, usable as an ETag or cache key"""
+        return f"{self.inode:x}-{self.size:x}-{self.mtime_ns:x}-{self.tail_hash:016x}"
+
+
+# Stand-in for entries whose file could not be fingerprinted
+EMPTY_FINGERPRINT = Fingerprint(0, 0, 0, 0)
+
+
+def file_fingerprint(path: str, tail_bytes: int = TAIL_BYTES) -> Fingerprint | None:
+    """
+    Fingerprint a log file from its inode, size, mtime and the hash of its tail
+
+    The tail hash catches rewrites that keep the same size on filesystems
+    with coarse mtime resolution (FAT, some network shares) or when an
+    editor restores the mtime. Logs are appended to, so their changes
+    always land in the tail.
+
+    Args:
+        path: Path to the log file
+        tail_bytes: Number of bytes at the end of the file to hash
+
+    Returns:
+        Fingerprint: The fingerprint, or None if the file cannot be read
+    """
+    try:
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size > tail_bytes:
+                f.seek(stat.st_size - tail_bytes)
+            tail = f.read(tail_bytes)
+    except OSError:
+        return None
+    digest = hashlib.blake2b(tail, digest_size=8).digest()
+    return Fingerprint(
+        inode=stat.st_ino,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        tail_hash=int.from_bytes(digest, "big"),
+    )
+
+
+def only_appended(path: str, fingerprint: Fingerprint) -> bool:
+    """
+    Whether a file still starts with the contents a fingerprint was taken of
+
+    Checks the same inode, a size no smaller than before and the same hash
+    of what used to be the file's tail, so a log replaced by a longer one
+    (even one that reused the inode) is told apart from a log that grew.
+
+    Args:
+        path: Path to the log file
+        fingerprint: An earlier fingerprint of the file
+
+    Returns:
+        bool: True if data was at most appended since the fingerprint was taken
+    """
+    try:
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_ino != fingerprint.inode or stat.st_size < fingerprint.size:
+                return False
+            start = max(fingerprint.size - TAIL_BYTES, 0)
+            f.seek(start)
+            tail = f.read(fingerprint.size - start)
+    except OSError:
+        return False
+    digest = hashlib.blake2b(tail, digest_size=8).digest()
+    return int.from_bytes(digest, "big") == fingerprint.tail_hash
@@ -0,0 +1,546 @@
+"""
+Per-log-file game state tracking for Twilight Helper Backend
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Collection
+from dataclasses import dataclass, field
+from typing import Any
+
+from twilight_log_parser import log_parser
+
+from ..config.config_manager import ConfigChange
+from ..models.game_data import (
+    PLAY_SECTIONS,
+    CardRecord,
+    GameDataFormatter,
+    GameStatus,
+    GameSummary,
+    StatusRecord,
+)
+from .fingerprint import EMPTY_FINGERPRINT, Fingerprint, file_fingerprint
+from .log_archive import parseable_path
+from .server_timing import tag_timing, timed
+from .single_flight import SingleFlight
+from .snapshot_store import SnapshotStore
+
+logger = logging.getLogger(__name__)
+
+# Backoff before re-parsing an unchanged log that failed to parse, doubled per
+# consecutive failure; a log that changed is always re-parsed
+QUARANTINE_BACKOFF_SECONDS = 5.0
+QUARANTINE_MAX_BACKOFF_SECONDS = 5 * 60.0
+
+# A parsed state goes to the snapshot store once its log has not changed for
+# this long, or when it leaves the cache; a growing log is not written per line
+PERSIST_IDLE_SECONDS = 10.0
+
+
+class QuarantinedLogError(Exception):
+    """A log's current contents failed to parse and there is no earlier state to serve"""
+
+
+@dataclass
+class ParseFailure:
+    """Negative cache entry of a log whose current contents failed to parse"""
+
+    fingerprint: Fingerprint
+    error: str
+    # Consecutive failures, across changes of the log
+    failures: int
+    # Until then the same contents are not parsed again
+    retry_at: float
+
+
+class GameSnapshot:
+    """
+    One parsed state of a log file.
+
+    The card lists are looked up on first use, one section at a time, so a
+    client that only asks for the turn and the deck never pays for the
+    discarded, removed and in-hands lists. The state is kept as a
+    ``StatusRecord``; pydantic models are only built on request.
+    """
+
+    __slots__ = ("filename", "_game", "_sections", "_full")
+
+    def __init__(self, filename: str | None, game: Any = None) -> None:
+        self.filename = filename
+        self._game = game
+        self._sections: dict[str, tuple[CardRecord, ...]] = {}
+        self._full: StatusRecord | None = None
+
+    @classmethod
+    def from_record(cls, record: StatusRecord) -> "GameSnapshot":
+        """Wrap an already built status record (errors, "no game data", stored states)"""
+        snapshot = cls(record.filename)
+        snapshot._full = record
+        return snapshot
+
+    @classmethod
+    def from_status(cls, status: GameStatus) -> "GameSnapshot":
+        """Wrap a pydantic status (e.g. from a custom parse function)"""
+        return cls.from_record(StatusRecord.from_model(status))
+
+    @property
+    def holds_game(self) -> bool:
+        """Whether the parsed game is still referenced (not every section is built yet)"""
+        return self._game is not None
+
+    def record(self, fields: Collection[str] | None = None) -> StatusRecord:
+        """
+        Get the status record
+
+        Args:
+            fields: Card lists that must be looked up; all of them by default.
+                Card lists not asked for are left empty.
+
+        Returns:
+            StatusRecord: The status
+        """
+        if self._full is not None:
+            return self._full
+        if fields is None:
+            self._full = self._build(PLAY_SECTIONS)
+            # The parsed game is no longer needed once every section is built
+            self._game = None
+            self._sections = {}
+            return self._full
+        return self._build([name for name in PLAY_SECTIONS if name in fields])
+
+    def status(self, fields: Collection[str] | None = None) -> GameStatus:
+        """
+        Get the status as a pydantic model, for callers at the API boundary
+
+        Args:
+            fields: Card lists that must be filled in; all of them by default
+
+        Returns:
+            GameStatus: A new model built from the record
+        """
+        return self.record(fields).to_model()
+
+    def summary(self, filename: str, modified: float | None) -> GameSummary:
+        """
+        Summarize the state for dashboards
+
+        The card lists are only counted, so no card is looked up unless the
+        full record is already built.
+
+        Args:
+            filename: The log filename
+            modified: Log modification time, if known
+
+        Returns:
+            GameSummary: Counts instead of full card lists
+        """
+        game = self._game
+        if game is None:
+            return GameDataFormatter.create_summary(self.record(), filename, modified)
+        play = game.current_play
+        counts = {
+            name: len(getattr(play, attr, None) or ()) for name, attr in PLAY_SECTIONS.items()
+        }
+        return GameDataFormatter.create_summary(self._build(()), filename, modified, counts)
+
+    def _build(self, sections: Collection[str]) -> StatusRecord:
+        # Locals, since a concurrent full build releases the game and sections
+        game, built = self._game, self._sections
+        if game is None and self._full is not None:
+            return self._full
+        play = game.current_play
+        for name in sections:
+            if name not in built:
+                built[name] = GameDataFormatter.section_records(play, game, name)
+        record = GameDataFormatter.play_record(play, game, sections=())
+        cards: dict[str, Any] = {name: built[name] for name in sections}
+        return record._replace(filename=self.filename, **cards)
+
+
+@dataclass
+class GameStateEntry:
+    """Cached parser output for one log file"""
+
+    path: str
+    fingerprint: Fingerprint
+    snapshot: GameSnapshot
+    version: int
+    last_access: float
+    # The last good state, served while the log's current contents fail to parse
+    stale: bool = False
+    # When this version was parsed or loaded, and whether the store has it
+    created: float = 0.0
+    persisted: bool = False
+    # Serialized response bodies of this version, keyed by (format, view key), filled lazily
+    encoded: dict[tuple[str, str], bytes] = field(default_factory=dict)
+
+    @property
+    def record(self) -> StatusRecord:
+        """The full status record"""
+        return self.snapshot.record()
+
+    @property
+    def status(self) -> GameStatus:
+        """The full status as a pydantic model"""
+        return self.snapshot.status()
+
+
+def parse_log_snapshot(path: str) -> GameSnapshot:
+    """
+    Parse a plain or archived log file without formatting its cards yet
+
+    Args:
+        path: Path to the log file
+
+    Returns:
+        GameSnapshot: The parsed state, or a "no game data" snapshot
+    """
+    filename = os.path.basename(path)
+    parser = log_parser.LogParser()
+    # Archived logs are decompressed in chunks to a temporary file the parser can open
+    with parseable_path(path) as parse_path:
+        game = parser.parse_game_log(parse_path)
+    if not game:
+        return GameSnapshot.from_record(StatusRecord(status="no game data", filename=filename))
+    return GameSnapshot(filename, game)
+
+
+def parse_log_status(path: str) -> GameStatus:
+    """
+    Parse a plain or archived log file and format its current play
+
+    Args:
+        path: Path to the log file
+
+    Returns:
+        GameStatus: Formatted status, or a "no game data" response
+    """
+    return parse_log_snapshot(path).status()
+
+
+class GameStateCache:
+    """
+    Keeps the parsed state of every tracked log file, re-parsing a file only
+    when its fingerprint changes.
+
+    Entries are evicted least-recently-used once ``max_entries`` is reached,
+    and after ``ttl`` seconds without being accessed.
+
+    Concurrent requests for a file whose contents changed are coalesced: the
+    first one parses it and the others wait for its result. With a
+    ``SnapshotStore``, parsed states also persist across restarts: an entry
+    is stored once it has been idle for ``persist_after`` seconds, when it
+    is evicted, or on ``persist()``.
+
+    A log that fails to parse (e.g. caught half-written) is quarantined: its
+    contents are not parsed again until they change or a backoff expires,
+    and meanwhile the last good state is served with ``stale`` set.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        ttl: float = 30 * 60,
+        parse: Callable[[str], GameSnapshot | GameStatus] = parse_log_snapshot,
+        clock: Callable[[], float] = time.monotonic,
+        store: SnapshotStore | None = None,
+        persist_after: float = PERSIST_IDLE_SECONDS,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.persist_after = persist_after
+        self._parse = parse
+        self._store = store
+        self._clock = clock
+        self._entries: OrderedDict[str, GameStateEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._flights: SingleFlight[GameStateEntry] = SingleFlight()
+        # Bounded like the entries; the oldest failure is forgotten first
+        self._failures: OrderedDict[str, ParseFailure] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._entries
+
+    def get_status(self, path: str) -> GameStatus:
+        """
+        Get the current status of a log file, parsing it only if it changed
+
+        Args:
+            path: Path to the log file
+
+        Returns:
+            GameStatus: The formatted status
+
+        Raises:
+            Exception: Whatever the parser raises for an unreadable log
+        """
+        return self.get_entry(path).status
+
+    def get_entry(self, path: str) -> GameStateEntry:
+        """
+        Get the cache entry of a log file, parsing it only if it changed
+
+        Args:
+            path: Path to the log file
+
+        Returns:
+            GameStateEntry: The up-to-date entry, or the last good one marked
+                stale while the log's current contents fail to parse
+
+        Raises:
+            QuarantinedLogError: If the current contents already failed to
+                parse and there is no earlier state
+        """
+        now = self._clock()
+        with timed("fingerprint"):
+            fingerprint = file_fingerprint(path)
+        with self._lock:
+            self._evict_expired(now)
+            entry = self._entries.get(path)
+            failure = self._failures.get(path)
+            quarantined = (
+                failure is not None
+                and failure.fingerprint == fingerprint
+                and now < failure.retry_at
+            )
+            if entry is not None and fingerprint is not None and entry.fingerprint == fingerprint:
+                # A stale entry is keyed by the contents that failed; retry them after the backoff
+                if not entry.stale or quarantined:
+                    entry.last_access = now
+                    self._entries.move_to_end(path)
+                    self._hits += 1
+                    tag_timing("cache", "stale" if quarantined else "hit")
+                    if now - entry.created >= self.persist_after:
+                        self._persist(entry)
+                    return entry
+            elif entry is None and quarantined and failure is not None:
+                tag_timing("cache", "quarantined")
+                raise QuarantinedLogError(
+                    f"{os.path.basename(path)} failed to parse: {failure.error}"
+                )
+            self._misses += 1
+            version = entry.version + 1 if entry is not None else 1
+            # An entry that is merely out of date means the log changed since
+            # the store last saw it, so only a first load looks there
+            stored = entry is None
+
+        # Concurrent misses for the same file contents share a single parse
+        with timed("parse"):
+            new_entry, shared = self._flights.do(
+                (path, fingerprint), lambda: self._load(path, fingerprint, version, now, stored)
+            )
+        if shared:
+            tag_timing("cache", "coalesced")
+        return new_entry
+
+    def _load(
+        self,
+        path: str,
+        fingerprint: Fingerprint | None,
+        version: int,
+        now: float,
+        stored: bool = True,
+    ) -> GameStateEntry:
+        snapshot = self._load_stored(path, fingerprint) if stored else None
+        tag_timing("cache", "miss" if snapshot is None else "stored")
+        persisted = snapshot is not None
+        if snapshot is None:
+            try:
+                parsed = self._parse(path)
+            except Exception as e:
+                return self._quarantine(path, fingerprint, version, now, e)
+            with self._lock:
+                self._failures.pop(path, None)
+            snapshot = (
+                parsed if isinstance(parsed, GameSnapshot) else GameSnapshot.from_status(parsed)
+            )
+        new_entry = GameStateEntry(
+            path=path,
+            fingerprint=fingerprint or EMPTY_FINGERPRINT,
+            snapshot=snapshot,
+            version=version,
+            last_access=now,
+            created=now,
+            persisted=persisted,
+        )
+        if fingerprint is None:
+            # The file vanished or cannot be stat'ed; don't cache what we can't validate
+            return new_entry
+
+        with self._lock:
+            self._entries[path] = new_entry
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                evicted, evicted_entry = self._entries.popitem(last=False)
+                self._persist(evicted_entry)
+                self._failures.pop(evicted, None)
+                logger.debug("Evicted least recently used game state: %s", evicted)
+        return new_entry
+
+    def _quarantine(
+        self,
+        path: str,
+        fingerprint: Fingerprint | None,
+        version: int,
+        now: float,
+        error: Exception,
+    ) -> GameStateEntry:
+        """Remember a parse failure and serve the last good state marked stale"""
+        if fingerprint is None:
+            # The file vanished mid-parse; nothing to key the failure by
+            raise error
+        with self._lock:
+            previous = self._failures.get(path)
+            failures = previous.failures + 1 if previous is not None else 1
+            backoff = min(
+                QUARANTINE_BACKOFF_SECONDS * 2 ** (failures - 1), QUARANTINE_MAX_BACKOFF_SECONDS
+            )
+            self._failures[path] = ParseFailure(fingerprint, str(error), failures, now + backoff)
+            self._failures.move_to_end(path)
+            while len(self._failures) > self.max_entries:
+                self._failures.popitem(last=False)
+            last = self._entries.get(path)
+
+        if last is None:
+            # Callers report it; until the log changes they get QuarantinedLogError
+            raise error
+        if previous is None:
+            logger.error(
+                "Error parsing %s, serving its last good state: %s", path, error, exc_info=True
+            )
+        else:
+            # The traceback was logged when the log first failed
+            logger.warning("Error parsing %s again (%d in a row): %s", path, failures, error)
+        if last.stale and last.fingerprint == fingerprint:
+            # A retry of the same contents after the backoff; keep the version clients saw
+            return last
+
+        record = last.snapshot.record()._replace(stale=True, error=str(error))
+        stale = GameStateEntry(
+            path=path,
+            fingerprint=fingerprint,
+            snapshot=GameSnapshot.from_record(record),
+            version=version,
+            last_access=now,
+            stale=True,
+            created=now,
+        )
+        with self._lock:
+            self._entries[path] = stale
+            self._entries.move_to_end(path)
+        return stale
+
+    def failure(self, path: str) -> ParseFailure | None:
+        """The quarantine record of a log whose latest parse failed, if any"""
+        with self._lock:
+            return self._failures.get(path)
+
+    def _load_stored(self, path: str, fingerprint: Fingerprint | None) -> GameSnapshot | None:
+        if self._store is None or fingerprint is None:
+            return None
+        record = self._store.load(path, fingerprint)
+        if record is None:
+            return None
+        logger.debug("Loaded stored snapshot of %s", path)
+        return GameSnapshot.from_record(record)
+
+    def _persist(self, entry: GameStateEntry) -> None:
+        """Queue an entry for the snapshot store, once per parsed version"""
+        if self._store is None or entry.persisted or entry.stale:
+            return
+        entry.persisted = True
+        # Building the full record for disk happens on the store's writer thread
+        self._store.save_later(entry.path, entry.fingerprint, entry.snapshot.record)
+
+    def persist(self) -> None:
+        """Store every entry the snapshot store doesn't have yet, e.g. before shutting down"""
+        if self._store is None:
+            return
+        with self._lock:
+            for entry in self._entries.values():
+                self._persist(entry)
+        self._store.flush()
+
+    def _evict_expired(self, now: float) -> None:
+        expired = [p for p, e in self._entries.items() if now - e.last_access > self.ttl]
+        for path in expired:
+            self._persist(self._entries.pop(path))
+            self._failures.pop(path, None)
+            logger.debug("Evicted idle game state: %s", path)
+
+    def invalidate(self, path: str | None = None) -> None:
+        """Drop one entry, or every entry when no path is given"""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._failures.clear()
+            else:
+                self._entries.pop(path, None)
+                self._failures.pop(path, None)
+
+    def on_config_change(self, change: ConfigChange) -> None:
+        """
+        Drop the entries of logs the new configuration no longer points at
+
+        Parsed states don't depend on the configuration, so only a change of
+        the log directory or log file evicts anything, and only the entries
+        outside the new directory (other than the configured log file).
+
+        Args:
+            change: The published configuration change
+        """
+        if not change.changed_fields & {"log_directory", "log_file_path"}:
+            return
+        directory = os.path.abspath(change.new.log_directory)
+        configured = change.new.log_file_path
+        if configured and not os.path.isabs(configured):
+            configured = os.path.join(directory, configured)
+        with self._lock:
+            stale = [
+                path
+                for path in self._entries
+                if os.path.dirname(os.path.abspath(path)) != directory
+                and (not configured or os.path.abspath(path) != os.path.abspath(configured))
+            ]
+            for path in stale:
+                self._persist(self._entries.pop(path))
+                self._failures.pop(path, None)
+        if stale:
+            logger.info("Configuration change evicted %d game states", len(stale))
+
+    @property
+    def store(self) -> SnapshotStore | None:
+        """The on-disk snapshot store, if any"""
+        return self._store
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Entry count, parsed games still held, cached response
+                bodies, limits, hit/miss counters and quarantined logs
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            return {
+                "entries": len(entries),
+                "parsed_games": sum(e.snapshot.holds_game for e in entries),
+                "encoded_bodies": sum(len(e.encoded) for e in entries),
+                "encoded_bytes": sum(len(b) for e in entries for b in e.encoded.values()),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._flights.stats()["shared"],
+                "quarantined": len(self._failures),
+            }
@@ -0,0 +1,150 @@
+"""
+Compressed log archive support for Twilight Helper Backend
+
+Old games are often archived as ``.txt.gz``, ``.txt.bz2`` or ``.txt.xz``.
+Everything here decompresses in fixed-size chunks, so an archive is never
+held in memory as a whole.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import re
+import shutil
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import IO, Any, cast
+
+# Compression formats by archive suffix
+ARCHIVE_SUFFIXES = {".txt.gz": "gz", ".txt.bz2": "bz2", ".txt.xz": "xz"}
+
+LOG_SUFFIXES = (".txt", *ARCHIVE_SUFFIXES)
+
+# Decompression chunk size
+CHUNK_SIZE = 1024 * 1024
+
+TURN_LINE = re.compile(r"Turn (\d+)\b")
+
+
+def is_log_file(name: str) -> bool:
+    """Whether a filename is a plain or archived log"""
+    return name.endswith(LOG_SUFFIXES)
+
+
+def is_archive(path: str) -> bool:
+    """Whether a path is a compressed log archive"""
+    return path.endswith(tuple(ARCHIVE_SUFFIXES))
+
+
+def open_log_stream(path: str) -> IO[bytes]:
+    """
+    Open a plain or archived log as a binary stream of its decompressed contents
+
+    Args:
+        path: Path to the log or archive
+
+    Returns:
+        IO[bytes]: A stream that decompresses lazily as it is read
+    """
+    if path.endswith(".gz"):
+        return cast(IO[bytes], gzip.open(path, "rb"))
+    if path.endswith(".bz2"):
+        return bz2.open(path, "rb")
+    if path.endswith(".xz"):
+        return lzma.open(path, "rb")
+    return open(path, "rb")
+
+
+def iter_log_lines(path: str, encoding: str = "utf-8") -> Iterator[str]:
+    """
+    Stream the lines of a plain or archived log
+
+    Args:
+        path: Path to the log or archive
+        encoding: Text encoding of the log
+
+    Yields:
+        str: Lines without line endings
+    """
+    with open_log_stream(path) as raw:
+        with io.TextIOWrapper(raw, encoding=encoding, errors="replace") as text:
+            for line in text:
+                yield line.rstrip("\r\n")
+
+
+@contextmanager
+def parseable_path(path: str) -> Iterator[str]:
+    """
+    Get a path the log parser can open directly
+
+    Plain logs are returned unchanged. Archives are decompressed chunk by
+    chunk into a temporary file, which is removed on exit.
+
+    Args:
+        path: Path to the log or archive
+
+    Yields:
+        str: Path to a plain-text log
+    """
+    if not is_archive(path):
+        yield path
+        return
+
+    fd, temp_path = tempfile.mkstemp(prefix="twilight-log-", suffix=".txt")
+    try:
+        with os.fdopen(fd, "wb") as out, open_log_stream(path) as stream:
+            shutil.copyfileobj(stream, out, CHUNK_SIZE)
+        yield temp_path
+    finally:
+        os.remove(temp_path)
+
+
+def archive_info(path: str) -> dict[str, Any]:
+    """
+    Describe a log file for listings
+
+    Args:
+        path: Path to the log or archive
+
+    Returns:
+        dict: Whether the file is compressed and with which format
+    """
+    for suffix, compression in ARCHIVE_SUFFIXES.items():
+        if path.endswith(suffix):
+            return {"compressed": True, "compression": compression}
+    return {"compressed": False, "compression": None}
+
+
+def scan_log_page(
+    path: str, start: int = 0, count: int = 100, turn: int | None = None
+) -> dict[str, Any]:
+    """
+    Read a page of lines from a plain or archived log in a single streaming pass
+
+    Args:
+        path: Path to the log or archive
+        start: Index of the first line to return (ignored when ``turn`` is given)
+        count: Maximum number of lines to return
+        turn: Start the page at the first line of this turn instead
+
+    Returns:
+        dict: ``total_lines``, ``start`` (None if the turn was not found), ``lines``
+            and ``turns`` (turn number to first line index)
+    """
+    page_start: int | None = start if turn is None else None
+    lines: list[str] = []
+    turns: dict[int, int] = {}
+    total = 0
+    for index, line in enumerate(iter_log_lines(path)):
+        total = index + 1
+        match = TURN_LINE.match(line)
+        if match and int(match.group(1)) not in turns:
+            turns[int(match.group(1))] = index
+            if turn is not None and int(match.group(1)) == turn:
+                page_start = index
+        if page_start is not None and page_start <= index < page_start + count:
+            lines.append(line)
+    return {"total_lines": total, "start": page_start, "lines": lines, "turns": turns}
@@ -0,0 +1,266 @@
+"""
+Memory-mapped log file access for Twilight Helper Backend
+"""
+
+import mmap
+import os
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import TracebackType
+from typing import Any, NamedTuple
+
+from .fingerprint import Fingerprint, file_fingerprint, only_appended
+
+TURN_LINE = re.compile(rb"^Turn (\d+)\b", re.MULTILINE)
+
+
+class LineIndex(NamedTuple):
+    """Line start offsets of the first ``size`` bytes of a log file"""
+
+    size: int
+    starts: array  # array('Q')
+
+
+class LogReader:
+    """
+    Random access to the lines of a log file without reading it into memory.
+
+    The file is memory-mapped and a compact ``array('Q')`` of line start
+    offsets is built (8 bytes per line). When the file grows, ``refresh()``
+    only indexes the newly appended bytes.
+    """
+
+    def __init__(self, path: str, encoding: str = "utf-8", index: LineIndex | None = None) -> None:
+        """
+        Args:
+            path: Path to the log file
+            encoding: Encoding of the log's lines
+            index: Index of the same file from an earlier reader; only bytes
+                appended since are indexed
+        """
+        self.path = path
+        self.encoding = encoding
+        self._file = open(path, "rb")
+        self._mm: mmap.mmap | None = None
+        self._size = 0
+        self._starts = array("Q")
+        if index is not None:
+            self._size = index.size
+            self._starts = array("Q", index.starts)
+        self.refresh()
+
+    def __enter__(self) -> "LogReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map and the file handle"""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    @property
+    def size(self) -> int:
+        """Size of the mapped file in bytes"""
+        return self._size
+
+    def refresh(self) -> bool:
+        """
+        Pick up data appended to the file since the last refresh
+
+        Returns:
+            bool: True if the file changed size
+        """
+        size = os.fstat(self._file.fileno()).st_size
+        if size == self._size and (self._mm is not None or size == 0):
+            return False
+        changed = size != self._size
+
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if size < self._size:
+            # Truncated or rewritten: index from scratch
+            self._starts = array("Q")
+        self._size = size
+        if size == 0:
+            self._starts = array("Q")
+            return changed
+
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if not self._starts:
+            self._starts.append(0)
+        self._index_from(self._starts[-1])
+        return changed
+
+    def _index_from(self, pos: int) -> None:
+        assert self._mm is not None
+        find = self._mm.find
+        append = self._starts.append
+        while True:
+            newline = find(b"\n", pos)
+            if newline == -1:
+                return
+            pos = newline + 1
+            append(pos)
+
+    def __len__(self) -> int:
+        count = len(self._starts)
+        # A start at EOF is where the next line will begin, not a line
+        if count and self._starts[-1] >= self._size:
+            count -= 1
+        return count
+
+    def line_offset(self, index: int) -> int:
+        """Byte offset at which line ``index`` starts"""
+        if not 0 <= index < len(self):
+            raise IndexError(f"line {index} out of range")
+        return self._starts[index]
+
+    def line_bytes(self, index: int) -> bytes:
+        """Raw bytes of line ``index`` without its line ending"""
+        start = self.line_offset(index)
+        end = self._starts[index + 1] if index + 1 < len(self._starts) else self._size
+        assert self._mm is not None
+        return self._mm[start:end].rstrip(b"\r\n")
+
+    def line(self, index: int) -> str:
+        """Decoded text of line ``index`` without its line ending"""
+        return self.line_bytes(index).decode(self.encoding, errors="replace")
+
+    def lines(self, start: int = 0, stop: int | None = None) -> Iterator[str]:
+        """Iterate decoded lines in ``[start, stop)``"""
+        stop = len(self) if stop is None else min(stop, len(self))
+        for index in range(max(start, 0), stop):
+            yield self.line(index)
+
+    def tail(self, size: int) -> bytes:
+        """The last ``size`` bytes of the file"""
+        if self._mm is None:
+            return b""
+        return self._mm[max(self._size - size, 0) : self._size]
+
+    def turn_boundaries(self) -> dict[int, int]:
+        """
+        Find where each turn starts
+
+        Returns:
+            dict: Turn number to the index of the first line mentioning that turn
+        """
+        boundaries: dict[int, int] = {}
+        if self._mm is None:
+            return boundaries
+        # The regex runs directly over the mapped pages, without copying lines out
+        for match in TURN_LINE.finditer(self._mm):
+            turn = int(match.group(1))
+            if turn not in boundaries:
+                boundaries[turn] = bisect_right(self._starts, match.start()) - 1
+        return boundaries
+
+    def index_nbytes(self) -> int:
+        """Memory used by the line-offset index in bytes"""
+        return len(self._starts) * self._starts.itemsize
+
+    def line_index(self) -> LineIndex:
+        """A copy of the line index, to resume from in a later reader"""
+        return LineIndex(self._size, array("Q", self._starts))
+
+
+class _CachedIndex(NamedTuple):
+    fingerprint: Fingerprint
+    lines: LineIndex
+    turns: dict[int, int]
+
+
+class LogIndexCache:
+    """
+    Line indexes and turn boundaries of recently read logs, keyed by fingerprint.
+
+    Paging through a log reuses its index while the log is unchanged, and
+    only indexes the appended bytes once it grew. No file handles are kept
+    open between reads, so logs can still be moved or deleted.
+    """
+
+    def __init__(self, max_entries: int = 8) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, _CachedIndex] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @contextmanager
+    def open(self, path: str) -> Iterator[tuple[LogReader, dict[int, int]]]:
+        """
+        Open a reader on a log, resuming from its cached index
+
+        Args:
+            path: Path to the log file
+
+        Yields:
+            tuple: The reader and the log's turn boundaries
+        """
+        fingerprint = file_fingerprint(path)
+        with self._lock:
+            cached = self._entries.get(path)
+            if cached is not None and cached.fingerprint == fingerprint:
+                self._hits += 1
+                self._entries.move_to_end(path)
+                hit = True
+            else:
+                self._misses += 1
+                hit = False
+
+        if cached is not None and hit:
+            with LogReader(path, index=cached.lines) as reader:
+                yield reader, cached.turns
+            return
+
+        index = None
+        if cached is not None and only_appended(path, cached.fingerprint):
+            index = cached.lines
+        with LogReader(path, index=index) as reader:
+            turns = reader.turn_boundaries()
+            # Only cache what the fingerprint describes, not a line appended since
+            if fingerprint is not None and reader.size == fingerprint.size:
+                with self._lock:
+                    self._entries[path] = _CachedIndex(fingerprint, reader.line_index(), turns)
+                    self._entries.move_to_end(path)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            yield reader, turns
+
+    def clear(self) -> None:
+        """Drop every cached index"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            dict: Cached indexes, their size in bytes, limit and hit/miss counters
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "index_bytes": sum(
+                    len(e.lines.starts) * e.lines.starts.itemsize for e in self._entries.values()
+                ),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
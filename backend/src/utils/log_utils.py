@@ -4,14 +4,83 @@ Log file utilities for Twilight Helper Backend
 
 import logging
 import os
+import threading
+import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-from ..config.config_manager import config_manager
+from ..config.config_manager import ConfigChange, config_manager
 from ..models.game_data import ConfigModel
+from .log_archive import LOG_SUFFIXES
 
 logger = logging.getLogger(__name__)
 
+# Backoff before checking a missing configured log file or directory again,
+# doubled per miss; a configuration change checks again right away
+MISSING_RECHECK_SECONDS = 1.0
+MISSING_RECHECK_MAX_SECONDS = 10.0
+
+
+class MissingPaths:
+    """
+    Negative cache of configured paths found missing
+
+    Every status poll resolves the configured log, so a missing file or
+    directory would otherwise be stat'ed and reported on every request.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        # path -> (current backoff, time of the next check)
+        self._missing: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._missing
+
+    def exists(self, path: str, check: Callable[[str], bool] | None = None) -> bool:
+        """
+        Whether a path exists, answering "no" from the cache during its backoff
+
+        Args:
+            path: Path to check
+            check: Existence test (``os.path.exists`` by default)
+
+        Returns:
+            bool: Whether the path was found
+        """
+        now = self._clock()
+        with self._lock:
+            missing = self._missing.get(path)
+        if missing is not None and now < missing[1]:
+            return False
+        found = (check or os.path.exists)(path)
+        with self._lock:
+            if found:
+                self._missing.pop(path, None)
+            else:
+                backoff = (
+                    MISSING_RECHECK_SECONDS
+                    if missing is None
+                    else min(missing[0] * 2, MISSING_RECHECK_MAX_SECONDS)
+                )
+                self._missing[path] = (backoff, now + backoff)
+        return found
+
+    def clear(self) -> None:
+        """Forget every missing path"""
+        with self._lock:
+            self._missing.clear()
+
+    def on_config_change(self, change: ConfigChange) -> None:
+        """Check the newly configured paths right away"""
+        self.clear()
+
+
+missing_paths = MissingPaths()
+config_manager.subscribe(missing_paths.on_config_change)
+
 
 def get_latest_log_file() -> str | None:
     """
@@ -22,11 +91,11 @@ def get_latest_log_file() -> str | None:
     """
     try:
         config: ConfigModel = config_manager.load_config()
-        logger.info(f"Loaded config: {config}")
+        logger.info("Loaded config: %s", config)
 
         # If a specific log file is configured, use it
         if config.log_file_path:
-            logger.info(f"Specific log file configured: {config.log_file_path}")
+            logger.info("Specific log file configured: %s", config.log_file_path)
             # Construct full path if it's just a filename
             if os.path.isabs(config.log_file_path):
                 # It's already a full path
@@ -36,22 +105,26 @@ def get_latest_log_file() -> str | None:
                 log_dir = Path(config.log_directory or config_manager.get_default_log_directory())
                 log_file_path = str(log_dir / config.log_file_path)
 
-            logger.info(f"Constructed full path: {log_file_path}")
-            if os.path.exists(log_file_path):
-                logger.info(f"Using configured log file: {log_file_path}")
+            logger.info("Constructed full path: %s", log_file_path)
+            reported = log_file_path in missing_paths
+            if missing_paths.exists(log_file_path):
+                logger.info("Using configured log file: %s", log_file_path)
                 return log_file_path
             else:
-                logger.error(f"Configured log file not found: {log_file_path}")
+                if not reported:
+                    logger.error("Configured log file not found: %s", log_file_path)
                 return None  # Don't fall back, return None immediately
         else:
             logger.info("No specific log file configured, using most recent")
 
         # Otherwise, use the configured directory or default
         log_dir = Path(config.log_directory or config_manager.get_default_log_directory())
-        logger.info(f"Looking for log files in: {log_dir}")
+        logger.info("Looking for log files in: %s", log_dir)
 
-        if not log_dir.exists():
-            logger.error(f"Log directory not found at {log_dir}")
+        reported = str(log_dir) in missing_paths
+        if not missing_paths.exists(str(log_dir), lambda _: log_dir.exists()):
+            if not reported:
+                logger.error("Log directory not found at %s", log_dir)
             return None
 
         # Get all .txt files in the directory
@@ -63,13 +136,40 @@ def get_latest_log_file() -> str | None:
 
         # Sort by modification time and get the most recent
         latest_log = max(log_files, key=lambda x: x.stat().st_mtime)
-        logger.info(f"Found latest log file: {latest_log}")
+        logger.info("Found latest log file: %s", latest_log)
         return str(latest_log)
     except Exception as e:
-        logger.error(f"Error finding log file: {str(e)}", exc_info=True)
+        logger.error("Error finding log file: %s", e, exc_info=True)
         return None
 
 
+def list_log_files(
+    log_dir: str | Path, modified_after: float | None = None, include_archives: bool = True
+) -> list[os.DirEntry[str]]:
+    """
+    List the log files in a directory, most recently modified first
+
+    Args:
+        log_dir: Directory to scan
+        modified_after: Only include files modified after this epoch time
+        include_archives: Also include compressed .txt.gz/.txt.bz2/.txt.xz archives
+
+    Returns:
+        list: Directory entries of the matching log files (empty if the directory is missing)
+    """
+    suffixes = LOG_SUFFIXES if include_archives else (".txt",)
+    try:
+        with os.scandir(log_dir) as it:
+            entries = [e for e in it if e.name.endswith(suffixes) and e.is_file()]
+    except OSError:
+        return []
+
+    if modified_after is not None:
+        entries = [e for e in entries if e.stat().st_mtime > modified_after]
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return entries
+
+
 def get_log_directory_info() -> dict[str, Any]:
     """
     Get information about the log directory and available log files
@@ -0,0 +1,155 @@
+"""
+Logging pipeline for Twilight Helper Backend
+
+Records are handed to a queue in the request thread and laid out and
+written by a background listener, so enabling diagnostics never blocks a
+request on disk I/O.
+"""
+
+import atexit
+import copy
+import logging
+import os
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+LOG_FILE_NAME = "twilight-helper-backend.log"
+
+# Rotate the log file at 5 MB, keeping three old files
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# Repetitive DEBUG lines (such as one per formatted card) pass 1 in N times
+DEBUG_SAMPLE_EVERY = int(os.environ.get("LOG_DEBUG_SAMPLE_EVERY", "50"))
+
+# Message templates whose DEBUG records are counted for sampling at once
+DEBUG_SAMPLE_MAX_TEMPLATES = 1024
+
+_listener: QueueListener | None = None
+_exception_formatter = logging.Formatter()
+_queue_handler: QueueHandler | None = None
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves the record's layout to the listener thread.
+
+    Like the stock QueueHandler, the message is merged with its arguments
+    and any traceback rendered before the record is enqueued, since the
+    arguments may change (or hold frames alive) by the time the listener
+    gets to it. Unlike it, the timestamp and level prefix are applied by the
+    listener's handlers rather than on the request thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # The listener's formatter appends exc_text as it is
+            if not record.exc_text:
+                record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class SampledDebugFilter(logging.Filter):
+    """
+    Lets through only every Nth DEBUG record per message template.
+
+    Records above DEBUG always pass. Counting by template (``record.msg``)
+    rather than by formatted text works because messages are logged lazily
+    with %-style arguments. At most ``max_templates`` templates are counted;
+    the oldest one is forgotten to make room for a new one.
+    """
+
+    def __init__(
+        self, every: int = DEBUG_SAMPLE_EVERY, max_templates: int = DEBUG_SAMPLE_MAX_TEMPLATES
+    ) -> None:
+        super().__init__()
+        self.every = max(every, 1)
+        self.max_templates = max_templates
+        self._counts: dict[object, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.every == 1:
+            return True
+        with self._lock:
+            count = self._counts.get(record.msg)
+            if count is None:
+                count = 0
+                if len(self._counts) >= self.max_templates:
+                    # Dicts keep insertion order, so this is the oldest template
+                    del self._counts[next(iter(self._counts))]
+            self._counts[record.msg] = count + 1
+        return count % self.every == 0
+
+
+def configure_logging(debug: bool, logs_dir: str | None = None) -> QueueListener | None:
+    """
+    Configure the root logger
+
+    With debug disabled logging is effectively turned off. With debug
+    enabled, records go through a queue to a background listener that writes
+    a size-rotated log file and stdout.
+
+    Args:
+        debug: Whether diagnostics logging is enabled
+        logs_dir: Directory for the log file (required when debug is enabled)
+
+    Returns:
+        QueueListener: The running listener, or None when debug is disabled
+    """
+    global _listener, _queue_handler
+
+    stop_logging()
+    root = logging.getLogger()
+
+    if not debug or logs_dir is None:
+        logging.basicConfig(level=logging.CRITICAL)  # Effectively disables logging
+        return None
+
+    os.makedirs(logs_dir, exist_ok=True)
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    file_handler = RotatingFileHandler(
+        os.path.join(logs_dir, LOG_FILE_NAME),
+        maxBytes=LOG_MAX_BYTES,
+        backupCount=LOG_BACKUP_COUNT,
+        encoding="utf-8",
+    )
+    stream_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    _queue_handler = DeferredQueueHandler(log_queue)
+    root.addHandler(_queue_handler)
+    root.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+
+    _listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background listener, if any"""
+    global _listener, _queue_handler
+
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,169 @@
+"""
+Memory diagnostics for Twilight Helper Backend
+
+The backend runs for whole gaming sessions inside Electron, so unbounded
+growth in a cache or in retained parser objects has to be visible before
+users notice it. ``MemoryDiagnostics`` reports the process RSS and, while
+tracemalloc is tracing, the top allocation sites and how they changed
+since the previous report.
+"""
+
+import gc
+import os
+import sys
+import threading
+import tracemalloc
+from typing import Any
+
+# Frames kept per traced allocation when tracing is started here
+TRACEMALLOC_FRAMES = int(os.environ.get("TRACEMALLOC_FRAMES", "1"))
+
+# Allocations made by tracemalloc itself and by this module are not reported
+_IGNORED = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+)
+
+
+def _windows_rss() -> int | None:
+    import ctypes
+    from ctypes import wintypes
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    process = ctypes.windll.kernel32.GetCurrentProcess()  # type: ignore[attr-defined]
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(  # type: ignore[attr-defined]
+        process, ctypes.byref(counters), counters.cb
+    ):
+        return None
+    return int(counters.WorkingSetSize)
+
+
+def rss_bytes() -> int | None:
+    """
+    Resident set size of this process
+
+    Returns:
+        int: Current RSS in bytes, or None where it cannot be read (macOS)
+    """
+    try:
+        if sys.platform.startswith("win"):
+            return _windows_rss()
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def peak_rss_bytes() -> int | None:
+    """
+    Highest RSS this process has reached
+
+    Returns:
+        int: Peak RSS in bytes, or None where it cannot be read (Windows)
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+class MemoryDiagnostics:
+    """
+    Builds memory reports, keeping the previous tracemalloc snapshot so each
+    report can show what grew since the last one.
+
+    Tracing costs memory and CPU, so it only runs once a report asked for it
+    (or when Python was started with ``-X tracemalloc``).
+    """
+
+    def __init__(self, top: int = 20) -> None:
+        self.top = top
+        self._previous: tracemalloc.Snapshot | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        """Whether tracemalloc is tracing allocations"""
+        return tracemalloc.is_tracing()
+
+    def start(self) -> None:
+        """Start tracing allocations (no-op if already tracing)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+
+    def stop(self) -> None:
+        """Stop tracing and forget the previous snapshot"""
+        with self._lock:
+            self._previous = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def report(self, top: int | None = None) -> dict[str, Any]:
+        """
+        Build a memory report
+
+        Args:
+            top: Number of allocation sites to list (the configured default otherwise)
+
+        Returns:
+            dict: RSS, garbage collector counts and, while tracing, the
+                traced total, the top allocation sites and the sites that
+                changed the most since the previous report
+        """
+        limit = self.top if top is None else top
+        report: dict[str, Any] = {
+            "rss_bytes": rss_bytes(),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "gc": {"counts": list(gc.get_count()), "objects": len(gc.get_objects())},
+            "tracing": tracemalloc.is_tracing(),
+        }
+        if not tracemalloc.is_tracing():
+            return report
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+        current, peak = tracemalloc.get_traced_memory()
+        with self._lock:
+            previous, self._previous = self._previous, snapshot
+
+        report["traced_bytes"] = current
+        report["traced_peak_bytes"] = peak
+        report["top"] = [
+            {"site": _site(stat.traceback), "size_bytes": stat.size, "count": stat.count}
+            for stat in snapshot.statistics("lineno")[:limit]
+        ]
+        if previous is not None:
+            report["diff"] = [
+                {
+                    "site": _site(stat.traceback),
+                    "size_bytes": stat.size,
+                    "size_diff_bytes": stat.size_diff,
+                    "count_diff": stat.count_diff,
+                }
+                for stat in snapshot.compare_to(previous, "lineno")[:limit]
+                if stat.size_diff or stat.count_diff
+            ]
+        return report
+
+
+def _site(traceback: tracemalloc.Traceback) -> str:
+    frame = traceback[0]
+    return f"{frame.filename}:{frame.lineno}"
@@ -0,0 +1,195 @@
+"""
+MessagePack encoding for Twilight Helper Backend
+
+A small stdlib-only implementation of the MessagePack format covering the
+types that appear in API payloads. When the ``msgpack`` package is
+installed its C implementation is used instead.
+"""
+
+import struct
+from typing import Any
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; the pure-Python codec is always available
+    msgpack = None
+
+MSGPACK_MIMETYPE = "application/msgpack"
+
+# Name of the implementation in use, for diagnostics and benchmarks
+BACKEND = "msgpack" if msgpack is not None else "stdlib"
+
+
+def _pack_int(value: int, out: bytearray) -> None:  # noqa: C901 - one branch per int width
+    if 0 <= value <= 0x7F:
+        out.append(value)
+    elif -32 <= value < 0:
+        out.append(value & 0xFF)
+    elif 0 <= value <= 0xFF:
+        out += b"\xcc" + struct.pack(">B", value)
+    elif 0 <= value <= 0xFFFF:
+        out += b"\xcd" + struct.pack(">H", value)
+    elif 0 <= value <= 0xFFFFFFFF:
+        out += b"\xce" + struct.pack(">I", value)
+    elif 0 <= value <= 0xFFFFFFFFFFFFFFFF:
+        out += b"\xcf" + struct.pack(">Q", value)
+    elif -0x80 <= value:
+        out += b"\xd0" + struct.pack(">b", value)
+    elif -0x8000 <= value:
+        out += b"\xd1" + struct.pack(">h", value)
+    elif -0x80000000 <= value:
+        out += b"\xd2" + struct.pack(">i", value)
+    elif -0x8000000000000000 <= value:
+        out += b"\xd3" + struct.pack(">q", value)
+    else:
+        raise OverflowError(f"integer {value} is out of MessagePack range")
+
+
+def _pack_header(size: int, fix: int, fix_max: int, codes: bytes, out: bytearray) -> None:
+    """Write a str/bin/array/map length header; ``codes`` holds the 8/16/32-bit type bytes"""
+    if fix and size <= fix_max:
+        out.append(fix | size)
+    elif codes[0] and size <= 0xFF:
+        out += bytes((codes[0], size))
+    elif size <= 0xFFFF:
+        out += bytes((codes[1],)) + struct.pack(">H", size)
+    elif size <= 0xFFFFFFFF:
+        out += bytes((codes[2],)) + struct.pack(">I", size)
+    else:
+        raise OverflowError("object is too large for MessagePack")
+
+
+def _pack(obj: Any, out: bytearray) -> None:  # noqa: C901 - one branch per type
+    # Strings and small ints dominate API payloads, so they are checked first
+    if isinstance(obj, str):
+        data = obj.encode("utf-8")
+        if len(data) <= 31:
+            out.append(0xA0 | len(data))
+        else:
+            _pack_header(len(data), 0xA0, 31, b"\xd9\xda\xdb", out)
+        out += data
+    elif obj is None:
+        out.append(0xC0)
+    elif obj is True:
+        out.append(0xC3)
+    elif obj is False:
+        out.append(0xC2)
+    elif isinstance(obj, int):
+        _pack_int(obj, out)
+    elif isinstance(obj, dict):
+        _pack_header(len(obj), 0x80, 15, b"\x00\xde\xdf", out)
+        for key, value in obj.items():
+            _pack(key, out)
+            _pack(value, out)
+    elif isinstance(obj, (list, tuple)):
+        _pack_header(len(obj), 0x90, 15, b"\x00\xdc\xdd", out)
+        for item in obj:
+            _pack(item, out)
+    elif isinstance(obj, float):
+        out += b"\xcb" + struct.pack(">d", obj)
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        data = bytes(obj)
+        _pack_header(len(data), 0, 0, b"\xc4\xc5\xc6", out)
+        out += data
+    else:
+        raise TypeError(f"can not serialize {type(obj).__name__!r} object")
+
+
+def packb(obj: Any) -> bytes:
+    """
+    Encode an object as MessagePack
+
+    Args:
+        obj: None, bool, int, float, str, bytes, or lists/tuples/dicts of those
+
+    Returns:
+        bytes: The encoded object
+
+    Raises:
+        TypeError: If the object contains an unsupported type
+    """
+    if msgpack is not None:
+        return bytes(msgpack.packb(obj, use_bin_type=True))
+    out = bytearray()
+    _pack(obj, out)
+    return bytes(out)
+
+
+class _Unpacker:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+
+    def take(self, size: int) -> bytes:
+        end = self.pos + size
+        if end > len(self.data):
+            raise ValueError("truncated MessagePack data")
+        chunk = self.data[self.pos : end]
+        self.pos = end
+        return chunk
+
+    def unpack_from(self, fmt: str) -> Any:
+        return struct.unpack(fmt, self.take(struct.calcsize(fmt)))[0]
+
+    def unpack(self) -> Any:  # noqa: C901 - one branch per format family
+        code = self.take(1)[0]
+        if code <= 0x7F:
+            return code
+        if code >= 0xE0:
+            return code - 0x100
+        if 0xA0 <= code <= 0xBF:
+            return self.take(code & 0x1F).decode("utf-8")
+        if 0x90 <= code <= 0x9F:
+            return [self.unpack() for _ in range(code & 0x0F)]
+        if 0x80 <= code <= 0x8F:
+            return self.unpack_map(code & 0x0F)
+        simple = {0xC0: None, 0xC2: False, 0xC3: True}
+        if code in simple:
+            return simple[code]
+        numbers = {
+            0xCA: ">f", 0xCB: ">d",
+            0xCC: ">B", 0xCD: ">H", 0xCE: ">I", 0xCF: ">Q",
+            0xD0: ">b", 0xD1: ">h", 0xD2: ">i", 0xD3: ">q",
+        }  # fmt: skip
+        if code in numbers:
+            return self.unpack_from(numbers[code])
+        lengths = {0: ">B", 1: ">H", 2: ">I"}
+        if 0xD9 <= code <= 0xDB:
+            return self.take(self.unpack_from(lengths[code - 0xD9])).decode("utf-8")
+        if 0xC4 <= code <= 0xC6:
+            return self.take(self.unpack_from(lengths[code - 0xC4]))
+        if code in (0xDC, 0xDD):
+            return [self.unpack() for _ in range(self.unpack_from(lengths[code - 0xDB]))]
+        if code in (0xDE, 0xDF):
+            return self.unpack_map(self.unpack_from(lengths[code - 0xDD]))
+        raise ValueError(f"unsupported MessagePack type byte 0x{code:02x}")
+
+    def unpack_map(self, size: int) -> dict[Any, Any]:
+        result = {}
+        for _ in range(size):
+            key = self.unpack()
+            result[key] = self.unpack()
+        return result
+
+
+def unpackb(data: bytes) -> Any:
+    """
+    Decode a single MessagePack object
+
+    Args:
+        data: The encoded bytes
+
+    Returns:
+        object: The decoded object
+
+    Raises:
+        ValueError: If the data is truncated, has trailing bytes or uses an
+            unsupported type (such as extension types)
+    """
+    if msgpack is not None:
+        return msgpack.unpackb(data, raw=False)
+    unpacker = _Unpacker(bytes(data))
+    result = unpacker.unpack()
+    if unpacker.pos != len(unpacker.data):
+        raise ValueError("trailing data after MessagePack object")
+    return result
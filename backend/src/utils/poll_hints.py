@@ -0,0 +1,164 @@
+"""
+Adaptive polling hints for Twilight Helper Backend
+
+Clients poll the status endpoints on a fixed interval. The backend knows
+when the log last grew and how fast, so it recommends when to poll next:
+quickly during active play, backing off during pauses, and rarely once a
+game looks finished.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from flask import Response
+
+if TYPE_CHECKING:
+    from .game_state import GameStateEntry
+
+POLL_AFTER_HEADER = "X-Poll-After"
+
+# Growth faster than this (bytes per second) counts as rapid play
+FAST_GROWTH_BYTES_PER_SECOND = float(os.environ.get("POLL_FAST_GROWTH_BPS", "200"))
+
+# A log that grew within this many seconds is in active play
+ACTIVE_WINDOW_SECONDS = 30.0
+
+# A log idle for this long is treated as a finished game
+FINISHED_AFTER_SECONDS = 30 * 60.0
+
+
+class PollAdvisor:
+    """
+    Recommends the next poll interval for a log from its recent growth.
+
+    Every observed change of a log's (mtime, size) is recorded in a short
+    per-file history, kept for the ``max_logs`` most recently polled logs.
+    The hint is:
+
+    - ``fast_ms`` while the log grows faster than ``FAST_GROWTH_BYTES_PER_SECOND``
+    - ``active_ms`` while the log changed within ``ACTIVE_WINDOW_SECONDS``
+    - about a tenth of the idle time during pauses, capped at ``paused_max_ms``
+    - ``finished_ms`` after ``FINISHED_AFTER_SECONDS`` without changes
+    """
+
+    def __init__(
+        self,
+        fast_ms: int = 500,
+        active_ms: int = 1000,
+        paused_max_ms: int = 15000,
+        finished_ms: int = 60000,
+        history: int = 8,
+        max_logs: int = 32,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.fast_ms = fast_ms
+        self.active_ms = active_ms
+        self.paused_max_ms = paused_max_ms
+        self.finished_ms = finished_ms
+        self.history = history
+        self.max_logs = max_logs
+        self._clock = clock
+        self._samples: OrderedDict[str, deque[tuple[float, int]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def observe(self, path: str, mtime: float, size: int) -> None:
+        """
+        Record the current modification time and size of a log
+
+        Args:
+            path: Path to the log file
+            mtime: Modification time (epoch seconds)
+            size: Size in bytes
+        """
+        with self._lock:
+            samples = self._samples.setdefault(path, deque(maxlen=self.history))
+            self._samples.move_to_end(path)
+            if not samples or samples[-1] != (mtime, size):
+                samples.append((mtime, size))
+            while len(self._samples) > self.max_logs:
+                self._samples.popitem(last=False)
+
+    def growth_rate(self, path: str) -> float:
+        """
+        Recent growth of a log in bytes per second
+
+        Args:
+            path: Path to the log file
+
+        Returns:
+            float: Growth over the active window, 0.0 if unknown
+        """
+        now = self._clock()
+        with self._lock:
+            recent = [s for s in self._samples.get(path, ()) if now - s[0] <= ACTIVE_WINDOW_SECONDS]
+        if len(recent) < 2:
+            return 0.0
+        elapsed = max(recent[-1][0] - recent[0][0], 1.0)
+        return max(recent[-1][1] - recent[0][1], 0) / elapsed
+
+    def poll_after_ms(self, path: str, mtime: float, size: int) -> int:
+        """
+        Observe a log and recommend when to poll it next
+
+        Args:
+            path: Path to the log file
+            mtime: Modification time (epoch seconds)
+            size: Size in bytes
+
+        Returns:
+            int: Recommended delay before the next poll, in milliseconds
+        """
+        self.observe(path, mtime, size)
+        idle = max(self._clock() - mtime, 0.0)
+        if idle >= FINISHED_AFTER_SECONDS:
+            return self.finished_ms
+        if idle <= ACTIVE_WINDOW_SECONDS:
+            if self.growth_rate(path) >= FAST_GROWTH_BYTES_PER_SECOND:
+                return self.fast_ms
+            return self.active_ms
+        return int(min(max(idle * 100, self.active_ms), self.paused_max_ms))
+
+    def forget(self, path: str | None = None) -> None:
+        """Drop the history of one log, or of every log when no path is given"""
+        with self._lock:
+            if path is None:
+                self._samples.clear()
+            else:
+                self._samples.pop(path, None)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get advisor statistics
+
+        Returns:
+            dict: Number of logs with recorded history
+        """
+        with self._lock:
+            return {"tracked_logs": len(self._samples)}
+
+
+def apply_poll_hint(response: Response, advisor: PollAdvisor, entry: "GameStateEntry") -> Response:
+    """
+    Add the ``X-Poll-After`` header (milliseconds) for a game state response
+
+    The hint is a header rather than a body field so the serialized body of
+    a state version stays identical across polls.
+
+    Args:
+        response: The status response
+        advisor: The app's poll advisor
+        entry: Cache entry the response was built from
+
+    Returns:
+        Response: The same response
+    """
+    fingerprint = entry.fingerprint
+    if fingerprint.mtime_ns:
+        response.headers[POLL_AFTER_HEADER] = str(
+            advisor.poll_after_ms(entry.path, fingerprint.mtime, fingerprint.size)
+        )
+    return response
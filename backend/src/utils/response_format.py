@@ -0,0 +1,180 @@
+"""
+Response format negotiation and serialization for Twilight Helper Backend
+"""
+
+import json
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from flask import Response, request
+
+from .card_views import CardView, render_view
+from .msgpack_codec import MSGPACK_MIMETYPE, packb
+from .server_timing import tag_timing, timed
+
+if TYPE_CHECKING:
+    from .game_state import GameStateEntry
+
+_fast_dumps: Callable[[Any], bytes] | None
+try:
+    from orjson import dumps as _fast_dumps
+except ImportError:  # orjson is optional; the stdlib encoder is always available
+    _fast_dumps = None
+
+JSON_MIMETYPE = "application/json"
+
+# Media types clients may use to ask for MessagePack
+MSGPACK_MIMETYPES = (MSGPACK_MIMETYPE, "application/x-msgpack")
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Encode a payload as compact UTF-8 JSON
+
+    Uses orjson when it is installed and the stdlib encoder otherwise.
+
+    Args:
+        data: JSON-compatible payload
+
+    Returns:
+        bytes: The encoded payload
+    """
+    if _fast_dumps is not None:
+        return _fast_dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def wants_msgpack() -> bool:
+    """
+    Whether the current request asked for a MessagePack body
+
+    Clients opt in with ``?format=msgpack`` or an ``Accept`` header that
+    prefers ``application/msgpack`` over JSON. ``*/*`` keeps JSON.
+    """
+    requested = request.args.get("format")
+    if requested is not None:
+        return requested.lower() == "msgpack"
+    best = request.accept_mimetypes.best_match([JSON_MIMETYPE, *MSGPACK_MIMETYPES])
+    return best in MSGPACK_MIMETYPES
+
+
+def _negotiated_format() -> str:
+    return "msgpack" if wants_msgpack() else "json"
+
+
+def _encode(data: Any, fmt: str) -> bytes:
+    return packb(data) if fmt == "msgpack" else dumps_json(data)
+
+
+def bytes_response(body: bytes, fmt: str, status: int = 200) -> Response:
+    """
+    Wrap an already serialized body in a response
+
+    Args:
+        body: The encoded payload
+        fmt: "json" or "msgpack"
+        status: HTTP status code
+
+    Returns:
+        Response: Response with the matching mimetype and Content-Length
+    """
+    mimetype = MSGPACK_MIMETYPE if fmt == "msgpack" else JSON_MIMETYPE
+    response = Response(body, status=status, mimetype=mimetype)
+    response.headers["Content-Length"] = str(len(body))
+    response.vary.add("Accept")
+    return response
+
+
+def payload_response(data: Any) -> Response:
+    """
+    Build a response body in the format the client negotiated
+
+    Args:
+        data: JSON-compatible payload (e.g. the output of ``model_dump()``)
+
+    Returns:
+        Response: A MessagePack or JSON response
+    """
+    fmt = _negotiated_format()
+    return bytes_response(_encode(data, fmt), fmt)
+
+
+def encode_entry(entry: "GameStateEntry", fmt: str, view: CardView | None = None) -> bytes:
+    """
+    Get the serialized body of a cached game state, encoding it on first use
+
+    Args:
+        entry: Cache entry of the game state
+        fmt: "json" or "msgpack"
+        view: Requested sorted/grouped view (the plain status by default)
+
+    Returns:
+        bytes: The encoded payload, shared by every request for this version
+    """
+    view = view or CardView()
+    key = (fmt, view.key)
+    body = entry.encoded.get(key)
+    if body is None:
+        tag_timing("body", "miss")
+        # Only the card lists a projection asks for are looked up; the body is
+        # encoded straight from the record, without building pydantic models
+        with timed("format"):
+            record = entry.snapshot.record(view.fields)
+        with timed("serialize"):
+            payload = record.to_dict() if view.is_default else render_view(record, view)
+            body = _encode(payload, fmt)
+        entry.encoded[key] = body
+    else:
+        tag_timing("body", "hit")
+    return body
+
+
+def entry_etag(entry: "GameStateEntry", fmt: str, view: CardView | None = None) -> str | None:
+    """
+    Get the entity tag of a cached game state's body
+
+    The body is fully determined by the log's contents, the format and the
+    view, so the tag is built from those without encoding anything.
+
+    Args:
+        entry: Cache entry of the game state
+        fmt: "json" or "msgpack"
+        view: Requested sorted/grouped view (the plain status by default)
+
+    Returns:
+        str: The tag, or None if the log could not be fingerprinted
+    """
+    if not entry.fingerprint.mtime_ns:
+        return None
+    view = view or CardView()
+    return f"{entry.fingerprint.token}-{fmt}-{view.key}"
+
+
+def entry_response(entry: "GameStateEntry", view: CardView | None = None) -> Response:
+    """
+    Build the response for a cached game state, serializing it at most once
+    per format and view
+
+    Every poller of an unchanged state version is served the same bytes, so
+    ``to_dict()``, sorting, grouping and encoding only run when the state
+    changes. Clients that send back the ``ETag`` of the version they have
+    get an empty 304 instead.
+
+    Args:
+        entry: Cache entry of the game state to return
+        view: Requested sorted/grouped view (the plain status by default)
+
+    Returns:
+        Response: A MessagePack or JSON response, or 304 Not Modified
+    """
+    fmt = _negotiated_format()
+    etag = entry_etag(entry, fmt, view)
+    if etag is not None and request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.vary.add("Accept")
+    else:
+        response = bytes_response(encode_entry(entry, fmt, view), fmt)
+    if etag is not None:
+        # Weak: the compressor may still re-encode the body after this
+        response.set_etag(etag, weak=True)
+    return response
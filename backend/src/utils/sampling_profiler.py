@@ -0,0 +1,163 @@
+"""
+Low-overhead statistical sampling profiler for Twilight Helper Backend
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Default sampling rate; set SAMPLING_PROFILER_HZ=0 to disable the profiler
+DEFAULT_SAMPLE_HZ = float(os.environ.get("SAMPLING_PROFILER_HZ", "100"))
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of all running threads from a background thread and
+    aggregates them as folded (collapsed) stacks for flamegraph tooling.
+
+    The sampler measures the time it spends taking each sample and stretches
+    its sleep so that sampling never uses more than ``max_overhead`` of one
+    CPU, which keeps it cheap enough to leave running for a whole session.
+    """
+
+    def __init__(
+        self,
+        sample_hz: float = DEFAULT_SAMPLE_HZ,
+        max_overhead: float = 0.01,
+        max_depth: int = 64,
+        max_stacks: int = 10000,
+    ) -> None:
+        self.sample_hz = sample_hz
+        self.max_overhead = max_overhead
+        self.max_depth = max_depth
+        self.max_stacks = max_stacks
+
+        self._stacks: Counter[str] = Counter()
+        self._labels: dict[CodeType, str] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._samples = 0
+        self._dropped = 0
+        self._sampling_time = 0.0
+        self._started_at: float | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the profiler is configured to take samples at all"""
+        return self.sample_hz > 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the background sampling thread is alive"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the background sampling thread (no-op if already running or disabled)"""
+        if not self.enabled or self.is_running:
+            return
+        self._stop_event.clear()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        logger.info("Sampling profiler started at %s Hz", self.sample_hz)
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Stop the background sampling thread"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self._thread = None
+
+    def reset(self) -> None:
+        """Discard all collected samples"""
+        with self._lock:
+            self._stacks.clear()
+            self._samples = 0
+            self._dropped = 0
+            self._sampling_time = 0.0
+            self._started_at = time.perf_counter() if self.is_running else None
+
+    def _run(self) -> None:
+        interval = 1.0 / self.sample_hz
+        own_ident = threading.get_ident()
+        while not self._stop_event.is_set():
+            started = time.perf_counter()
+            try:
+                self.sample_once(exclude=own_ident)
+            except Exception as e:
+                logger.error("Sampling profiler failed to take a sample: %s", e)
+            cost = time.perf_counter() - started
+            self._sampling_time += cost
+            # Back off when a sample is expensive so we stay under the overhead budget
+            self._stop_event.wait(max(interval, cost / self.max_overhead))
+
+    def sample_once(self, exclude: int | None = None) -> None:
+        """Take one sample of every thread's current stack"""
+        frames = sys._current_frames()
+        stacks = [self._fold(frame) for ident, frame in frames.items() if ident != exclude]
+        del frames
+
+        with self._lock:
+            self._samples += 1
+            for stack in stacks:
+                if stack in self._stacks or len(self._stacks) < self.max_stacks:
+                    self._stacks[stack] += 1
+                else:
+                    self._dropped += 1
+
+    def _fold(self, frame: FrameType | None) -> str:
+        labels: list[str] = []
+        while frame is not None and len(labels) < self.max_depth:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                filename = os.path.basename(code.co_filename)
+                label = f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+                self._labels[code] = label
+            labels.append(label)
+            frame = frame.f_back
+        labels.reverse()
+        return ";".join(labels)
+
+    def collapsed(self) -> str:
+        """
+        Export collected samples in collapsed-stack format
+
+        Returns:
+            str: One ``frame;frame;frame count`` line per distinct stack
+        """
+        with self._lock:
+            items = sorted(self._stacks.items())
+        return "".join(f"{stack} {count}\n" for stack, count in items)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get sampler statistics
+
+        Returns:
+            dict: Sample counts, distinct stacks and measured CPU overhead
+        """
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "running": self.is_running,
+                "sample_hz": self.sample_hz,
+                "samples": self._samples,
+                "distinct_stacks": len(self._stacks),
+                "dropped_samples": self._dropped,
+                "overhead": self._sampling_time / elapsed if elapsed else 0.0,
+            }
+
+
+# Global sampling profiler instance
+sampling_profiler = SamplingProfiler()
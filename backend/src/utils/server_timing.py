@@ -0,0 +1,107 @@
+"""
+W3C Server-Timing headers for Twilight Helper Backend
+
+Browser devtools show the ``Server-Timing`` header of a response as a
+per-stage breakdown, so a slow poll can be explained without turning on
+backend file logging. Stages are recorded with ``timed(name)`` anywhere in
+the request's call stack; outside a timed request it does nothing.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from flask import Response
+
+SERVER_TIMING_HEADER = "Server-Timing"
+
+_current: ContextVar["ServerTiming | None"] = ContextVar("server_timing", default=None)
+
+
+class ServerTiming:
+    """Stage durations and tags of one request, in the order first recorded"""
+
+    def __init__(self) -> None:
+        self._durations: dict[str, float] = {}
+        self._tags: dict[str, str] = {}
+        self._started = time.perf_counter()
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add time to a stage (a stage timed twice is summed)"""
+        self._durations[name] = self._durations.get(name, 0.0) + seconds
+
+    def tag(self, name: str, value: str) -> None:
+        """Attach a description-only metric, e.g. ``cache`` = ``hit``"""
+        self._tags[name] = value
+
+    @property
+    def durations(self) -> dict[str, float]:
+        """Recorded stage durations in seconds"""
+        return dict(self._durations)
+
+    @property
+    def tags(self) -> dict[str, str]:
+        """Recorded tags"""
+        return dict(self._tags)
+
+    def header(self) -> str:
+        """
+        Render the header value
+
+        Returns:
+            str: e.g. ``config;dur=0.05, parse;dur=12.40, cache;desc="miss", total;dur=13.10``
+        """
+        metrics = [f"{name};dur={seconds * 1000:.2f}" for name, seconds in self._durations.items()]
+        metrics += [f'{name};desc="{value}"' for name, value in self._tags.items()]
+        metrics.append(f"total;dur={(time.perf_counter() - self._started) * 1000:.2f}")
+        return ", ".join(metrics)
+
+    @contextmanager
+    def activate(self) -> Iterator["ServerTiming"]:
+        """Make this the timing that ``timed`` and ``tag_timing`` record into"""
+        token = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+
+    def apply(self, response: "Response") -> "Response":
+        """
+        Add the ``Server-Timing`` header to a response
+
+        ``Timing-Allow-Origin`` lets the renderer, served from another
+        origin, read the timings through the Resource Timing API too.
+
+        Args:
+            response: The response to annotate
+
+        Returns:
+            Response: The same response
+        """
+        response.headers[SERVER_TIMING_HEADER] = self.header()
+        response.headers["Timing-Allow-Origin"] = "*"
+        return response
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Time a stage of the current request, if the request is being timed"""
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.add(name, time.perf_counter() - started)
+
+
+def tag_timing(name: str, value: str) -> None:
+    """Tag the current request's timing, if the request is being timed"""
+    timing = _current.get()
+    if timing is not None:
+        timing.tag(name, value)
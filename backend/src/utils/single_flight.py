@@ -0,0 +1,89 @@
+"""
+Request coalescing for Twilight Helper Backend
+"""
+
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """
+    Runs at most one call per key at a time.
+
+    Callers that arrive while a call for the same key is in flight wait for
+    it and share its result (or its exception) instead of repeating the work.
+    Nothing is cached once the call completes.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call[T]] = {}
+        self._lock = threading.Lock()
+        self._executed = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> tuple[T, bool]:
+        """
+        Run ``func`` unless a call for ``key`` is already running
+
+        Args:
+            key: Identity of the work, e.g. (path, fingerprint)
+            func: Zero-argument callable doing the work
+
+        Returns:
+            tuple: The result, and whether it was shared from another caller
+
+        Raises:
+            Exception: Whatever ``func`` raised, in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True  # type: ignore[return-value]
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get coalescing statistics
+
+        Returns:
+            dict: Calls executed, calls that shared a result and calls in flight
+        """
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "shared": self._shared,
+                "in_flight": len(self._calls),
+            }
@@ -0,0 +1,231 @@
+"""
+Persistent on-disk snapshot cache for Twilight Helper Backend
+
+The formatted status of every parsed log is stored under the app data
+directory, keyed by the log's path and validated by its content
+fingerprint. After a restart, or when an old log is opened again, the
+status is loaded in milliseconds instead of re-running the log parser.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import zlib
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from ..models.game_data import StatusRecord
+from .msgpack_codec import packb, unpackb
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored layout or StatusRecord changes incompatibly
+FORMAT_VERSION = 1
+
+SNAPSHOT_SUFFIX = ".snap"
+_MAGIC = b"TSS"
+
+
+class SnapshotStore:
+    """
+    A directory of zlib-compressed MessagePack snapshots, one per log file.
+
+    Files are touched on every hit; once the store holds more than
+    ``max_entries`` files or ``max_bytes`` bytes, the least recently used
+    files are removed. Writes happen on a single background thread and are
+    atomic, so a crash never leaves a half-written snapshot behind.
+    """
+
+    def __init__(
+        self, directory: str, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024
+    ) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot-store")
+        self._pending: set[Future[None]] = set()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def _file_for(self, path: str) -> str:
+        digest = hashlib.blake2b(os.path.abspath(path).encode("utf-8"), digest_size=16)
+        return os.path.join(self.directory, digest.hexdigest() + SNAPSHOT_SUFFIX)
+
+    def load(self, path: str, fingerprint: Sequence[int]) -> StatusRecord | None:
+        """
+        Load the stored status of a log if it matches the log's fingerprint
+
+        Args:
+            path: Path to the log file
+            fingerprint: The log's current content fingerprint
+
+        Returns:
+            StatusRecord: The stored status, or None if missing or stale
+        """
+        file = self._file_for(path)
+        try:
+            with open(file, "rb") as f:
+                data = f.read()
+            record = self._decode(data)
+        except FileNotFoundError:
+            record = None
+        except Exception as e:
+            logger.warning("Discarding unreadable snapshot %s: %s", file, e)
+            record = None
+
+        if (
+            record is None
+            or record.get("path") != os.path.abspath(path)
+            or record.get("fingerprint") != list(fingerprint)
+        ):
+            with self._lock:
+                self._misses += 1
+            return None
+
+        try:
+            os.utime(file)
+        except OSError:
+            pass
+        try:
+            # Our own output, so it is converted without pydantic validation
+            status = StatusRecord.from_dict(record["status"])
+        except (KeyError, TypeError) as e:
+            logger.warning("Discarding malformed snapshot %s: %s", file, e)
+            with self._lock:
+                self._misses += 1
+            return None
+        with self._lock:
+            self._hits += 1
+        return status
+
+    def save(self, path: str, fingerprint: Sequence[int], status: StatusRecord) -> None:
+        """
+        Store the status of a log, replacing any older snapshot of it
+
+        Args:
+            path: Path to the log file
+            fingerprint: Content fingerprint the status was parsed from
+            status: The full status record
+        """
+        record = {
+            "path": os.path.abspath(path),
+            "fingerprint": list(fingerprint),
+            "status": status.to_dict(),
+        }
+        data = _MAGIC + bytes((FORMAT_VERSION,)) + zlib.compress(packb(record), 6)
+
+        os.makedirs(self.directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self._file_for(path))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        self._evict()
+
+    def save_later(
+        self,
+        path: str,
+        fingerprint: Sequence[int],
+        status: StatusRecord | Callable[[], StatusRecord],
+    ) -> None:
+        """
+        Store a status on the background writer thread
+
+        Args:
+            path: Path to the log file
+            fingerprint: Content fingerprint the status was parsed from
+            status: A StatusRecord, or a zero-argument callable producing one
+                (so building it also happens off the request thread)
+        """
+
+        def write() -> None:
+            try:
+                self.save(
+                    path, fingerprint, status if isinstance(status, StatusRecord) else status()
+                )
+            except Exception as e:
+                logger.warning("Could not store snapshot of %s: %s", path, e)
+
+        future = self._executor.submit(write)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget)
+
+    def _forget(self, future: "Future[None]") -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Wait for queued background writes to finish"""
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.result(timeout)
+
+    def _decode(self, data: bytes) -> dict[str, Any] | None:
+        if data[:3] != _MAGIC or data[3:4] != bytes((FORMAT_VERSION,)):
+            return None
+        record = unpackb(zlib.decompress(data[4:]))
+        return record if isinstance(record, dict) else None
+
+    def _evict(self) -> None:
+        try:
+            with os.scandir(self.directory) as it:
+                files = [
+                    (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                    for entry in it
+                    if entry.name.endswith(SNAPSHOT_SUFFIX)
+                ]
+        except FileNotFoundError:
+            return
+        files.sort(reverse=True)
+        total = 0
+        for index, (_, size, file) in enumerate(files):
+            total += size
+            if index >= self.max_entries or total > self.max_bytes:
+                try:
+                    os.remove(file)
+                    logger.debug("Evicted least recently used snapshot: %s", file)
+                except OSError:
+                    pass
+
+    def clear(self) -> None:
+        """Remove every stored snapshot"""
+        self.flush()
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(SNAPSHOT_SUFFIX):
+                        os.remove(entry.path)
+        except FileNotFoundError:
+            pass
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get store statistics
+
+        Returns:
+            dict: Snapshot count and size on disk, limits and hit/miss counters
+        """
+        try:
+            with os.scandir(self.directory) as it:
+                sizes = [e.stat().st_size for e in it if e.name.endswith(SNAPSHOT_SUFFIX)]
+        except FileNotFoundError:
+            sizes = []
+        with self._lock:
+            return {
+                "directory": self.directory,
+                "entries": len(sizes),
+                "bytes": sum(sizes),
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
@@ -13,6 +13,7 @@ class TestConfigManager(ConfigManager):
     """Test-specific config manager that allows setting config file path"""
 
     def __init__(self, config_file_path: str) -> None:
+        super().__init__()
         self.config_file = config_file_path
         self._ensure_config_directory()
 
@@ -128,7 +129,7 @@ class TestTwilightHelperBackendModular(unittest.TestCase):
 
         # Mock the log file and parser
         with patch("src.api.game_routes.get_latest_log_file") as mock_get_file:
-            with patch("src.api.game_routes.log_parser.LogParser") as mock_parser_class:
+            with patch("src.utils.game_state.log_parser.LogParser") as mock_parser_class:
                 mock_get_file.return_value = "/test/path/test-game.log"
                 mock_parser = MagicMock()
                 mock_parser_class.return_value = mock_parser
@@ -179,7 +180,7 @@ class TestTwilightHelperBackendModular(unittest.TestCase):
 
         # Mock log file found but no game data
         with patch("src.api.game_routes.get_latest_log_file") as mock_get_file:
-            with patch("src.api.game_routes.log_parser.LogParser") as mock_parser_class:
+            with patch("src.utils.game_state.log_parser.LogParser") as mock_parser_class:
                 mock_get_file.return_value = "/test/path/test-game.log"
                 mock_parser = MagicMock()
                 mock_parser_class.return_value = mock_parser
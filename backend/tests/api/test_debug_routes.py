@@ -0,0 +1,101 @@
+"""
+Tests for debug API routes
+"""
+
+import unittest
+
+from src.app import create_app
+from src.utils.sampling_profiler import SamplingProfiler
+
+
+class TestDebugRoutes(unittest.TestCase):
+    """Test cases for debug API routes"""
+
+    def setUp(self) -> None:
+        """Set up test client with a dedicated, stopped profiler"""
+        self.profiler = SamplingProfiler(sample_hz=0)
+        self.app = create_app(profiler=self.profiler)
+        self.app.testing = True
+        self.client = self.app.test_client()
+
+    def test_flamegraph_returns_collapsed_stacks(self) -> None:
+        """Test that the flamegraph endpoint exports collapsed stacks"""
+        self.profiler.sample_once()
+
+        response = self.client.get("/api/debug/flamegraph")
+        body = response.get_data(as_text=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "text/plain")
+        self.assertEqual(response.headers["X-Profiler-Samples"], "1")
+        self.assertTrue(body.endswith("\n"))
+        self.assertRegex(body.splitlines()[0], r"^\S.* \d+$")
+
+    def test_flamegraph_reset(self) -> None:
+        """Test that ?reset=1 clears samples after exporting them"""
+        self.profiler.sample_once()
+
+        first = self.client.get("/api/debug/flamegraph?reset=1")
+        second = self.client.get("/api/debug/flamegraph")
+
+        self.assertNotEqual(first.get_data(as_text=True), "")
+        self.assertEqual(second.get_data(as_text=True), "")
+
+    def test_memory_report(self) -> None:
+        """Test the memory endpoint with and without allocation tracing"""
+        try:
+            plain = self.client.get("/api/debug/memory").get_json()
+            traced = self.client.get("/api/debug/memory?trace=1&top=3").get_json()
+            again = self.client.get("/api/debug/memory").get_json()
+        finally:
+            self.client.get("/api/debug/memory?trace=0")
+
+        self.assertIn("rss_bytes", plain)
+        self.assertIn("entries", plain["caches"]["game_states"])
+        self.assertIn("entries", plain["caches"]["snapshots"])
+        self.assertIn("tracked_logs", plain["caches"]["poll_advisor"])
+        self.assertTrue(traced["tracing"])
+        self.assertLessEqual(len(traced["top"]), 3)
+        self.assertNotIn("diff", traced)
+        self.assertIn("diff", again)
+        self.assertEqual(self.client.get("/api/debug/memory?top=x").status_code, 400)
+
+    def test_memory_report_rejects_negative_top(self) -> None:
+        """Test that a negative number of allocation sites is refused before tracing starts"""
+        response = self.client.get("/api/debug/memory?trace=1&top=-1")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "top must not be negative")
+        self.assertFalse(self.client.get("/api/debug/memory").get_json()["tracing"])
+
+    def test_remote_clients_are_refused(self) -> None:
+        """Test that only clients on this machine can use the debug endpoints"""
+        for address, status in (
+            ("192.168.1.20", 403),
+            ("::1", 200),
+            ("::ffff:127.0.0.1", 200),
+        ):
+            with self.subTest(address=address):
+                response = self.client.get(
+                    "/api/debug/profiler", environ_base={"REMOTE_ADDR": address}
+                )
+                self.assertEqual(response.status_code, status)
+
+        response = self.client.get(
+            "/api/debug/memory?trace=1", environ_base={"REMOTE_ADDR": "10.0.0.5"}
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(self.client.get("/api/debug/memory").get_json()["tracing"])
+
+    def test_profiler_stats(self) -> None:
+        """Test the profiler statistics endpoint"""
+        response = self.client.get("/api/debug/profiler")
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(data["enabled"])
+        self.assertEqual(data["samples"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
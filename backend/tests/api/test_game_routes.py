@@ -3,6 +3,7 @@ Tests for game API routes
 """
 
 import os
+import shutil
 import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
@@ -10,6 +11,9 @@ from unittest.mock import MagicMock, patch
 from src.app import create_app
 from src.config.config_manager import ConfigManager
 from src.models.game_data import ConfigModel
+from src.utils.game_state import GameStateCache
+from src.utils.msgpack_codec import unpackb
+from tests.helpers import mock_game
 
 
 class TestGameRoutes(unittest.TestCase):
@@ -74,7 +78,7 @@ class TestGameRoutes(unittest.TestCase):
         with patch("src.api.game_routes.get_latest_log_file") as mock_get_file:
             mock_get_file.return_value = "/test/path/game.txt"
 
-            with patch("src.api.game_routes.log_parser.LogParser") as mock_parser_class:
+            with patch("src.utils.game_state.log_parser.LogParser") as mock_parser_class:
                 mock_parser = MagicMock()
                 mock_parser_class.return_value = mock_parser
 
@@ -109,6 +113,150 @@ class TestGameRoutes(unittest.TestCase):
                 self.assertEqual(len(data["deck"]), 1)
                 self.assertEqual(data["deck"][0]["name"], "Cuba")
 
+    def test_current_status_msgpack(self) -> None:
+        """Test that current status can be requested as MessagePack"""
+        test_config = ConfigModel(
+            log_file_path="/test/path/game.txt", log_directory="/test/directory"
+        )
+        with open(self.test_config_file, "w") as f:
+            import json
+
+            json.dump(test_config.model_dump(), f)
+
+        with patch("src.api.game_routes.get_latest_log_file") as mock_get_file:
+            mock_get_file.return_value = "/test/path/game.txt"
+
+            with patch("src.utils.game_state.log_parser.LogParser") as mock_parser_class:
+                mock_game = MagicMock()
+                mock_game.current_play.turn = 3
+                mock_game.current_play.possible_draw_cards = []
+                mock_game.current_play.discarded_cards = []
+                mock_game.current_play.removed_cards = []
+                mock_game.current_play.cards_in_hands = []
+                mock_parser_class.return_value.parse_game_log.return_value = mock_game
+
+                by_accept = self.client.get(
+                    "/api/current-status", headers={"Accept": "application/msgpack"}
+                )
+                by_query = self.client.get("/api/current-status?format=msgpack")
+                default = self.client.get("/api/current-status", headers={"Accept": "*/*"})
+
+                for response in (by_accept, by_query):
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(response.mimetype, "application/msgpack")
+                    data = unpackb(response.get_data())
+                    self.assertEqual(data["status"], "ok")
+                    self.assertEqual(data["turn"], 3)
+                self.assertEqual(default.mimetype, "application/json")
+
+    def test_current_status_not_modified(self) -> None:
+        """Test that a client holding the current version's ETag gets a 304"""
+        log_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, log_dir, True)
+        log_path = os.path.join(log_dir, "game.txt")
+        with open(log_path, "w") as f:
+            f.write("Turn 1\n")
+        self.app.config["GAME_STATE_CACHE"] = GameStateCache()
+
+        with patch("src.api.game_routes.get_latest_log_file", return_value=log_path):
+            with patch("src.utils.game_state.log_parser.LogParser") as mock_parser_class:
+                mock_parser_class.return_value.parse_game_log.side_effect = lambda path: mock_game(
+                    1
+                )
+                first = self.client.get("/api/current-status")
+                etag = first.headers["ETag"]
+                unchanged = self.client.get("/api/current-status", headers={"If-None-Match": etag})
+                other_format = self.client.get(
+                    "/api/current-status?format=msgpack", headers={"If-None-Match": etag}
+                )
+                other_view = self.client.get(
+                    "/api/current-status?sort=name", headers={"If-None-Match": etag}
+                )
+
+                with open(log_path, "a") as f:
+                    f.write("Turn 2\n")
+                changed = self.client.get("/api/current-status", headers={"If-None-Match": etag})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(unchanged.get_data(), b"")
+        self.assertEqual(unchanged.headers["ETag"], etag)
+        self.assertIn("X-Poll-After", unchanged.headers)
+        for response in (other_format, other_view, changed):
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_current_status_server_timing(self) -> None:
+        """Test the per-stage Server-Timing breakdown and cache tags"""
+        log_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, log_dir, True)
+        log_path = os.path.join(log_dir, "game.txt")
+        with open(log_path, "w") as f:
+            f.write("Turn 1\n")
+        # Without a snapshot store, so the miss really parses
+        self.app.config["GAME_STATE_CACHE"] = GameStateCache()
+
+        with patch("src.api.game_routes.get_latest_log_file", return_value=log_path):
+            with patch("src.utils.game_state.log_parser.LogParser") as mock_parser_class:
+                mock_game = MagicMock()
+                mock_game.current_play.turn = 1
+                mock_game.current_play.possible_draw_cards = []
+                mock_game.current_play.discarded_cards = []
+                mock_game.current_play.removed_cards = []
+                mock_game.current_play.cards_in_hands = []
+                mock_parser_class.return_value.parse_game_log.return_value = mock_game
+
+                first = self.client.get("/api/current-status")
+                second = self.client.get("/api/current-status")
+
+        miss = first.headers["Server-Timing"]
+        for stage in ("config", "discover", "fingerprint", "parse", "format", "serialize", "total"):
+            self.assertRegex(miss, rf"\b{stage};dur=\d+\.\d+")
+        self.assertIn('cache;desc="miss"', miss)
+        self.assertIn('body;desc="miss"', miss)
+
+        hit = second.headers["Server-Timing"]
+        self.assertIn('cache;desc="hit"', hit)
+        self.assertIn('body;desc="hit"', hit)
+        self.assertNotIn("parse;", hit)
+        self.assertEqual(second.headers["Timing-Allow-Origin"], "*")
+
+    def test_current_status_serves_stale_state_after_parse_error(self) -> None:
+        """Test that a log caught half-written keeps returning its last good state"""
+        log_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, log_dir, True)
+        log_path = os.path.join(log_dir, "game.txt")
+        with open(log_path, "w") as f:
+            f.write("Turn 1\n")
+        self.app.config["GAME_STATE_CACHE"] = GameStateCache()
+
+        with patch("src.api.game_routes.get_latest_log_file", return_value=log_path):
+            with patch("src.utils.game_state.log_parser.LogParser") as mock_parser_class:
+                mock_game = MagicMock()
+                mock_game.current_play.turn = 1
+                mock_game.current_play.possible_draw_cards = []
+                mock_game.current_play.discarded_cards = []
+                mock_game.current_play.removed_cards = []
+                mock_game.current_play.cards_in_hands = []
+                mock_parser = mock_parser_class.return_value
+                mock_parser.parse_game_log.return_value = mock_game
+                good = self.client.get("/api/current-status").get_json()
+
+                with open(log_path, "a") as f:
+                    f.write("Turn 2, Hea")
+                mock_parser.parse_game_log.side_effect = Exception("Parser error")
+                stale = self.client.get("/api/current-status")
+                again = self.client.get("/api/current-status")
+
+        self.assertFalse(good["stale"])
+        self.assertEqual(stale.status_code, 200)
+        data = stale.get_json()
+        self.assertTrue(data["stale"])
+        self.assertEqual((data["status"], data["turn"], data["error"]), ("ok", 1, "Parser error"))
+        self.assertEqual(mock_parser.parse_game_log.call_count, 2)
+        self.assertIn('cache;desc="stale"', again.headers["Server-Timing"])
+
     def test_current_status_no_log_files(self) -> None:
         """Test current status when no log files are found"""
         # Set up config with no log file path
@@ -163,7 +311,7 @@ class TestGameRoutes(unittest.TestCase):
         with patch("src.api.game_routes.get_latest_log_file") as mock_get_file:
             mock_get_file.return_value = "/test/path/game.txt"
 
-            with patch("src.api.game_routes.log_parser.LogParser") as mock_parser_class:
+            with patch("src.utils.game_state.log_parser.LogParser") as mock_parser_class:
                 mock_parser = MagicMock()
                 mock_parser_class.return_value = mock_parser
                 mock_parser.parse_game_log.return_value = None
@@ -189,7 +337,7 @@ class TestGameRoutes(unittest.TestCase):
         with patch("src.api.game_routes.get_latest_log_file") as mock_get_file:
             mock_get_file.return_value = "/test/path/game.txt"
 
-            with patch("src.api.game_routes.log_parser.LogParser") as mock_parser_class:
+            with patch("src.utils.game_state.log_parser.LogParser") as mock_parser_class:
                 mock_parser = MagicMock()
                 mock_parser_class.return_value = mock_parser
                 mock_parser.parse_game_log.side_effect = Exception("Parser error")
@@ -201,6 +349,13 @@ class TestGameRoutes(unittest.TestCase):
                 self.assertEqual(data["status"], "error")
                 self.assertIn("Parser error", data["error"])
 
+    def test_status_endpoint(self) -> None:
+        """Test the health check the frontend waits for on startup"""
+        response = self.client.get("/api/status")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {"status": "ok"})
+
     def test_shutdown_endpoint(self) -> None:
         """Test shutdown endpoint"""
         with self.app.test_request_context():
@@ -0,0 +1,247 @@
+"""
+Tests for multi-game tracking API routes
+"""
+
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from src.app import create_app
+from src.config.config_manager import ConfigManager
+from src.models.game_data import GameDataFormatter
+from src.utils.game_state import GameStateCache
+from tests.helpers import mock_game
+
+
+class TestGamesRoutes(unittest.TestCase):
+    """Test cases for multi-game tracking API routes"""
+
+    def setUp(self) -> None:
+        """Set up a log directory with two active games and one old one"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.log_dir = os.path.join(self.temp_dir, "logs")
+        os.makedirs(self.log_dir)
+        for name in ("table-1.txt", "table-2.txt", "old.txt"):
+            with open(os.path.join(self.log_dir, name), "w") as f:
+                f.write("Turn 1\n")
+        old = time.time() - 3 * 24 * 60 * 60
+        os.utime(os.path.join(self.log_dir, "old.txt"), (old, old))
+
+        self.test_config_manager = ConfigManager()
+        self.test_config_manager.config_file = os.path.join(self.temp_dir, "config.json")
+        with open(self.test_config_manager.config_file, "w") as f:
+            json.dump({"log_file_path": None, "log_directory": self.log_dir}, f)
+
+        self.app = create_app(config_manager=self.test_config_manager)
+        self.app.testing = True
+        self.client = self.app.test_client()
+
+        patcher = patch("src.utils.game_state.log_parser.LogParser")
+        self.mock_parser_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.parse_game_log: Any = self.mock_parser_class.return_value.parse_game_log
+        self.parse_game_log.side_effect = lambda path: mock_game(3, discarded=("Fidel",))
+
+    def tearDown(self) -> None:
+        """Clean up temporary files"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_list_games_returns_active_logs(self) -> None:
+        """Test that only recently modified logs are listed"""
+        response = self.client.get("/api/games")
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        names = sorted(g["filename"] for g in data["games"])
+        self.assertEqual(names, ["table-1.txt", "table-2.txt"])
+        self.assertFalse(any(g["tracked"] for g in data["games"]))
+
+    def test_list_games_window(self) -> None:
+        """Test widening the activity window"""
+        response = self.client.get("/api/games?window=999999")
+
+        self.assertEqual(len(response.get_json()["games"]), 3)
+
+    def test_game_status(self) -> None:
+        """Test the full status of one game"""
+        response = self.client.get("/api/games/table-1.txt/status")
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data["status"], "ok")
+        self.assertEqual(data["filename"], "table-1.txt")
+        self.assertEqual(data["turn"], 3)
+
+        listing = self.client.get("/api/games").get_json()["games"]
+        tracked = {g["filename"]: g["tracked"] for g in listing}
+        self.assertTrue(tracked["table-1.txt"])
+        self.assertFalse(tracked["table-2.txt"])
+
+    def test_game_status_poll_hint(self) -> None:
+        """Test that status responses recommend the next poll interval"""
+        response = self.client.get("/api/games/table-1.txt/status")
+
+        self.assertEqual(response.headers["X-Poll-After"], "1000")
+
+    def test_game_status_is_cached_per_file(self) -> None:
+        """Test that unchanged games are not re-parsed"""
+        self.client.get("/api/games/table-1.txt/status")
+        self.client.get("/api/games/table-1.txt/status")
+        self.client.get("/api/games/table-2.txt/status")
+
+        self.assertEqual(self.parse_game_log.call_count, 2)
+
+    def test_game_status_grouped_view(self) -> None:
+        """Test the grouped and sorted view of a game status"""
+        response = self.client.get("/api/games/table-1.txt/status?view=grouped&sort=ops-desc")
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data["groups"]["deck"]["ussr"]["count"], 1)
+        self.assertEqual(data["groups"]["deck"]["ussr"]["ops_total"], 2)
+        self.assertEqual(data["groups"]["deck"]["us"]["cards"], [])
+
+    def test_game_status_fields_formats_only_requested_sections(self) -> None:
+        """Test that ?fields= skips formatting card lists nobody asked for"""
+        # Without a snapshot store, nothing formats the full status in the background
+        self.app.config["GAME_STATE_CACHE"] = GameStateCache()
+        with patch(
+            "src.utils.game_state.GameDataFormatter.section_records",
+            wraps=GameDataFormatter.section_records,
+        ) as section_records:
+            response = self.client.get("/api/games/table-1.txt/status?fields=turn,deck")
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data, {"status": "ok", "turn": 3, "deck": [data["deck"][0]]})
+        self.assertEqual([c.args[2] for c in section_records.call_args_list], ["deck"])
+
+    def test_game_status_rejects_unknown_view(self) -> None:
+        """Test that unsupported view and sort values are rejected"""
+        self.assertEqual(self.client.get("/api/games/table-1.txt/status?view=x").status_code, 400)
+        self.assertEqual(self.client.get("/api/games/table-1.txt/status?sort=x").status_code, 400)
+
+    def test_game_status_not_found(self) -> None:
+        """Test a missing game log"""
+        response = self.client.get("/api/games/missing.txt/status")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertIn("Log file not found", response.get_json()["error"])
+
+    def test_game_status_rejects_invalid_filename(self) -> None:
+        """Test that only .txt log names inside the log directory are accepted"""
+        response = self.client.get("/api/games/config.json/status")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_dashboard_summarizes_active_games(self) -> None:
+        """Test the batched dashboard endpoint"""
+        response = self.client.get("/api/games/dashboard")
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(data["games"]), 2)
+        for summary in data["games"]:
+            self.assertEqual(summary["turn"], 3)
+            self.assertEqual(summary["deck_count"], 1)
+            self.assertEqual(summary["discarded_count"], 1)
+            self.assertNotIn("deck", summary)
+
+        self.client.get("/api/games/dashboard")
+        self.assertEqual(self.parse_game_log.call_count, 2)
+        # Summaries only count the card lists; none of them were looked up
+        cache = self.app.config["GAME_STATE_CACHE"]
+        for name in ("table-1.txt", "table-2.txt"):
+            self.assertTrue(cache.get_entry(os.path.join(self.log_dir, name)).snapshot.holds_game)
+
+    def test_dashboard_reports_parse_errors_per_game(self) -> None:
+        """Test that one broken log does not fail the whole dashboard"""
+
+        def parse(path: str) -> MagicMock:
+            if path.endswith("table-2.txt"):
+                raise ValueError("Parser error")
+            return mock_game(3, discarded=("Fidel",))
+
+        self.parse_game_log.side_effect = parse
+
+        data = self.client.get("/api/games/dashboard").get_json()
+        statuses = {g["filename"]: g for g in data["games"]}
+
+        self.assertEqual(statuses["table-1.txt"]["status"], "ok")
+        self.assertEqual(statuses["table-2.txt"]["status"], "error")
+        self.assertIn("Parser error", statuses["table-2.txt"]["error"])
+
+        # The unchanged broken log is quarantined, and not reported as a new error
+        with self.assertLogs("src.api.games_routes", level="WARNING") as logs:
+            again = self.client.get("/api/games/dashboard").get_json()
+        self.assertEqual(
+            {g["filename"]: g["status"] for g in again["games"]}["table-2.txt"], "error"
+        )
+        self.assertEqual([r.levelname for r in logs.records], ["WARNING"])
+
+    def test_game_log_pages_raw_lines(self) -> None:
+        """Test random access to raw log lines"""
+        with open(os.path.join(self.log_dir, "table-1.txt"), "a") as f:
+            f.write("USSR plays Fidel\nTurn 2, Headline Phase\nUS plays NATO\n")
+
+        response = self.client.get("/api/games/table-1.txt/log?start=1&count=2")
+        data = response.get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data["total_lines"], 4)
+        self.assertEqual(data["lines"], ["USSR plays Fidel", "Turn 2, Headline Phase"])
+        self.assertEqual(data["turns"], {"1": 0, "2": 2})
+
+    def test_game_log_by_turn(self) -> None:
+        """Test jumping to a turn boundary"""
+        with open(os.path.join(self.log_dir, "table-1.txt"), "a") as f:
+            f.write("USSR plays Fidel\nTurn 2, Headline Phase\n")
+
+        data = self.client.get("/api/games/table-1.txt/log?turn=2").get_json()
+        missing = self.client.get("/api/games/table-1.txt/log?turn=9")
+
+        self.assertEqual(data["start"], 2)
+        self.assertEqual(data["lines"], ["Turn 2, Headline Phase"])
+        self.assertEqual(missing.status_code, 404)
+
+    def test_game_log_rejects_negative_or_invalid_paging(self) -> None:
+        """Test that start and count are validated before reading the log"""
+        for query in ("start=-1", "count=-5", "start=x", "count=1.5"):
+            with self.subTest(query=query):
+                response = self.client.get(f"/api/games/table-1.txt/log?{query}")
+                self.assertEqual(response.status_code, 400)
+
+    def test_game_status_of_archived_log(self) -> None:
+        """Test that compressed archives can be analyzed directly"""
+        with gzip.open(os.path.join(self.log_dir, "archived.txt.gz"), "wt") as f:
+            f.write("Turn 1\nTurn 2, Headline Phase\n")
+        parsed_text: list[str] = []
+
+        def parse(path: str) -> MagicMock:
+            with open(path) as f:
+                parsed_text.append(f.read())
+            return mock_game(2, discarded=("Fidel",))
+
+        self.parse_game_log.side_effect = parse
+
+        response = self.client.get("/api/games/archived.txt.gz/status")
+        log = self.client.get("/api/games/archived.txt.gz/log?turn=2").get_json()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["filename"], "archived.txt.gz")
+        self.assertEqual(parsed_text, ["Turn 1\nTurn 2, Headline Phase\n"])
+        self.assertEqual(log["lines"], ["Turn 2, Headline Phase"])
+
+        listing = self.client.get("/api/games?window=999999").get_json()["games"]
+        archived = next(g for g in listing if g["filename"] == "archived.txt.gz")
+        self.assertEqual(archived["compression"], "gz")
+
+
+if __name__ == "__main__":
+    unittest.main()
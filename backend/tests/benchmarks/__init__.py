@@ -0,0 +1,3 @@
+# Benchmarks tests package
+
+# This file makes this directory a Python package.
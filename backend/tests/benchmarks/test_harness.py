@@ -0,0 +1,90 @@
+"""
+Tests for the benchmark harness
+"""
+
+import os
+import tempfile
+import unittest
+
+from benchmarks.harness import (
+    BenchmarkResult,
+    compare_to_baseline,
+    load_results,
+    measure,
+    save_results,
+)
+
+
+def _result(name: str, median_ms: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name,
+        runs=1,
+        median_ms=median_ms,
+        mean_ms=median_ms,
+        min_ms=median_ms,
+        max_ms=median_ms,
+    )
+
+
+class TestHarness(unittest.TestCase):
+    """Test cases for the benchmark harness"""
+
+    def test_measure_counts_runs(self) -> None:
+        """Test that measure times the requested number of calls after warmup"""
+        calls: list[int] = []
+
+        result = measure("noop", lambda: calls.append(1), repeat=5, warmup=2)
+
+        self.assertEqual(len(calls), 7)
+        self.assertEqual(result.runs, 5)
+        self.assertLessEqual(result.min_ms, result.median_ms)
+        self.assertLessEqual(result.median_ms, result.max_ms)
+
+    def test_measure_runs_setup_before_every_call(self) -> None:
+        """Test that setup runs untimed before each warmup and timed call"""
+        calls: list[str] = []
+
+        measure(
+            "noop",
+            lambda: calls.append("call"),
+            repeat=2,
+            warmup=1,
+            setup=lambda: calls.append("setup"),
+        )
+
+        self.assertEqual(calls, ["setup", "call"] * 3)
+
+    def test_results_round_trip(self) -> None:
+        """Test saving and loading results"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "results.json")
+            save_results(path, [_result("a", 1.5)])
+
+            loaded = load_results(path)
+
+        self.assertEqual(loaded["a"], _result("a", 1.5))
+
+    def test_regression_beyond_tolerance_is_reported(self) -> None:
+        """Test that a slowdown beyond the tolerance is a regression"""
+        baseline = {"current_status_10_turns": _result("current_status_10_turns", 10.0)}
+
+        regressions = compare_to_baseline(
+            [_result("current_status_10_turns", 13.0)], baseline, tolerance=0.25
+        )
+
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("current_status_10_turns", regressions[0])
+
+    def test_slowdown_within_tolerance_passes(self) -> None:
+        """Test that small slowdowns and new benchmarks are not regressions"""
+        baseline = {"a": _result("a", 10.0)}
+
+        regressions = compare_to_baseline(
+            [_result("a", 12.0), _result("new", 100.0)], baseline, tolerance=0.25
+        )
+
+        self.assertEqual(regressions, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
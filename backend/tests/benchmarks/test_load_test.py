@@ -0,0 +1,87 @@
+"""
+Tests for the load test harness
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import threading
+import time
+import unittest
+from collections.abc import Callable
+from unittest.mock import patch
+
+from benchmarks.harness import percentile
+from benchmarks.load_test import SimulatedGame, main, run_load
+
+
+class TestLoadTest(unittest.TestCase):
+    """Test cases for the load test harness"""
+
+    def test_percentile_interpolates(self) -> None:
+        """Test percentile calculation"""
+        values = [float(v) for v in range(1, 101)]
+
+        self.assertAlmostEqual(percentile(values, 50), 50.5)
+        self.assertAlmostEqual(percentile(values, 99), 99.01)
+        self.assertEqual(percentile([], 95), 0.0)
+
+    def test_run_load_reports_per_endpoint_stats(self) -> None:
+        """Test that concurrent clients are counted and errors are separated"""
+        calls: list[str] = []
+        lock = threading.Lock()
+
+        def make_fetch() -> Callable[[str], int]:
+            def fetch(path: str) -> int:
+                with lock:
+                    calls.append(path)
+                time.sleep(0.001)
+                return 500 if path == "/broken" else 200
+
+            return fetch
+
+        report = run_load(make_fetch, clients=3, duration=0.2, endpoints=("/ok", "/broken"))
+
+        self.assertEqual(report["clients"], 3)
+        self.assertGreater(report["endpoints"]["/ok"]["requests"], 0)
+        self.assertEqual(report["endpoints"]["/broken"]["requests"], 0)
+        self.assertGreater(report["endpoints"]["/broken"]["errors"], 0)
+        self.assertEqual(report["overall"]["requests"] + report["overall"]["errors"], len(calls))
+        self.assertLessEqual(report["overall"]["p50_ms"], report["overall"]["p99_ms"])
+
+    def test_simulated_game_appends_lines(self) -> None:
+        """Test that the simulated game writes the log incrementally"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "game.txt")
+            game = SimulatedGame(path, lines_per_second=0)
+            game.start()
+            game.join(timeout=5)
+
+            with open(path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+
+        self.assertEqual(len(lines), game.lines_written)
+        self.assertIn("Turn 10, Cleanup", lines)
+
+    def test_live_mode_removes_the_simulated_game(self) -> None:
+        """Test that a run against a live server leaves its log directory as it was"""
+
+        def make_fetch() -> Callable[[str], int]:
+            return lambda path: 200
+
+        with tempfile.TemporaryDirectory() as log_dir:
+            with (
+                patch("benchmarks.load_test.http_fetcher", return_value=make_fetch),
+                contextlib.redirect_stdout(io.StringIO()),
+            ):
+                code = main(
+                    ["--url", "http://127.0.0.1:8000", "--log-dir", log_dir, "--duration", "0.1"]
+                )
+
+            self.assertEqual(code, 0)
+            self.assertEqual(os.listdir(log_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
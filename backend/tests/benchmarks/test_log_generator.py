@@ -0,0 +1,59 @@
+"""
+Tests for the synthetic log generator
+"""
+
+import os
+import tempfile
+import unittest
+
+from benchmarks.log_generator import CARD_CATALOG, generate_log, iter_log_lines, write_log
+
+
+class TestLogGenerator(unittest.TestCase):
+    """Test cases for the synthetic log generator"""
+
+    def test_generates_requested_turns(self) -> None:
+        """Test that every requested turn has a headline phase"""
+        log = generate_log(turns=7)
+
+        for turn in range(1, 8):
+            self.assertIn(f"Turn {turn}, Headline Phase", log)
+        self.assertNotIn("Turn 8,", log)
+
+    def test_generation_is_reproducible(self) -> None:
+        """Test that the same seed produces the same log"""
+        self.assertEqual(generate_log(turns=5, seed=3), generate_log(turns=5, seed=3))
+        self.assertNotEqual(generate_log(turns=5, seed=3), generate_log(turns=5, seed=4))
+
+    def test_reshuffles_can_be_limited(self) -> None:
+        """Test that the reshuffle count can be capped"""
+        unlimited = list(iter_log_lines(turns=10))
+        capped = list(iter_log_lines(turns=10, reshuffles=0))
+
+        self.assertGreater(sum("RESHUFFLE" in line for line in unlimited), 0)
+        self.assertEqual(sum("RESHUFFLE" in line for line in capped), 0)
+
+    def test_events_per_turn_controls_event_plays(self) -> None:
+        """Test that more events per turn produce more event plays"""
+        few = generate_log(turns=3, events_per_turn=0).count("for Event")
+        many = generate_log(turns=3, events_per_turn=14).count("for Event")
+
+        self.assertGreater(many, few)
+
+    def test_only_catalog_cards_are_played(self) -> None:
+        """Test that every played card comes from the card catalog"""
+        for line in iter_log_lines(turns=10):
+            if " plays " in line:
+                card = line.split(" plays ", 1)[1].rsplit(" for ", 1)[0].rstrip("*")
+                self.assertIn(card, CARD_CATALOG)
+
+    def test_write_log(self) -> None:
+        """Test writing a log to disk"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = write_log(os.path.join(temp_dir, "nested", "game.txt"), turns=2)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), generate_log(turns=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
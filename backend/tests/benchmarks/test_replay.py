@@ -0,0 +1,86 @@
+"""
+Tests for the log replay latency tool
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from benchmarks.replay import LOG_NAME, ReplayResult, change_points, replay, tracker_observer
+from src.tracker import GameTracker
+from tests.helpers import mock_game
+
+LINES = ["TSEspionage game log", "Turn 1", "USSR plays Fidel", "Turn 2"]
+
+
+def _parse(path: str) -> MagicMock:
+    """A parsed game whose turn is the number of "Turn" lines written so far"""
+    with open(path) as f:
+        turn = sum(line.startswith("Turn") for line in f)
+    return mock_game(turn, deck=())
+
+
+class TestReplay(unittest.TestCase):
+    """Test cases for benchmarks.replay"""
+
+    def setUp(self) -> None:
+        """Create a scratch directory and patch the log parser"""
+        self.test_dir = tempfile.mkdtemp()
+        patcher = patch("src.utils.game_state.log_parser.LogParser")
+        parser_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        parser_class.return_value.parse_game_log.side_effect = _parse
+
+    def tearDown(self) -> None:
+        """Remove the scratch directory"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_change_points_skip_lines_that_do_not_change_the_status(self) -> None:
+        """Test that only status-changing appends are expected"""
+        points = change_points(LINES, self.test_dir)
+
+        self.assertEqual([index for index, _ in points], [0, 1, 3])
+        self.assertEqual([state["turn"] for _, state in points], [0, 1, 2])
+
+    def test_replay_times_every_change(self) -> None:
+        """Test a fast replay against an embedded tracker"""
+        expected = change_points(LINES, self.test_dir)
+        log_dir = os.path.join(self.test_dir, "logs")
+        os.makedirs(log_dir)
+        log_path = os.path.join(log_dir, LOG_NAME)
+        open(log_path, "w").close()
+
+        with GameTracker(log_path) as tracker:
+            result = replay(
+                LINES,
+                tracker_observer(tracker),
+                log_path,
+                expected,
+                line_delay=0.01,
+                interval=0.002,
+                name="tracker",
+            )
+
+        self.assertEqual(result.missed, 0)
+        self.assertEqual(len(result.latencies_ms), 3)
+        self.assertTrue(all(latency >= 0 for latency in result.latencies_ms))
+        self.assertGreater(result.polls, 0)
+        summary = result.summary()
+        self.assertEqual(summary["observed"], 3)
+        self.assertLessEqual(summary["median_ms"], summary["max_ms"])
+
+    def test_summary_reports_missed_changes(self) -> None:
+        """Test that changes never observed are counted, not timed"""
+        result = ReplayResult(observer="http", lines=10, changes=3, polls=5)
+        result.latencies_ms.append(12.0)
+
+        summary = result.summary()
+
+        self.assertEqual(summary["missed"], 2)
+        self.assertEqual(summary["p95_ms"], 12.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,18 +2,22 @@
 Tests for configuration manager
 """
 
+import gc
 import json
 import os
 import shutil
 import sys
 import tempfile
+import threading
+import time
 import unittest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 # Add the src directory to the path so we can import from the modular structure
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "src"))
 
-from src.config.config_manager import ConfigManager
+from src.config.config_manager import ConfigChange, ConfigManager
+from src.config.config_watcher import ConfigWatcher
 from src.models.game_data import ConfigModel
 
 
@@ -74,6 +78,10 @@ class TestConfigManager(unittest.TestCase):
         self.assertIsInstance(directory, str)
         self.assertGreater(len(directory), 0)
 
+    def test_get_app_data_directory(self) -> None:
+        """Test that app data lives next to the config file"""
+        self.assertEqual(self.config_manager.get_app_data_directory(), self.test_dir)
+
     def test_reset_config(self) -> None:
         """Test reset_config function"""
         # Create an existing config file
@@ -102,6 +110,96 @@ class TestConfigManager(unittest.TestCase):
         # Should preserve existing log_directory
         self.assertEqual(config.log_directory, "/new/directory")
 
+    def test_load_config_is_cached_until_file_changes(self) -> None:
+        """Test that an unchanged config file is not re-read"""
+        self.config_manager.save_config(ConfigModel(log_directory="/cached"))
+        # Age the file past the racy window so a stat is enough to trust the cache
+        old = time.time() - 10
+        os.utime(self.test_config_file, (old, old))
+
+        first = self.config_manager.load_config()
+        with patch("builtins.open", side_effect=AssertionError("config re-read")):
+            self.assertIs(self.config_manager.load_config(), first)
+
+    def test_listeners_hear_updates_and_resets(self) -> None:
+        """Test that update_config and reset_config publish change events"""
+        changes: list[ConfigChange] = []
+        self.config_manager.subscribe(changes.append)
+
+        self.config_manager.update_config({"log_directory": "/new/directory"})
+        self.config_manager.update_config({"log_directory": "/new/directory"})
+        self.config_manager.reset_config()
+
+        self.assertEqual([c.source for c in changes], ["update", "reset"])
+        self.assertEqual(changes[0].new.log_directory, "/new/directory")
+        self.assertIn("log_directory", changes[1].changed_fields)
+        self.assertNotIn("log_file_path", changes[1].changed_fields)
+
+    def test_external_edit_is_published(self) -> None:
+        """Test that a hand-edited config file is detected and published once"""
+        self.config_manager.save_config(ConfigModel(log_directory="/before"))
+        changes: list[ConfigChange] = []
+        unsubscribe = self.config_manager.subscribe(changes.append)
+
+        with open(self.test_config_file, "w") as f:
+            json.dump({"log_directory": "/after", "log_file_path": "game.txt"}, f)
+
+        change = self.config_manager.check_for_changes()
+        self.assertIsNotNone(change)
+        self.assertEqual(self.config_manager.load_config().log_directory, "/after")
+        self.assertIsNone(self.config_manager.check_for_changes())
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0].source, "external")
+        self.assertEqual(changes[0].changed_fields, {"log_directory", "log_file_path"})
+
+        unsubscribe()
+        self.config_manager.update_config({"log_directory": "/again"})
+        self.assertEqual(len(changes), 1)
+
+    def test_bound_method_listeners_are_held_weakly(self) -> None:
+        """Test that subscribing an object does not keep it alive"""
+
+        class Listener:
+            def __init__(self) -> None:
+                self.calls = 0
+
+            def on_change(self, change: ConfigChange) -> None:
+                self.calls += 1
+
+        listener = Listener()
+        self.config_manager.subscribe(listener.on_change)
+        self.config_manager.update_config({"log_directory": "/one"})
+        self.assertEqual(listener.calls, 1)
+
+        del listener
+        gc.collect()
+        # The dead listener is skipped and pruned
+        self.config_manager.update_config({"log_directory": "/two"})
+        self.assertEqual(self.config_manager._listeners, [])
+
+    def test_failing_listener_does_not_break_update(self) -> None:
+        """Test that an exception in a listener is logged, not raised"""
+        self.config_manager.subscribe(MagicMock(side_effect=RuntimeError("boom")))
+        config = self.config_manager.update_config({"log_directory": "/safe"})
+        self.assertEqual(config.log_directory, "/safe")
+
+    def test_watcher_publishes_external_edits(self) -> None:
+        """Test that ConfigWatcher notices an edit without any load_config call"""
+        self.config_manager.save_config(ConfigModel(log_directory="/before"))
+        published = threading.Event()
+        self.config_manager.subscribe(lambda change: published.set())
+
+        watcher = ConfigWatcher(self.config_manager, interval=0.01)
+        watcher.start()
+        try:
+            self.assertTrue(watcher.is_running)
+            with open(self.test_config_file, "w") as f:
+                json.dump({"log_directory": "/watched"}, f)
+            self.assertTrue(published.wait(2))
+        finally:
+            watcher.stop()
+        self.assertFalse(watcher.is_running)
+
     def test_config_file_path_platform_specific(self) -> None:
         """Test that config file path is platform-specific"""
         with patch("sys.platform", "win32"):
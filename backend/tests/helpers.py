@@ -0,0 +1,72 @@
+"""
+Shared fixtures for tests that parse logs through a patched log parser
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+from collections.abc import Sequence
+from unittest.mock import MagicMock, patch
+
+
+def mock_game(
+    turn: int, deck: Sequence[str] = ("Fidel",), discarded: Sequence[str] = ()
+) -> MagicMock:
+    """
+    A parsed game as the log parser returns it
+
+    Args:
+        turn: Current turn
+        deck: Names of the cards in the draw deck
+        discarded: Names of the discarded cards
+
+    Returns:
+        MagicMock: Game whose cards are all 2-ops USSR cards
+    """
+    cards = {}
+    for name in (*deck, *discarded):
+        card = MagicMock()
+        card.name, card.side, card.ops = name, "USSR", 2
+        cards[name] = card
+    game = MagicMock()
+    game.CARDS = cards
+    game.current_play.turn = turn
+    game.current_play.possible_draw_cards = list(deck)
+    game.current_play.discarded_cards = list(discarded)
+    game.current_play.removed_cards = []
+    game.current_play.cards_in_hands = []
+    return game
+
+
+class GrowingLogTestCase(unittest.TestCase):
+    """
+    Base for tests that follow one log as it grows
+
+    ``self.log_path`` starts as a one-turn log, and the patched parser
+    returns ``mock_game(self.turn)``; ``_grow()`` appends the next turn.
+    """
+
+    def setUp(self) -> None:
+        """Create a log file and patch the log parser"""
+        self.test_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.test_dir, "game.txt")
+        with open(self.log_path, "w") as f:
+            f.write("Turn 1\n")
+        self.turn = 1
+        patcher = patch("src.utils.game_state.log_parser.LogParser")
+        self.parser_class = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.parser_class.return_value.parse_game_log.side_effect = lambda path: mock_game(
+            self.turn
+        )
+
+    def tearDown(self) -> None:
+        """Remove the log directory"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _grow(self) -> None:
+        """Append a turn to the log"""
+        self.turn += 1
+        with open(self.log_path, "a") as f:
+            f.write(f"Turn {self.turn}\n")
@@ -10,7 +10,7 @@ from unittest.mock import MagicMock
 # Add the src directory to the path so we can import from the modular structure
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "src"))
 
-from src.models.game_data import Card, GameDataFormatter, GameStatus
+from src.models.game_data import Card, GameDataFormatter, GameStatus, StatusRecord, intern_card
 
 
 class TestGameDataModels(unittest.TestCase):
@@ -23,6 +23,30 @@ class TestGameDataModels(unittest.TestCase):
         self.assertEqual(card.side, "USSR")
         self.assertEqual(card.ops, 2)
 
+    def test_card_records_are_interned(self) -> None:
+        """Test that equal cards share one record instance"""
+        first = intern_card("Decolonization", "USSR", 2)
+        second = intern_card("Decolonization", "USSR", 2)
+        self.assertIs(first, second)
+        self.assertEqual(first.to_model(), Card(name="Decolonization", side="USSR", ops=2))
+
+    def test_status_record_matches_model(self) -> None:
+        """Test that records serialize exactly like the pydantic status"""
+        status = GameStatus(
+            status="ok",
+            filename="test.txt",
+            turn=2,
+            deck=[Card(name="Fidel", side="USSR", ops=2)],
+            removed=[Card(name="Marshall Plan", side="US", ops=4)],
+        )
+        record = StatusRecord.from_model(status)
+
+        self.assertEqual(record.to_dict(), status.model_dump())
+        self.assertEqual(record.to_dict({"status", "turn"}), {"status": "ok", "turn": 2})
+        self.assertEqual(record.to_model(), status)
+        self.assertEqual(StatusRecord.from_dict(record.to_dict()), record)
+        self.assertIs(record.deck[0], intern_card("Fidel", "USSR", 2))
+
     def test_game_status_model(self) -> None:
         """Test GameStatus Pydantic model"""
         status = GameStatus(
@@ -11,8 +11,9 @@ from unittest.mock import MagicMock, patch
 # Add the src directory to the path so we can import from the modular structure
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "src"))
 
-from src.app import create_app
+from src.app import create_app, serve, start_background_services
 from src.config.config_manager import ConfigManager
+from src.utils.sampling_profiler import SamplingProfiler
 
 
 class TestAppFactory(unittest.TestCase):
@@ -79,7 +80,7 @@ class TestAppFactory(unittest.TestCase):
             with patch("src.api.game_routes.get_latest_log_file") as mock_get_file:
                 mock_get_file.return_value = "/test/path/game.log"
 
-                with patch("src.api.game_routes.log_parser.LogParser") as mock_parser_class:
+                with patch("src.utils.game_state.log_parser.LogParser") as mock_parser_class:
                     mock_parser = MagicMock()
                     mock_parser_class.return_value = mock_parser
                     mock_game = MagicMock()
@@ -176,5 +177,65 @@ class TestAppFactory(unittest.TestCase):
             self.assertIn("Access-Control-Expose-Headers", response.headers)
 
 
+class TestServe(unittest.TestCase):
+    """Test cases for starting the server and its background services"""
+
+    def _serve(self, debug: bool, environ: dict[str, str]) -> MagicMock:
+        app = MagicMock()
+        with (
+            patch.dict(os.environ, environ),
+            patch("src.app.signal.signal"),
+            patch("src.app.start_background_services") as start,
+        ):
+            serve(app, port=8123, debug=debug)
+        app.run.assert_called_once_with(host="0.0.0.0", port=8123, debug=debug)
+        return start
+
+    def test_services_start_without_the_reloader(self) -> None:
+        """Test that the warmer and config watcher start when serving directly"""
+        start = self._serve(debug=False, environ={})
+
+        start.assert_called_once()
+
+    def test_services_start_only_in_the_reloader_child(self) -> None:
+        """Test that the reloader's watching parent doesn't start them"""
+        os.environ.pop("WERKZEUG_RUN_MAIN", None)
+        self._serve(debug=True, environ={}).assert_not_called()
+        self._serve(debug=True, environ={"WERKZEUG_RUN_MAIN": "true"}).assert_called_once()
+
+    def test_parsed_states_are_stored_on_shutdown(self) -> None:
+        """Test that the game state cache is persisted when a signal stops the server"""
+        app = MagicMock()
+        app.run.side_effect = SystemExit(0)
+        with (
+            patch("src.app.signal.signal"),
+            patch("src.app.start_background_services"),
+            self.assertRaises(SystemExit),
+        ):
+            serve(app)
+
+        app.config["GAME_STATE_CACHE"].persist.assert_called_once()
+
+    def test_start_background_services(self) -> None:
+        """Test that both the cache warmer and the config watcher are started"""
+        app = MagicMock()
+        with (
+            patch("src.app.start_cache_warmer") as warmer,
+            patch("src.app.ConfigWatcher") as watcher,
+        ):
+            start_background_services(app)
+
+        warmer.assert_called_once_with(app)
+        watcher.return_value.start.assert_called_once()
+        app.config["SAMPLING_PROFILER"].start.assert_called_once()
+
+    def test_create_app_does_not_start_the_profiler(self) -> None:
+        """Test that building an app (tests, tools) leaves the sampler thread alone"""
+        profiler = SamplingProfiler(sample_hz=100)
+        create_app(profiler=profiler)
+
+        self.assertFalse(profiler.is_running)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for the headless command line interface
+"""
+
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+from src.cli import main, watch
+from tests.helpers import GrowingLogTestCase, mock_game
+
+
+class TestCli(GrowingLogTestCase):
+    """Test cases for `python -m src.cli watch`"""
+
+    def test_watch_prints_only_new_versions(self) -> None:
+        """Test that each state is printed once, in text form"""
+        out = io.StringIO()
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            # The first poll after printing sees no change; grow on the second
+            if len(sleeps) == 2:
+                self._grow()
+
+        watch(self.log_path, interval=0.5, out=out, count=2, sleep=sleep)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0], "game.txt v1 turn 1: deck 1, discarded 0, removed 0, in hands 0")
+        self.assertTrue(lines[1].startswith("game.txt v2 turn 2:"))
+        self.assertEqual(sleeps, [0.5, 0.5])
+
+    def test_watch_waits_for_a_log(self) -> None:
+        """Test that the configured or latest log is resolved on every poll"""
+        out = io.StringIO()
+        resolved = iter([None, None, self.log_path])
+
+        watch(out=out, count=1, resolve=lambda: next(resolved), sleep=lambda s: None)
+
+        self.assertEqual(len(out.getvalue().splitlines()), 1)
+
+    def test_watch_survives_a_log_that_never_parsed(self) -> None:
+        """Test that a half-written log with no earlier state doesn't end the watch"""
+        parse = self.parser_class.return_value.parse_game_log
+        parse.side_effect = ValueError("half-written")
+        out = io.StringIO()
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            if len(sleeps) == 3:
+                parse.side_effect = lambda path: mock_game(self.turn)
+                self._grow()
+
+        with self.assertLogs("src.tracker", level="ERROR"):
+            status = watch(self.log_path, out=out, count=1, sleep=sleep)
+
+        self.assertEqual(status, 0)
+        self.assertTrue(out.getvalue().startswith("game.txt v1 turn 2:"))
+
+    def test_ndjson_output(self) -> None:
+        """Test `watch --ndjson` through the argument parser"""
+        out = io.StringIO()
+        with patch("sys.stdout", out):
+            status = main(["watch", "--log", self.log_path, "--ndjson", "--count", "1"])
+
+        line = json.loads(out.getvalue())
+        self.assertEqual(status, 0)
+        self.assertEqual(line["path"], self.log_path)
+        self.assertEqual(line["version"], 1)
+        self.assertEqual(line["turn"], 1)
+        self.assertEqual(line["deck"], [{"name": "Fidel", "side": "USSR", "ops": 2}])
+        self.assertIn("time", line)
+
+
+if __name__ == "__main__":
+    unittest.main()
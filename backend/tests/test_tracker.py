@@ -0,0 +1,150 @@
+"""
+Tests for the embeddable game tracker
+"""
+
+import asyncio
+import threading
+import unittest
+
+from src.models.game_data import GameStatus
+from src.tracker import GameTracker, TrackerClosedError
+from tests.helpers import GrowingLogTestCase, mock_game
+
+
+class TestGameTracker(GrowingLogTestCase):
+    """Test cases for GameTracker"""
+
+    def test_snapshot_parses_only_changed_logs(self) -> None:
+        """Test that an unchanged log is not parsed again"""
+        with GameTracker(self.log_path) as tracker:
+            first = tracker.snapshot()
+            again = tracker.snapshot()
+            self._grow()
+            changed = tracker.snapshot()
+
+        assert first is not None and again is not None and changed is not None
+        self.assertIs(first.record, again.record)
+        self.assertEqual((first.version, changed.version), (1, 2))
+        self.assertEqual(changed.record.turn, 2)
+        self.assertIsInstance(changed.status, GameStatus)
+        self.assertEqual(changed.to_dict()["deck"], [{"name": "Fidel", "side": "USSR", "ops": 2}])
+        self.assertEqual(self.parser_class.return_value.parse_game_log.call_count, 2)
+
+    def test_snapshot_without_a_log(self) -> None:
+        """Test that there is no state until a log exists"""
+        with GameTracker(resolve=lambda: None) as tracker:
+            self.assertIsNone(tracker.snapshot())
+
+    def test_changes_yields_only_new_versions(self) -> None:
+        """Test the blocking generator, including a parse error in between"""
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            if len(sleeps) == 1:
+                self.parser_class.return_value.parse_game_log.side_effect = ValueError("bad")
+                self._grow()
+            elif len(sleeps) == 2:
+                self.parser_class.return_value.parse_game_log.side_effect = lambda path: mock_game(
+                    self.turn
+                )
+                self._grow()
+
+        with GameTracker(self.log_path, interval=0.25, sleep=sleep) as tracker:
+            changes = tracker.changes()
+            states = [next(changes), next(changes), next(changes)]
+
+        self.assertEqual([state.version for state in states], [1, 2, 3])
+        # The failed parse is reported once, as the last good state marked stale
+        self.assertTrue(states[1].record.stale)
+        self.assertEqual((states[1].record.turn, states[1].record.error), (1, "bad"))
+        self.assertFalse(states[2].record.stale)
+        self.assertEqual(states[2].record.turn, 3)
+        self.assertEqual(sleeps, [0.25, 0.25])
+
+    def test_log_that_never_parsed_waits_for_a_change(self) -> None:
+        """Test that a log without a good state is retried once it changes, not crashed on"""
+        self.parser_class.return_value.parse_game_log.side_effect = ValueError("half-written")
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            # The second poll sees the same, quarantined contents
+            if len(sleeps) == 2:
+                self.parser_class.return_value.parse_game_log.side_effect = lambda path: mock_game(
+                    self.turn
+                )
+                self._grow()
+
+        with GameTracker(self.log_path, interval=0.25, sleep=sleep) as tracker:
+            with self.assertLogs("src.tracker", level="ERROR") as logs:
+                state = next(tracker.changes())
+
+        self.assertEqual(state.record.turn, 2)
+        self.assertFalse(state.record.stale)
+        self.assertEqual(sleeps, [0.25, 0.25])
+        # Reported once, then skipped until the log changed
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(self.parser_class.return_value.parse_game_log.call_count, 2)
+
+    def test_runtime_errors_are_retried(self) -> None:
+        """Test that a RuntimeError from the parser doesn't end changes()"""
+        self.parser_class.return_value.parse_game_log.side_effect = RuntimeError("locked")
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            self.parser_class.return_value.parse_game_log.side_effect = lambda path: mock_game(
+                self.turn
+            )
+            self._grow()
+
+        with GameTracker(self.log_path, interval=0.25, sleep=sleep) as tracker:
+            with self.assertLogs("src.tracker", level="ERROR"):
+                state = next(tracker.changes())
+
+        self.assertEqual(state.record.turn, 2)
+        self.assertEqual(sleeps, [0.25])
+
+    def test_close_ends_blocking_changes(self) -> None:
+        """Test that close() wakes a waiting changes() loop and drops the state"""
+        tracker = GameTracker(self.log_path, interval=30)
+        seen: list[int] = []
+
+        def consume() -> None:
+            for state in tracker.changes():
+                seen.append(state.version)
+
+        thread = threading.Thread(target=consume)
+        thread.start()
+        while not seen:
+            thread.join(0.01)
+        tracker.close()
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(seen, [1])
+        self.assertTrue(tracker.closed)
+        self.assertEqual(len(tracker._cache), 0)
+        with self.assertRaises(TrackerClosedError):
+            tracker.snapshot()
+
+    def test_async_changes(self) -> None:
+        """Test the async generator"""
+
+        async def follow() -> list[int]:
+            versions = []
+            async with GameTracker(self.log_path, interval=0.01) as tracker:
+                async for state in tracker.achanges():
+                    versions.append(state.version)
+                    if len(versions) == 1:
+                        self._grow()
+                    else:
+                        break
+            return versions
+
+        self.assertEqual(asyncio.run(follow()), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
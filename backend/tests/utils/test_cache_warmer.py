@@ -0,0 +1,69 @@
+"""
+Tests for startup cache warming
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.app import create_app
+from src.models.game_data import GameStatus
+from src.utils.cache_warmer import start_cache_warmer, warm_cache
+from src.utils.game_state import GameStateCache
+from src.utils.sampling_profiler import SamplingProfiler
+
+
+class TestCacheWarmer(unittest.TestCase):
+    """Test cases for cache warming"""
+
+    def setUp(self) -> None:
+        """Create a log file and a counting parse function"""
+        self.test_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.test_dir, "game.txt")
+        with open(self.log_path, "w") as f:
+            f.write("Turn 1\n")
+        self.parsed: list[str] = []
+
+    def tearDown(self) -> None:
+        """Remove the log directory"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _parse(self, path: str) -> GameStatus:
+        self.parsed.append(path)
+        return GameStatus(status="ok", filename=os.path.basename(path), turn=1)
+
+    def test_warm_cache_primes_entry_and_body(self) -> None:
+        """Test that warming parses the log and pre-serializes its JSON body"""
+        cache = GameStateCache(parse=self._parse)
+
+        warmed = warm_cache(cache, resolve=lambda: self.log_path)
+        entry = cache.get_entry(self.log_path)
+
+        self.assertEqual(warmed, self.log_path)
+        self.assertEqual(self.parsed, [self.log_path])
+        self.assertIn(("json", ""), entry.encoded)
+
+    def test_warm_cache_without_log(self) -> None:
+        """Test that warming is skipped when there is no log"""
+        cache = GameStateCache(parse=self._parse)
+
+        self.assertIsNone(warm_cache(cache, resolve=lambda: None))
+        self.assertEqual(len(cache), 0)
+
+    def test_background_warmer_survives_errors(self) -> None:
+        """Test that a failing warm-up does not raise out of the thread"""
+        app = create_app(profiler=SamplingProfiler(sample_hz=0))
+
+        def fail() -> str | None:
+            raise OSError("log directory unavailable")
+
+        thread = start_cache_warmer(app, resolve=fail)
+        thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(app.config["GAME_STATE_CACHE"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
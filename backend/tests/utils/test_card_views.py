@@ -0,0 +1,98 @@
+"""
+Tests for server-side card views
+"""
+
+import unittest
+
+from src.models.game_data import Card, GameStatus
+from src.utils.card_views import CardView, render_view
+
+
+def _card(name: str, side: str, ops: int) -> Card:
+    return Card(name=name, side=side, ops=ops)
+
+
+class TestCardViews(unittest.TestCase):
+    """Test cases for sorting and grouping card lists"""
+
+    def setUp(self) -> None:
+        """Set up a status with a mixed deck"""
+        self.status = GameStatus(
+            status="ok",
+            turn=5,
+            deck=[
+                _card("Blockade", "USSR", 1),
+                _card("Arms Race", "Neutral", 3),
+                _card("Duck and Cover", "US", 3),
+                _card("CIA Created", "US", 1),
+                _card("Brezhnev Doctrine", "USSR", 3),
+            ],
+        )
+
+    def test_sort_orders_match_frontend(self) -> None:
+        """Test name, ops-asc and ops-desc ordering with side then name tie-breaks"""
+        by_name = render_view(self.status, CardView(sort="name"))
+        ops_desc = render_view(self.status, CardView(sort="ops-desc"))
+        ops_asc = render_view(self.status, CardView(sort="ops-asc"))
+
+        self.assertEqual(
+            [c["name"] for c in by_name["deck"]],
+            ["Arms Race", "Blockade", "Brezhnev Doctrine", "CIA Created", "Duck and Cover"],
+        )
+        self.assertEqual(
+            [c["name"] for c in ops_desc["deck"]],
+            ["Duck and Cover", "Brezhnev Doctrine", "Arms Race", "CIA Created", "Blockade"],
+        )
+        self.assertEqual([c["name"] for c in ops_asc["deck"]][:2], ["CIA Created", "Blockade"])
+
+    def test_grouped_view_counts_and_totals(self) -> None:
+        """Test per-side groups with counts and ops totals"""
+        payload = render_view(self.status, CardView(view="grouped", sort="ops-desc"))
+        deck = payload["groups"]["deck"]
+
+        self.assertEqual(list(deck), ["us", "ussr", "neutral"])
+        self.assertEqual(deck["us"]["count"], 2)
+        self.assertEqual(deck["us"]["ops_total"], 4)
+        self.assertEqual(deck["ussr"]["cards"][0]["name"], "Brezhnev Doctrine")
+        self.assertEqual(payload["groups"]["discarded"]["neutral"]["count"], 0)
+
+    def test_unknown_side_grouped_separately(self) -> None:
+        """Test that cards without a known side are not dropped"""
+        status = GameStatus(status="ok", deck=[_card("Mystery", "", 0)])
+
+        groups = render_view(status, CardView(view="grouped"))["groups"]["deck"]
+
+        self.assertEqual(groups["unknown"]["count"], 1)
+        self.assertEqual(groups["unknown"]["cards"][0]["name"], "Mystery")
+
+    def test_status_not_modified(self) -> None:
+        """Test that rendering a view leaves the cached status untouched"""
+        render_view(self.status, CardView(sort="name"))
+
+        self.assertEqual(self.status.deck[0].name, "Blockade")
+
+    def test_from_args(self) -> None:
+        """Test parsing and validating query arguments"""
+        self.assertTrue(CardView.from_args({}).is_default)
+        self.assertEqual(
+            CardView.from_args({"view": "grouped", "sort": "name"}).key, "grouped:name:"
+        )
+        self.assertEqual(
+            CardView.from_args({"fields": "deck, turn"}).fields,
+            CardView.from_args({"fields": "turn,deck"}).fields,
+        )
+        with self.assertRaises(ValueError):
+            CardView.from_args({"sort": "random"})
+        with self.assertRaises(ValueError):
+            CardView.from_args({"fields": "turn,secrets"})
+
+    def test_fields_projection(self) -> None:
+        """Test that only the requested fields, plus status, are returned"""
+        payload = render_view(self.status, CardView(view="grouped", fields=("turn", "deck")))
+
+        self.assertEqual(set(payload), {"status", "turn", "deck", "groups"})
+        self.assertEqual(list(payload["groups"]), ["deck"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests for negotiated response compression
+"""
+
+import gzip
+import json
+import unittest
+
+from flask import Flask, jsonify
+
+from src.utils.compression import ResponseCompressor
+
+
+class TestResponseCompressor(unittest.TestCase):
+    """Test cases for ResponseCompressor"""
+
+    def setUp(self) -> None:
+        """Set up a small app with a large and a small JSON endpoint"""
+        self.app = Flask(__name__)
+        self.compressor = ResponseCompressor(self.app, min_size=256)
+        self.payload = {"cards": [{"name": f"Card {i}", "ops": i % 4} for i in range(110)]}
+
+        @self.app.route("/large")
+        def large():  # type: ignore[no-untyped-def]
+            return jsonify(self.payload)
+
+        @self.app.route("/small")
+        def small():  # type: ignore[no-untyped-def]
+            return jsonify({"ok": True})
+
+        @self.app.route("/missing")
+        def missing():  # type: ignore[no-untyped-def]
+            return jsonify(self.payload), 404
+
+        self.client = self.app.test_client()
+
+    def test_gzip_when_accepted(self) -> None:
+        """Test that large JSON bodies are gzipped for clients that accept gzip"""
+        response = self.client.get("/large", headers={"Accept-Encoding": "gzip, deflate"})
+
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        body = response.get_data()
+        self.assertEqual(int(response.headers["Content-Length"]), len(body))
+        self.assertEqual(json.loads(gzip.decompress(body)), self.payload)
+
+    def test_identity_without_accept_encoding(self) -> None:
+        """Test that bodies are sent as-is when the client accepts no encoding"""
+        response = self.client.get("/large")
+
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertEqual(response.get_json(), self.payload)
+
+    def test_small_and_error_bodies_not_compressed(self) -> None:
+        """Test that small bodies and non-200 responses are left alone"""
+        small = self.client.get("/small", headers={"Accept-Encoding": "gzip"})
+        missing = self.client.get("/missing", headers={"Accept-Encoding": "gzip"})
+
+        self.assertNotIn("Content-Encoding", small.headers)
+        self.assertNotIn("Content-Encoding", missing.headers)
+
+    def test_rejected_encoding_not_used(self) -> None:
+        """Test that gzip;q=0 disables compression"""
+        response = self.client.get("/large", headers={"Accept-Encoding": "gzip;q=0"})
+
+        self.assertNotIn("Content-Encoding", response.headers)
+
+    def test_unchanged_body_compressed_once(self) -> None:
+        """Test that repeated polls of an unchanged body reuse the compressed bytes"""
+        for _ in range(3):
+            self.client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        stats = self.compressor.stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["cached_bodies"], 1)
+
+    def test_cache_is_bounded(self) -> None:
+        """Test that the compressed body cache evicts old entries"""
+        compressor = ResponseCompressor(cache_size=2)
+        for i in range(4):
+            compressor.compress(str(i).encode() * 100, "gzip")
+
+        self.assertEqual(compressor.stats()["cached_bodies"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Tests for log file fingerprints
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.utils.fingerprint import Fingerprint, file_fingerprint, only_appended
+
+
+class TestFileFingerprint(unittest.TestCase):
+    """Test cases for file_fingerprint"""
+
+    def setUp(self) -> None:
+        """Create a log directory"""
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "game.txt")
+        self._write(self.path, b"Turn 1\nUSSR plays Fidel\n")
+
+    def tearDown(self) -> None:
+        """Remove the log directory"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _write(self, path: str, data: bytes) -> None:
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def _fingerprint(self, path: str) -> Fingerprint:
+        fingerprint = file_fingerprint(path)
+        assert fingerprint is not None
+        return fingerprint
+
+    def test_unchanged_file_is_stable(self) -> None:
+        """Test that an untouched file keeps its fingerprint"""
+        self.assertEqual(self._fingerprint(self.path), self._fingerprint(self.path))
+
+    def test_append_changes_fingerprint(self) -> None:
+        """Test that appended lines are detected"""
+        before = self._fingerprint(self.path)
+        with open(self.path, "ab") as f:
+            f.write(b"US plays Duck and Cover\n")
+
+        after = self._fingerprint(self.path)
+        self.assertNotEqual(before, after)
+        self.assertGreater(after.size, before.size)
+
+    def test_same_size_rewrite_with_restored_mtime(self) -> None:
+        """Test a rewrite that keeps the size and the mtime, like a coarse-resolution filesystem"""
+        before = self._fingerprint(self.path)
+        self._write(self.path, b"Turn 2\nUSSR plays Fidel\n")
+        os.utime(self.path, ns=(before.mtime_ns, before.mtime_ns))
+
+        after = self._fingerprint(self.path)
+        self.assertEqual((after.size, after.mtime_ns), (before.size, before.mtime_ns))
+        self.assertNotEqual(after, before)
+
+    def test_coarse_mtime_in_large_file(self) -> None:
+        """Test that only the tail of a large file needs to differ"""
+        body = b"x" * 100_000
+        self._write(self.path, body + b"Turn 3\n")
+        before = self._fingerprint(self.path)
+        self._write(self.path, body + b"Turn 4\n")
+        os.utime(self.path, ns=(before.mtime_ns, before.mtime_ns))
+
+        self.assertNotEqual(self._fingerprint(self.path).tail_hash, before.tail_hash)
+
+    def test_replaced_file_changes_inode(self) -> None:
+        """Test that an editor's save-by-rename is detected even with identical content"""
+        before = self._fingerprint(self.path)
+        replacement = os.path.join(self.test_dir, "game.txt.tmp")
+        with open(self.path, "rb") as f:
+            self._write(replacement, f.read())
+        # Keep the original inode alive so the new file cannot reuse it
+        keep = os.path.join(self.test_dir, "game.txt.bak")
+        os.link(self.path, keep)
+        os.replace(replacement, self.path)
+        os.utime(self.path, ns=(before.mtime_ns, before.mtime_ns))
+
+        after = self._fingerprint(self.path)
+        self.assertEqual(after.tail_hash, before.tail_hash)
+        self.assertNotEqual(after.inode, before.inode)
+        self.assertNotEqual(after, before)
+
+    def test_missing_file(self) -> None:
+        """Test that unreadable files have no fingerprint"""
+        self.assertIsNone(file_fingerprint(os.path.join(self.test_dir, "missing.txt")))
+
+    def test_only_appended(self) -> None:
+        """Test telling a log that grew from one rewritten in place"""
+        before = self._fingerprint(self.path)
+        self.assertTrue(only_appended(self.path, before))
+
+        with open(self.path, "ab") as f:
+            f.write(b"US plays Duck and Cover\n")
+        self.assertTrue(only_appended(self.path, before))
+
+        with open(self.path, "r+b") as f:
+            f.write(b"Turn 9")
+        self.assertFalse(only_appended(self.path, before))
+        self.assertFalse(only_appended(os.path.join(self.test_dir, "missing.txt"), before))
+
+    def test_token(self) -> None:
+        """Test the string form used for ETags and keys"""
+        fingerprint = Fingerprint(inode=1, size=2, mtime_ns=3, tail_hash=255)
+
+        self.assertEqual(fingerprint.token, "1-2-3-00000000000000ff")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,354 @@
+"""
+Tests for per-file game state tracking
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.config.config_manager import ConfigChange
+from src.models.game_data import Card, ConfigModel, GameDataFormatter, GameStatus
+from src.utils.game_state import (
+    QUARANTINE_BACKOFF_SECONDS,
+    GameSnapshot,
+    GameStateCache,
+    QuarantinedLogError,
+    file_fingerprint,
+    parse_log_status,
+)
+
+
+class TestGameStateCache(unittest.TestCase):
+    """Test cases for GameStateCache"""
+
+    def setUp(self) -> None:
+        """Create a log directory and a counting parse function"""
+        self.test_dir = tempfile.mkdtemp()
+        self.parsed: list[str] = []
+        self.parse_error: Exception | None = None
+        self.now = 1000.0
+
+    def tearDown(self) -> None:
+        """Remove the log directory"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _parse(self, path: str) -> GameStatus:
+        self.parsed.append(path)
+        if self.parse_error is not None:
+            raise self.parse_error
+        return GameStatus(status="ok", filename=os.path.basename(path), turn=len(self.parsed))
+
+    def _cache(self, max_entries: int = 32, ttl: float = 1800) -> GameStateCache:
+        return GameStateCache(
+            max_entries=max_entries, ttl=ttl, parse=self._parse, clock=lambda: self.now
+        )
+
+    def _write(self, name: str, content: str) -> str:
+        path = os.path.join(self.test_dir, name)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_unchanged_file_is_parsed_once(self) -> None:
+        """Test that repeated requests for an unchanged file hit the cache"""
+        cache = self._cache()
+        path = self._write("game.txt", "Turn 1")
+
+        first = cache.get_entry(path).record
+        second = cache.get_entry(path).record
+
+        self.assertIs(first, second)
+        self.assertEqual(self.parsed, [path])
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_changed_file_is_reparsed(self) -> None:
+        """Test that a growing file is re-parsed and its version bumped"""
+        cache = self._cache()
+        path = self._write("game.txt", "Turn 1")
+        first = cache.get_entry(path)
+
+        with open(path, "a") as f:
+            f.write("\nTurn 2")
+        second = cache.get_entry(path)
+
+        self.assertEqual(len(self.parsed), 2)
+        self.assertEqual(second.version, first.version + 1)
+
+    def test_files_are_tracked_independently(self) -> None:
+        """Test that each file keeps its own state"""
+        cache = self._cache()
+        a = self._write("a.txt", "a")
+        b = self._write("b.txt", "b")
+
+        self.assertEqual(cache.get_status(a).filename, "a.txt")
+        self.assertEqual(cache.get_status(b).filename, "b.txt")
+        cache.get_status(a)
+
+        self.assertEqual(self.parsed, [a, b])
+        self.assertEqual(len(cache), 2)
+
+    def test_least_recently_used_entry_is_evicted(self) -> None:
+        """Test LRU eviction once max_entries is exceeded"""
+        cache = self._cache(max_entries=2)
+        a, b, c = (self._write(f"{n}.txt", n) for n in "abc")
+
+        cache.get_status(a)
+        cache.get_status(b)
+        cache.get_status(a)
+        cache.get_status(c)
+
+        self.assertIn(a, cache)
+        self.assertNotIn(b, cache)
+        self.assertIn(c, cache)
+
+    def test_idle_entries_expire(self) -> None:
+        """Test TTL eviction of entries that were not accessed"""
+        cache = self._cache(ttl=60)
+        a = self._write("a.txt", "a")
+        b = self._write("b.txt", "b")
+        cache.get_status(a)
+
+        self.now += 61
+        cache.get_status(b)
+
+        self.assertNotIn(a, cache)
+        self.assertIn(b, cache)
+
+    def test_missing_file_is_not_cached(self) -> None:
+        """Test that files without a fingerprint are parsed but not cached"""
+        cache = self._cache()
+        path = os.path.join(self.test_dir, "missing.txt")
+
+        cache.get_status(path)
+        cache.get_status(path)
+
+        self.assertEqual(len(self.parsed), 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_failed_parse_serves_last_good_state_as_stale(self) -> None:
+        """Test that a log that fails to parse is quarantined until it changes"""
+        cache = self._cache()
+        path = self._write("game.txt", "Turn 1")
+        good = cache.get_entry(path)
+
+        with open(path, "a") as f:
+            f.write("\nTurn 2, Headl")
+        self.parse_error = ValueError("truncated line")
+        stale = cache.get_entry(path)
+        again = cache.get_entry(path)
+
+        self.assertTrue(stale.stale)
+        self.assertTrue(stale.record.stale)
+        self.assertEqual(stale.record.error, "truncated line")
+        self.assertEqual(stale.record.turn, good.record.turn)
+        self.assertEqual(stale.version, good.version + 1)
+        self.assertIs(again, stale)
+        self.assertEqual(len(self.parsed), 2)
+        self.assertEqual(cache.stats()["quarantined"], 1)
+
+        # Once the line is complete the log parses again
+        with open(path, "a") as f:
+            f.write("ine Phase")
+        self.parse_error = None
+        fixed = cache.get_entry(path)
+
+        self.assertFalse(fixed.stale)
+        self.assertEqual(fixed.version, stale.version + 1)
+        self.assertIsNone(cache.failure(path))
+
+    def test_failed_parse_without_earlier_state_backs_off(self) -> None:
+        """Test that unchanged bad contents are retried only after a backoff"""
+        cache = self._cache()
+        path = self._write("game.txt", "garbage")
+        self.parse_error = ValueError("not a game log")
+
+        with self.assertRaises(ValueError):
+            cache.get_entry(path)
+        with self.assertRaises(QuarantinedLogError):
+            cache.get_entry(path)
+        self.assertEqual(len(self.parsed), 1)
+
+        self.now += QUARANTINE_BACKOFF_SECONDS
+        with self.assertRaises(ValueError):
+            cache.get_entry(path)
+        failure = cache.failure(path)
+
+        self.assertEqual(len(self.parsed), 2)
+        assert failure is not None
+        self.assertEqual(failure.failures, 2)
+        self.assertEqual(failure.retry_at, self.now + 2 * QUARANTINE_BACKOFF_SECONDS)
+
+    def test_failures_are_bounded(self) -> None:
+        """Test that quarantine records don't outgrow the cache or outlive evicted entries"""
+        cache = self._cache(max_entries=2)
+        self.parse_error = ValueError("not a game log")
+        for i in range(5):
+            with self.assertRaises(ValueError):
+                cache.get_entry(self._write(f"bad-{i}.txt", "garbage"))
+
+        self.assertEqual(cache.stats()["quarantined"], 2)
+        self.assertIsNotNone(cache.failure(os.path.join(self.test_dir, "bad-4.txt")))
+        self.assertIsNone(cache.failure(os.path.join(self.test_dir, "bad-0.txt")))
+
+    def test_evicted_entry_takes_its_failure_along(self) -> None:
+        """Test that evicting a stale entry also drops its quarantine record"""
+        cache = self._cache(max_entries=1)
+        path = self._write("game.txt", "Turn 1")
+        cache.get_entry(path)
+        self.parse_error = ValueError("half-written line")
+        self._write("game.txt", "Turn 1\nTurn")
+        self.assertTrue(cache.get_entry(path).stale)
+
+        self.parse_error = None
+        cache.get_entry(self._write("other.txt", "Turn 1"))
+
+        self.assertIsNone(cache.failure(path))
+        self.assertEqual(cache.stats()["quarantined"], 0)
+
+    def test_invalidate(self) -> None:
+        """Test dropping entries explicitly"""
+        cache = self._cache()
+        path = self._write("game.txt", "Turn 1")
+        cache.get_status(path)
+
+        cache.invalidate(path)
+
+        self.assertEqual(len(cache), 0)
+
+    def test_config_change_evicts_only_logs_outside_new_directory(self) -> None:
+        """Test that a log directory change keeps the states still in use"""
+        cache = self._cache()
+        kept = self._write("game.txt", "Turn 1")
+        other_dir = tempfile.mkdtemp(dir=self.test_dir)
+        configured = os.path.join(other_dir, "pinned.txt")
+        with open(configured, "w") as f:
+            f.write("Turn 2")
+        dropped = os.path.join(other_dir, "old.txt")
+        with open(dropped, "w") as f:
+            f.write("Turn 3")
+        for path in (kept, configured, dropped):
+            cache.get_status(path)
+
+        old = ConfigModel(log_directory=other_dir)
+        # Changing fields that don't affect log resolution evicts nothing
+        cache.on_config_change(ConfigChange(old, old, "update"))
+        self.assertEqual(len(cache), 3)
+
+        new = ConfigModel(log_directory=self.test_dir, log_file_path=configured)
+        cache.on_config_change(ConfigChange(old, new, "external"))
+
+        self.assertIn(kept, cache)
+        self.assertIn(configured, cache)
+        self.assertNotIn(dropped, cache)
+
+    def test_concurrent_requests_parse_once(self) -> None:
+        """Test that a burst of requests for a changed file shares one parse"""
+        release = threading.Event()
+
+        def slow_parse(path: str) -> GameStatus:
+            release.wait(5)
+            return self._parse(path)
+
+        cache = GameStateCache(parse=slow_parse)
+        path = self._write("game.txt", "Turn 1")
+        threads = [threading.Thread(target=cache.get_status, args=(path,)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        while cache.stats()["coalesced"] < 5:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(self.parsed, [path])
+        self.assertEqual(len(cache), 1)
+
+    def test_file_fingerprint(self) -> None:
+        """Test the fingerprint used by the cache"""
+        path = self._write("game.txt", "abc")
+
+        fingerprint = file_fingerprint(path)
+        self.assertIsNotNone(fingerprint)
+        self.assertEqual(fingerprint.size if fingerprint else None, 3)
+        self.assertIsNone(file_fingerprint(os.path.join(self.test_dir, "missing.txt")))
+
+
+class TestParseLogStatus(unittest.TestCase):
+    """Test cases for parse_log_status"""
+
+    @patch("src.utils.game_state.log_parser.LogParser")
+    def test_no_game_data(self, mock_parser_class: MagicMock) -> None:
+        """Test that an empty parse yields a no game data status"""
+        mock_parser_class.return_value.parse_game_log.return_value = None
+
+        status = parse_log_status("/logs/game.txt")
+
+        self.assertEqual(status.status, "no game data")
+        self.assertEqual(status.filename, "game.txt")
+
+    @patch("src.utils.game_state.log_parser.LogParser")
+    def test_formats_current_play(self, mock_parser_class: MagicMock) -> None:
+        """Test that a parsed game is formatted with its filename"""
+        card = MagicMock()
+        card.name, card.side, card.ops = "Cuba", "USSR", 2
+        game = MagicMock()
+        game.CARDS = {"Cuba": card}
+        game.current_play.turn = 4
+        game.current_play.possible_draw_cards = ["Cuba"]
+        game.current_play.discarded_cards = []
+        game.current_play.removed_cards = []
+        game.current_play.cards_in_hands = []
+        mock_parser_class.return_value.parse_game_log.return_value = game
+
+        status = parse_log_status("/logs/game.txt")
+
+        self.assertEqual(status.status, "ok")
+        self.assertEqual(status.turn, 4)
+        self.assertEqual(status.filename, "game.txt")
+        self.assertEqual(status.deck[0].name, "Cuba")
+
+
+class TestGameSnapshot(unittest.TestCase):
+    """Test cases for lazily formatted snapshots"""
+
+    def test_sections_formatted_on_demand(self) -> None:
+        """Test that only requested card lists are formatted, once each"""
+        card = MagicMock()
+        card.name, card.side, card.ops = "Cuba", "USSR", 2
+        game = MagicMock()
+        game.CARDS = {"Cuba": card}
+        game.current_play.turn = 2
+        game.current_play.possible_draw_cards = ["Cuba"]
+        game.current_play.discarded_cards = ["Cuba"]
+        snapshot = GameSnapshot("game.txt", game)
+
+        with patch(
+            "src.utils.game_state.GameDataFormatter.section_records",
+            wraps=GameDataFormatter.section_records,
+        ) as section_records:
+            partial = snapshot.record(["turn", "deck"])
+            snapshot.record(["deck"])
+            full = snapshot.record()
+
+        sections = [c.args[2] for c in section_records.call_args_list]
+        self.assertEqual(sections, ["deck", "discarded", "removed", "cards_in_hands"])
+        self.assertEqual(partial.discarded, ())
+        self.assertEqual(full.discarded[0].name, "Cuba")
+        self.assertIs(snapshot.record(), full)
+
+    def test_status_model_built_from_record(self) -> None:
+        """Test that the pydantic status matches the record it is built from"""
+        status = GameStatus(status="ok", turn=3, deck=[Card(name="Cuba", side="USSR", ops=2)])
+        snapshot = GameSnapshot.from_status(status)
+
+        self.assertEqual(snapshot.status(), status)
+        self.assertEqual(snapshot.record().to_dict(), status.model_dump())
+        self.assertIsNot(snapshot.status(), snapshot.status())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Tests for compressed log archive support
+"""
+
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.utils.log_archive import (
+    archive_info,
+    is_archive,
+    is_log_file,
+    iter_log_lines,
+    parseable_path,
+    scan_log_page,
+)
+from src.utils.log_utils import list_log_files
+
+LOG_TEXT = "Header\nTurn 1, Headline Phase\nUSSR plays Fidel\nTurn 2, Headline Phase\nEnd\n"
+
+
+class TestLogArchive(unittest.TestCase):
+    """Test cases for compressed log archive support"""
+
+    def setUp(self) -> None:
+        """Write the same log plain and in every archive format"""
+        self.test_dir = tempfile.mkdtemp()
+        self.paths = {"txt": os.path.join(self.test_dir, "game.txt")}
+        with open(self.paths["txt"], "w", encoding="utf-8") as f:
+            f.write(LOG_TEXT)
+        for suffix, module in (("gz", gzip), ("bz2", bz2), ("xz", lzma)):
+            path = os.path.join(self.test_dir, f"game.txt.{suffix}")
+            with module.open(path, "wb") as f:
+                f.write(LOG_TEXT.encode("utf-8"))
+            self.paths[suffix] = path
+
+    def tearDown(self) -> None:
+        """Remove the test directory"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_recognizes_log_names(self) -> None:
+        """Test plain and archived log name detection"""
+        for name in ("a.txt", "a.txt.gz", "a.txt.bz2", "a.txt.xz"):
+            self.assertTrue(is_log_file(name), name)
+        for name in ("a.gz", "a.json", "a.txt.zip"):
+            self.assertFalse(is_log_file(name), name)
+        self.assertTrue(is_archive("a.txt.xz"))
+        self.assertFalse(is_archive("a.txt"))
+        self.assertEqual(archive_info("a.txt.bz2"), {"compressed": True, "compression": "bz2"})
+
+    def test_iter_log_lines_all_formats(self) -> None:
+        """Test that every format streams the same lines"""
+        expected = LOG_TEXT.splitlines()
+        for name, path in self.paths.items():
+            self.assertEqual(list(iter_log_lines(path)), expected, name)
+
+    def test_parseable_path_decompresses_to_temp_file(self) -> None:
+        """Test that archives are decompressed to a temporary file that is cleaned up"""
+        with parseable_path(self.paths["gz"]) as path:
+            self.assertNotEqual(path, self.paths["gz"])
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), LOG_TEXT)
+        self.assertFalse(os.path.exists(path))
+
+    def test_parseable_path_passes_plain_logs_through(self) -> None:
+        """Test that plain logs are not copied"""
+        with parseable_path(self.paths["txt"]) as path:
+            self.assertEqual(path, self.paths["txt"])
+        self.assertTrue(os.path.exists(self.paths["txt"]))
+
+    def test_scan_log_page(self) -> None:
+        """Test paging through an archive by line and by turn"""
+        page = scan_log_page(self.paths["xz"], start=1, count=2)
+        self.assertEqual(page["total_lines"], 5)
+        self.assertEqual(page["lines"], ["Turn 1, Headline Phase", "USSR plays Fidel"])
+        self.assertEqual(page["turns"], {1: 1, 2: 3})
+
+        by_turn = scan_log_page(self.paths["xz"], count=10, turn=2)
+        self.assertEqual(by_turn["start"], 3)
+        self.assertEqual(by_turn["lines"], ["Turn 2, Headline Phase", "End"])
+        self.assertIsNone(scan_log_page(self.paths["xz"], turn=9)["start"])
+
+    def test_list_log_files_includes_archives(self) -> None:
+        """Test that directory discovery finds archives unless excluded"""
+        with open(os.path.join(self.test_dir, "notes.json"), "w") as f:
+            f.write("{}")
+
+        all_logs = sorted(e.name for e in list_log_files(self.test_dir))
+        plain = [e.name for e in list_log_files(self.test_dir, include_archives=False)]
+
+        self.assertEqual(all_logs, ["game.txt", "game.txt.bz2", "game.txt.gz", "game.txt.xz"])
+        self.assertEqual(plain, ["game.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+Tests for the memory-mapped log reader
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.utils.log_reader import LogIndexCache, LogReader
+
+
+class TestLogReader(unittest.TestCase):
+    """Test cases for LogReader"""
+
+    def setUp(self) -> None:
+        """Create a log file"""
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "game.txt")
+        self._write(
+            "w",
+            "Header\nTurn 1, Headline Phase\nUSSR plays Fidel\n"
+            "Turn 1, USSR AR1\nTurn 2, Headline Phase\nUS plays NATO\n",
+        )
+
+    def tearDown(self) -> None:
+        """Remove the log file"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _write(self, mode: str, text: str) -> None:
+        with open(self.path, mode, encoding="utf-8", newline="") as f:
+            f.write(text)
+
+    def test_random_access(self) -> None:
+        """Test reading arbitrary lines by index"""
+        with LogReader(self.path) as reader:
+            self.assertEqual(len(reader), 6)
+            self.assertEqual(reader.line(0), "Header")
+            self.assertEqual(reader.line(5), "US plays NATO")
+            self.assertEqual(reader.line_offset(1), len("Header\n"))
+            self.assertEqual(list(reader.lines(2, 4)), ["USSR plays Fidel", "Turn 1, USSR AR1"])
+            with self.assertRaises(IndexError):
+                reader.line(6)
+
+    def test_turn_boundaries(self) -> None:
+        """Test finding the first line of each turn"""
+        with LogReader(self.path) as reader:
+            self.assertEqual(reader.turn_boundaries(), {1: 1, 2: 4})
+
+    def test_refresh_indexes_appended_lines(self) -> None:
+        """Test that appended data, including a partial line, is picked up"""
+        with LogReader(self.path) as reader:
+            self._write("a", "Turn 3, Headline")
+            self.assertTrue(reader.refresh())
+            self.assertEqual(len(reader), 7)
+            self.assertEqual(reader.line(6), "Turn 3, Headline")
+
+            self._write("a", " Phase\r\nNext\n")
+            reader.refresh()
+            self.assertEqual(reader.line(6), "Turn 3, Headline Phase")
+            self.assertEqual(reader.line(7), "Next")
+            self.assertFalse(reader.refresh())
+
+    def test_refresh_after_truncation(self) -> None:
+        """Test that a rewritten, shorter file is re-indexed from scratch"""
+        with LogReader(self.path) as reader:
+            self._write("w", "Only\n")
+            reader.refresh()
+
+            self.assertEqual(len(reader), 1)
+            self.assertEqual(reader.line(0), "Only")
+
+    def test_empty_file(self) -> None:
+        """Test that empty files are supported"""
+        self._write("w", "")
+        with LogReader(self.path) as reader:
+            self.assertEqual(len(reader), 0)
+            self.assertEqual(reader.tail(10), b"")
+            self.assertEqual(reader.turn_boundaries(), {})
+
+    def test_tail_and_index_size(self) -> None:
+        """Test reading the end of the file and the compact index size"""
+        with LogReader(self.path) as reader:
+            self.assertEqual(reader.tail(5), b"NATO\n")
+            self.assertEqual(reader.index_nbytes(), 7 * 8)
+
+    def test_invalid_utf8_is_replaced(self) -> None:
+        """Test that undecodable bytes do not raise"""
+        with open(self.path, "wb") as f:
+            f.write(b"caf\xe9\n")
+        with LogReader(self.path) as reader:
+            self.assertEqual(reader.line(0), "caf�")
+
+    def test_resume_from_line_index(self) -> None:
+        """Test that a reader resumed from an earlier index only indexes appended bytes"""
+        with LogReader(self.path) as reader:
+            index = reader.line_index()
+        self._write("a", "Turn 3, Headline Phase\n")
+
+        with LogReader(self.path, index=index) as resumed:
+            self.assertEqual(len(resumed), 7)
+            self.assertEqual(resumed.line(5), "US plays NATO")
+            self.assertEqual(resumed.line(6), "Turn 3, Headline Phase")
+        self.assertEqual(len(index.starts), 7)
+
+
+class TestLogIndexCache(unittest.TestCase):
+    """Test cases for LogIndexCache"""
+
+    def setUp(self) -> None:
+        """Create a log file"""
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "game.txt")
+        self._write("w", "Header\nTurn 1, Headline Phase\nUSSR plays Fidel\n")
+        self.cache = LogIndexCache()
+
+    def tearDown(self) -> None:
+        """Remove the log file"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _write(self, mode: str, text: str) -> None:
+        with open(self.path, mode, encoding="utf-8") as f:
+            f.write(text)
+
+    def _read(self) -> tuple[list[str], dict[int, int]]:
+        with self.cache.open(self.path) as (reader, turns):
+            return list(reader.lines()), turns
+
+    def test_unchanged_log_reuses_its_index(self) -> None:
+        """Test that paging an unchanged log doesn't index it again"""
+        first = self._read()
+        second = self._read()
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_appended_lines_and_turns_are_picked_up(self) -> None:
+        """Test that a grown log extends the cached index"""
+        self._read()
+        self._write("a", "Turn 2, Headline Phase\n")
+
+        lines, turns = self._read()
+
+        self.assertEqual(lines[-1], "Turn 2, Headline Phase")
+        self.assertEqual(turns, {1: 1, 2: 3})
+
+    def test_rewritten_log_is_indexed_from_scratch(self) -> None:
+        """Test that a replaced log doesn't reuse the old offsets"""
+        self._read()
+        os.remove(self.path)
+        self._write("w", "A much longer first line of a new game\nTurn 1\nSecond\nThird\n")
+
+        lines, turns = self._read()
+
+        self.assertEqual(
+            lines, ["A much longer first line of a new game", "Turn 1", "Second", "Third"]
+        )
+        self.assertEqual(turns, {1: 1})
+
+    def test_least_recently_used_index_is_evicted(self) -> None:
+        """Test that the cache stays within its entry limit"""
+        cache = LogIndexCache(max_entries=1)
+        other = os.path.join(self.test_dir, "other.txt")
+        with open(other, "w") as f:
+            f.write("Turn 1\n")
+
+        for path in (self.path, other, self.path):
+            with cache.open(path):
+                pass
+
+        self.assertEqual(cache.stats()["entries"], 1)
+        self.assertEqual(cache.stats()["misses"], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
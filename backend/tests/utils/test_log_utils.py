@@ -12,8 +12,15 @@ from unittest.mock import MagicMock, patch
 # Add the src directory to the path so we can import from the modular structure
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "src"))
 
+from src.config.config_manager import ConfigChange
 from src.models.game_data import ConfigModel
-from src.utils.log_utils import get_latest_log_file, get_log_directory_info
+from src.utils.log_utils import (
+    MISSING_RECHECK_SECONDS,
+    MissingPaths,
+    get_latest_log_file,
+    get_log_directory_info,
+    missing_paths,
+)
 
 
 class TestLogUtils(unittest.TestCase):
@@ -28,6 +35,8 @@ class TestLogUtils(unittest.TestCase):
         with patch("src.config.config_manager.ConfigManager._get_config_file_path") as mock_path:
             mock_path.return_value = os.path.join(self.test_dir, "test_config.json")
 
+        missing_paths.clear()
+
     def tearDown(self) -> None:
         """Clean up after each test method"""
         # Remove temporary directory
@@ -197,5 +206,62 @@ class TestLogUtils(unittest.TestCase):
                 self.assertEqual(result["log_files"], [])
 
 
+class TestMissingPaths(unittest.TestCase):
+    """Test cases for the negative cache of missing configured paths"""
+
+    def setUp(self) -> None:
+        """Create a cache with a fake clock and a counting existence check"""
+        self.now = 1000.0
+        self.checked: list[str] = []
+        self.exists = False
+        self.missing = MissingPaths(clock=lambda: self.now)
+
+    def _check(self, path: str) -> bool:
+        self.checked.append(path)
+        return self.exists
+
+    def test_missing_path_is_rechecked_with_backoff(self) -> None:
+        """Test that a missing path is only checked again once its backoff expires"""
+        self.assertFalse(self.missing.exists("/logs/game.txt", self._check))
+        self.assertFalse(self.missing.exists("/logs/game.txt", self._check))
+        self.assertEqual(len(self.checked), 1)
+
+        self.now += MISSING_RECHECK_SECONDS
+        self.assertFalse(self.missing.exists("/logs/game.txt", self._check))
+        self.now += MISSING_RECHECK_SECONDS
+        self.assertFalse(self.missing.exists("/logs/game.txt", self._check))
+        self.assertEqual(len(self.checked), 2)
+
+        self.now += MISSING_RECHECK_SECONDS
+        self.exists = True
+        self.assertTrue(self.missing.exists("/logs/game.txt", self._check))
+        self.assertNotIn("/logs/game.txt", self.missing)
+
+    def test_config_change_checks_again(self) -> None:
+        """Test that a configuration change forgets the missing paths"""
+        self.missing.exists("/logs/game.txt", self._check)
+        config = ConfigModel(log_file_path=None, log_directory="/logs")
+        self.missing.on_config_change(ConfigChange(None, config, "save"))
+        self.exists = True
+
+        self.assertTrue(self.missing.exists("/logs/game.txt", self._check))
+
+    @patch("src.config.config_manager.config_manager.load_config")
+    def test_missing_configured_log_is_not_stated_every_poll(
+        self, mock_load_config: MagicMock
+    ) -> None:
+        """Test that get_latest_log_file answers a known-missing log from the cache"""
+        missing_paths.clear()
+        mock_load_config.return_value = ConfigModel(
+            log_file_path="/missing/path/poll.txt", log_directory="/test/directory"
+        )
+
+        with patch("os.path.exists", return_value=False) as mock_exists:
+            self.assertIsNone(get_latest_log_file())
+            self.assertIsNone(get_latest_log_file())
+
+        self.assertEqual(mock_exists.call_count, 1)
+
+
 if __name__ == "__main__":
     unittest.main()
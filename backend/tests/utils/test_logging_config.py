@@ -0,0 +1,175 @@
+"""
+Tests for the logging pipeline
+"""
+
+import logging
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.utils.logging_config import (
+    LOG_FILE_NAME,
+    DeferredQueueHandler,
+    SampledDebugFilter,
+    configure_logging,
+    stop_logging,
+)
+
+
+class _ThreadRecordingArg:
+    """Argument that remembers which thread converted it to a string"""
+
+    def __init__(self) -> None:
+        self.formatted_in: str | None = None
+        self.value = "recorded"
+
+    def __str__(self) -> str:
+        self.formatted_in = threading.current_thread().name
+        return self.value
+
+
+class TestLoggingConfig(unittest.TestCase):
+    """Test cases for the logging pipeline"""
+
+    def setUp(self) -> None:
+        """Save root logger state and create a logs directory"""
+        self.logs_dir = tempfile.mkdtemp()
+        self.root = logging.getLogger()
+        self.saved_handlers = list(self.root.handlers)
+        self.saved_level = self.root.level
+
+    def tearDown(self) -> None:
+        """Restore root logger state"""
+        stop_logging()
+        for handler in list(self.root.handlers):
+            self.root.removeHandler(handler)
+        for handler in self.saved_handlers:
+            self.root.addHandler(handler)
+        self.root.setLevel(self.saved_level)
+        shutil.rmtree(self.logs_dir, ignore_errors=True)
+
+    def test_debug_disabled_starts_no_listener(self) -> None:
+        """Test that logging stays effectively disabled without DEBUG"""
+        self.assertIsNone(configure_logging(False, self.logs_dir))
+        self.assertFalse(any(isinstance(h, DeferredQueueHandler) for h in self.root.handlers))
+
+    def test_debug_routes_records_through_queue_to_file(self) -> None:
+        """Test that records reach the rotating log file via the listener"""
+        with patch("sys.stdout"):
+            listener = configure_logging(True, self.logs_dir)
+            self.assertIsNotNone(listener)
+            self.assertTrue(any(isinstance(h, DeferredQueueHandler) for h in self.root.handlers))
+
+            logging.getLogger("test.pipeline").info("Loaded config: %s", "abc")
+            stop_logging()
+
+        with open(os.path.join(self.logs_dir, LOG_FILE_NAME), encoding="utf-8") as f:
+            self.assertIn("Loaded config: abc", f.read())
+
+    def test_message_is_captured_when_logged(self) -> None:
+        """Test that arguments changed after logging don't change the written message"""
+        arg = _ThreadRecordingArg()
+        with patch("sys.stdout"):
+            configure_logging(True, self.logs_dir)
+            logging.getLogger("test.pipeline").info("Value: %s", arg)
+            arg.value = "changed"
+            stop_logging()
+
+        with open(os.path.join(self.logs_dir, LOG_FILE_NAME), encoding="utf-8") as f:
+            written = f.read()
+        self.assertIn("Value: recorded", written)
+        self.assertNotIn("changed", written)
+
+    def test_queued_records_carry_no_arguments_or_exc_info(self) -> None:
+        """Test that tracebacks are rendered before the record is queued"""
+        handler = DeferredQueueHandler(queue.SimpleQueue())
+        try:
+            raise ValueError("bad log line")
+        except ValueError:
+            record = logging.LogRecord(
+                "test",
+                logging.ERROR,
+                __file__,
+                1,
+                "Error parsing %s",
+                ("game.txt",),
+                sys.exc_info(),
+            )
+
+        prepared = handler.prepare(record)
+
+        self.assertEqual(prepared.msg, "Error parsing game.txt")
+        self.assertIsNone(prepared.args)
+        self.assertIsNone(prepared.exc_info)
+        self.assertIn("ValueError: bad log line", prepared.exc_text or "")
+        self.assertIn("ValueError: bad log line", logging.Formatter().format(prepared))
+
+    def test_disabled_level_skips_formatting(self) -> None:
+        """Test that arguments are never formatted when the level is disabled"""
+        arg = _ThreadRecordingArg()
+        logger = logging.getLogger("test.disabled")
+        logger.setLevel(logging.CRITICAL)
+        try:
+            logger.debug("Formatting card: %s", arg)
+        finally:
+            logger.setLevel(logging.NOTSET)
+
+        self.assertIsNone(arg.formatted_in)
+
+    def test_log_file_rotates_by_size(self) -> None:
+        """Test that the log file is rotated once it exceeds the size limit"""
+        with (
+            patch("sys.stdout"),
+            patch("src.utils.logging_config.LOG_MAX_BYTES", 1024),
+        ):
+            configure_logging(True, self.logs_dir)
+            logger = logging.getLogger("test.rotation")
+            for i in range(100):
+                logger.info("line %s %s", i, "x" * 50)
+            stop_logging()
+
+        self.assertTrue(os.path.exists(os.path.join(self.logs_dir, LOG_FILE_NAME + ".1")))
+
+
+class TestSampledDebugFilter(unittest.TestCase):
+    """Test cases for SampledDebugFilter"""
+
+    def _record(self, level: int, msg: str) -> logging.LogRecord:
+        return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+    def test_samples_debug_records_per_template(self) -> None:
+        """Test that only every Nth DEBUG record per template passes"""
+        sampler = SampledDebugFilter(every=10)
+
+        passed = sum(
+            sampler.filter(self._record(logging.DEBUG, "Formatting card: %s")) for _ in range(100)
+        )
+        other = sampler.filter(self._record(logging.DEBUG, "Other message"))
+
+        self.assertEqual(passed, 10)
+        self.assertTrue(other)
+
+    def test_counted_templates_are_bounded(self) -> None:
+        """Test that distinct templates don't grow the filter without limit"""
+        sampler = SampledDebugFilter(every=10, max_templates=3)
+
+        for i in range(100):
+            sampler.filter(self._record(logging.DEBUG, f"Unique message {i}"))
+
+        self.assertEqual(len(sampler._counts), 3)
+
+    def test_higher_levels_always_pass(self) -> None:
+        """Test that warnings and errors are never sampled away"""
+        sampler = SampledDebugFilter(every=10)
+
+        for _ in range(20):
+            self.assertTrue(sampler.filter(self._record(logging.WARNING, "Card not found")))
+
+
+if __name__ == "__main__":
+    unittest.main()
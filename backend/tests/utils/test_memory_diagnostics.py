@@ -0,0 +1,58 @@
+"""
+Tests for memory diagnostics
+"""
+
+import tracemalloc
+import unittest
+
+from src.utils.memory_diagnostics import MemoryDiagnostics, peak_rss_bytes, rss_bytes
+
+
+class TestMemoryDiagnostics(unittest.TestCase):
+    """Test cases for MemoryDiagnostics"""
+
+    def setUp(self) -> None:
+        """Start each test without tracing"""
+        self.was_tracing = tracemalloc.is_tracing()
+        self.diagnostics = MemoryDiagnostics(top=5)
+
+    def tearDown(self) -> None:
+        """Stop tracing started by a test"""
+        if not self.was_tracing:
+            self.diagnostics.stop()
+
+    def test_rss_is_reported(self) -> None:
+        """Test that RSS is readable on this platform"""
+        rss = rss_bytes()
+        self.assertIsNotNone(rss)
+        self.assertGreater(rss or 0, 0)
+        self.assertGreaterEqual(peak_rss_bytes() or 0, 0)
+
+    def test_report_without_tracing(self) -> None:
+        """Test that reports don't start tracing on their own"""
+        if self.was_tracing:
+            self.skipTest("tracemalloc was already tracing")
+        report = self.diagnostics.report()
+
+        self.assertFalse(report["tracing"])
+        self.assertNotIn("top", report)
+        self.assertGreater(report["gc"]["objects"], 0)
+
+    def test_diff_shows_growth_since_previous_report(self) -> None:
+        """Test that the second report lists the site that grew"""
+        self.diagnostics.start()
+        self.diagnostics.report()
+
+        retained = [bytearray(1024) for _ in range(200)]
+        report = self.diagnostics.report()
+
+        self.assertTrue(report["tracing"])
+        self.assertLessEqual(len(report["top"]), 5)
+        grown = [d for d in report["diff"] if "test_memory_diagnostics.py:" in d["site"]]
+        self.assertTrue(grown)
+        self.assertGreaterEqual(grown[0]["size_diff_bytes"], 200 * 1024)
+        del retained
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+"""
+Tests for the MessagePack codec
+"""
+
+import unittest
+
+from src.utils.msgpack_codec import packb, unpackb
+
+
+class TestMsgpackCodec(unittest.TestCase):
+    """Test cases for packb and unpackb"""
+
+    def test_round_trip(self) -> None:
+        """Test that payload-shaped values survive encoding and decoding"""
+        payload = {
+            "status": "ok",
+            "filename": None,
+            "turn": 7,
+            "deck": [{"name": "Cuban Missile Crisis", "side": "USSR", "ops": 3}] * 20,
+            "flags": [True, False],
+            "modified": 1700000000.25,
+            "ints": [0, 127, 128, 255, 256, 65536, 2**32, 2**63, -1, -32, -33, -129, -(2**40)],
+            "long": "x" * 300,
+            "raw": b"\x00\x01",
+        }
+        self.assertEqual(unpackb(packb(payload)), payload)
+
+    def test_known_encodings(self) -> None:
+        """Test byte-exact output for a few values from the MessagePack spec"""
+        self.assertEqual(packb(None), b"\xc0")
+        self.assertEqual(packb(True), b"\xc3")
+        self.assertEqual(packb(5), b"\x05")
+        self.assertEqual(packb(-1), b"\xff")
+        self.assertEqual(packb(200), b"\xcc\xc8")
+        self.assertEqual(packb("ops"), b"\xa3ops")
+        self.assertEqual(packb([1, 2]), b"\x92\x01\x02")
+        self.assertEqual(packb({"a": 1}), b"\x81\xa1a\x01")
+
+    def test_unsupported_type(self) -> None:
+        """Test that unsupported objects raise TypeError"""
+        with self.assertRaises(TypeError):
+            packb({"when": object()})
+
+    def test_truncated_data(self) -> None:
+        """Test that truncated input raises ValueError"""
+        with self.assertRaises(ValueError):
+            unpackb(packb(["a", "b"])[:-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Tests for adaptive polling hints
+"""
+
+import unittest
+
+from src.utils.poll_hints import PollAdvisor
+
+
+class TestPollAdvisor(unittest.TestCase):
+    """Test cases for PollAdvisor"""
+
+    def setUp(self) -> None:
+        """Set up an advisor with a controllable clock"""
+        self.now = 100_000.0
+        self.advisor = PollAdvisor(clock=lambda: self.now)
+
+    def test_active_play_polls_every_second(self) -> None:
+        """Test the hint for a log that just changed"""
+        self.assertEqual(self.advisor.poll_after_ms("game.txt", self.now - 2, 1000), 1000)
+
+    def test_rapid_growth_polls_faster(self) -> None:
+        """Test the hint while the log grows quickly"""
+        self.advisor.poll_after_ms("game.txt", self.now - 10, 1000)
+
+        self.assertEqual(self.advisor.poll_after_ms("game.txt", self.now, 9000), 500)
+        self.assertGreater(self.advisor.growth_rate("game.txt"), 200)
+
+    def test_pause_backs_off(self) -> None:
+        """Test that the hint grows with idle time and is capped"""
+        short_pause = self.advisor.poll_after_ms("game.txt", self.now - 60, 1000)
+        long_pause = self.advisor.poll_after_ms("game.txt", self.now - 20 * 60, 1000)
+
+        self.assertEqual(short_pause, 6000)
+        self.assertEqual(long_pause, 15000)
+
+    def test_finished_game_polls_rarely(self) -> None:
+        """Test the hint for a log idle for over half an hour"""
+        self.assertEqual(self.advisor.poll_after_ms("game.txt", self.now - 3600, 1000), 60000)
+
+    def test_forget(self) -> None:
+        """Test dropping recorded history"""
+        self.advisor.observe("game.txt", self.now, 10)
+        self.advisor.forget("game.txt")
+
+        self.assertEqual(self.advisor.stats()["tracked_logs"], 0)
+
+    def test_history_is_kept_for_recently_polled_logs_only(self) -> None:
+        """Test that the advisor forgets the least recently polled logs beyond its limit"""
+        advisor = PollAdvisor(max_logs=2, clock=lambda: self.now)
+        for name in ("a.txt", "b.txt", "a.txt", "c.txt"):
+            advisor.observe(name, self.now, 10)
+
+        self.assertEqual(advisor.stats()["tracked_logs"], 2)
+        self.assertEqual(list(advisor._samples), ["a.txt", "c.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Tests for response format negotiation and serialization
+"""
+
+import json
+import unittest
+from unittest.mock import patch
+
+from flask import Flask
+
+from src.models.game_data import Card, GameStatus, StatusRecord
+from src.utils import response_format
+from src.utils.fingerprint import Fingerprint
+from src.utils.game_state import GameSnapshot, GameStateEntry
+from src.utils.msgpack_codec import unpackb
+from src.utils.response_format import dumps_json, entry_response
+
+
+class TestResponseFormat(unittest.TestCase):
+    """Test cases for response serialization helpers"""
+
+    def setUp(self) -> None:
+        """Set up an app context and a cached game state"""
+        self.app = Flask(__name__)
+        status = GameStatus(
+            status="ok", turn=4, deck=[Card(name="Cuba", side="USSR", ops=2)], filename="g.txt"
+        )
+        self.entry = GameStateEntry(
+            path="/logs/g.txt",
+            fingerprint=Fingerprint(1, 1, 1, 1),
+            snapshot=GameSnapshot.from_status(status),
+            version=1,
+            last_access=0.0,
+        )
+
+    def test_dumps_json_fallback_matches(self) -> None:
+        """Test that the stdlib fallback encodes the same payload"""
+        payload = {"name": "Warsaw Pact Formed", "ops": 3, "side": None, "note": "é"}
+        fast = dumps_json(payload)
+        with patch.object(response_format, "_fast_dumps", None):
+            slow = dumps_json(payload)
+
+        self.assertEqual(json.loads(fast), payload)
+        self.assertEqual(json.loads(slow), payload)
+
+    def test_entry_serialized_once_per_format(self) -> None:
+        """Test that repeated responses for a state version reuse the same bytes"""
+        with patch.object(StatusRecord, "to_dict", wraps=self.entry.record.to_dict) as dump:
+            with self.app.test_request_context("/"):
+                first = entry_response(self.entry)
+                second = entry_response(self.entry)
+            with self.app.test_request_context("/?format=msgpack"):
+                packed = entry_response(self.entry)
+
+        self.assertEqual(dump.call_count, 2)
+        self.assertEqual(first.get_data(), second.get_data())
+        self.assertEqual(first.headers["Content-Length"], str(len(first.get_data())))
+        self.assertEqual(json.loads(first.get_data())["deck"][0]["name"], "Cuba")
+        self.assertEqual(unpackb(packed.get_data())["turn"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
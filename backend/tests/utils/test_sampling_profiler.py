@@ -0,0 +1,93 @@
+"""
+Tests for the sampling profiler
+"""
+
+import threading
+import time
+import unittest
+
+from src.utils.sampling_profiler import SamplingProfiler
+
+
+def _busy_wait(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(range(1000))
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    """Test cases for SamplingProfiler"""
+
+    def test_sample_once_collects_folded_stacks(self) -> None:
+        """Test that a sample records the calling thread's stack root-first"""
+        profiler = SamplingProfiler(sample_hz=100)
+        profiler.sample_once()
+
+        output = profiler.collapsed()
+        self.assertIn("test_sample_once_collects_folded_stacks", output)
+        for line in output.splitlines():
+            stack, count = line.rsplit(" ", 1)
+            self.assertGreaterEqual(int(count), 1)
+            # Innermost frame (sample_once itself) comes last
+            if "test_sample_once_collects_folded_stacks" in stack:
+                self.assertTrue(stack.split(";")[-1].startswith("sample_once"))
+
+    def test_background_thread_samples_other_threads(self) -> None:
+        """Test that the background sampler sees busy worker threads"""
+        profiler = SamplingProfiler(sample_hz=200)
+        stop = threading.Event()
+        worker = threading.Thread(target=_busy_wait, args=(stop,), daemon=True)
+        worker.start()
+        try:
+            profiler.start()
+            time.sleep(0.2)
+        finally:
+            profiler.stop()
+            stop.set()
+            worker.join()
+
+        self.assertFalse(profiler.is_running)
+        self.assertIn("_busy_wait", profiler.collapsed())
+        self.assertGreater(profiler.stats()["samples"], 0)
+
+    def test_overhead_stays_within_budget(self) -> None:
+        """Test that the measured sampling overhead stays within the budget"""
+        profiler = SamplingProfiler(sample_hz=1000, max_overhead=0.01)
+        profiler.start()
+        time.sleep(0.3)
+        profiler.stop()
+
+        # Allow slack for scheduler jitter on loaded CI machines
+        self.assertLess(profiler.stats()["overhead"], 0.05)
+
+    def test_max_stacks_bounds_memory(self) -> None:
+        """Test that distinct stacks beyond the limit are counted as dropped"""
+        profiler = SamplingProfiler(max_stacks=1)
+        profiler.sample_once()
+        profiler._stacks.clear()
+        profiler._stacks["other"] = 1
+        profiler.sample_once()
+
+        stats = profiler.stats()
+        self.assertEqual(stats["distinct_stacks"], 1)
+        self.assertGreater(stats["dropped_samples"], 0)
+
+    def test_reset_clears_samples(self) -> None:
+        """Test that reset discards collected samples"""
+        profiler = SamplingProfiler()
+        profiler.sample_once()
+        profiler.reset()
+
+        self.assertEqual(profiler.collapsed(), "")
+        self.assertEqual(profiler.stats()["samples"], 0)
+
+    def test_disabled_profiler_does_not_start(self) -> None:
+        """Test that a zero sample rate disables the profiler"""
+        profiler = SamplingProfiler(sample_hz=0)
+        profiler.start()
+
+        self.assertFalse(profiler.enabled)
+        self.assertFalse(profiler.is_running)
+
+
+if __name__ == "__main__":
+    unittest.main()
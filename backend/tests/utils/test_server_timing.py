@@ -0,0 +1,41 @@
+"""
+Tests for Server-Timing headers
+"""
+
+import unittest
+
+from flask import Response
+
+from src.utils.server_timing import ServerTiming, tag_timing, timed
+
+
+class TestServerTiming(unittest.TestCase):
+    """Test cases for ServerTiming"""
+
+    def test_stages_and_tags_recorded_while_active(self) -> None:
+        """Test that timed stages are summed and tags rendered as descriptions"""
+        timing = ServerTiming()
+        with timing.activate():
+            with timed("parse"):
+                pass
+            with timed("parse"):
+                pass
+            tag_timing("cache", "miss")
+
+        header = timing.apply(Response()).headers["Server-Timing"]
+
+        self.assertEqual(list(timing.durations), ["parse"])
+        self.assertRegex(header, r'^parse;dur=\d+\.\d{2}, cache;desc="miss", total;dur=\d+\.\d{2}$')
+
+    def test_noop_outside_timed_request(self) -> None:
+        """Test that stages outside an active timing are not recorded anywhere"""
+        timing = ServerTiming()
+        with timed("format"):
+            tag_timing("cache", "hit")
+
+        self.assertEqual(timing.durations, {})
+        self.assertEqual(timing.tags, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
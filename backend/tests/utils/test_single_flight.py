@@ -0,0 +1,79 @@
+"""
+Tests for request coalescing
+"""
+
+import threading
+import time
+import unittest
+
+from src.utils.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test cases for SingleFlight"""
+
+    def test_concurrent_calls_share_one_execution(self) -> None:
+        """Test that callers arriving during a call wait for its result"""
+        flight: SingleFlight[int] = SingleFlight()
+        release = threading.Event()
+        executions: list[int] = []
+
+        def work() -> int:
+            executions.append(1)
+            release.wait(5)
+            return 42
+
+        threads = [threading.Thread(target=flight.do, args=("game", work)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        # Wait until every caller is either running or waiting on the call
+        while flight.stats()["shared"] < 7:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(executions), 1)
+        self.assertEqual(flight.stats(), {"executed": 1, "shared": 7, "in_flight": 0})
+
+    def test_errors_are_shared(self) -> None:
+        """Test that waiting callers receive the leader's exception"""
+        flight: SingleFlight[int] = SingleFlight()
+        release = threading.Event()
+        errors: list[BaseException] = []
+
+        def work() -> int:
+            release.wait(5)
+            raise ValueError("corrupt log")
+
+        def call() -> None:
+            try:
+                flight.do("game", work)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        while flight.stats()["shared"] < 2:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(errors), 3)
+
+    def test_sequential_calls_are_not_cached(self) -> None:
+        """Test that a completed call does not answer later ones"""
+        flight: SingleFlight[int] = SingleFlight()
+        values = iter([1, 2])
+
+        first = flight.do("game", lambda: next(values))
+        second = flight.do("game", lambda: next(values))
+
+        self.assertEqual(first, (1, False))
+        self.assertEqual(second, (2, False))
+
+
+if __name__ == "__main__":
+    unittest.main()
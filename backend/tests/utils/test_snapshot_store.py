@@ -0,0 +1,158 @@
+"""
+Tests for the persistent snapshot store
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from src.models.game_data import Card, GameStatus, StatusRecord
+from src.utils.fingerprint import file_fingerprint
+from src.utils.game_state import GameStateCache
+from src.utils.snapshot_store import SnapshotStore
+
+
+def _status(turn: int) -> StatusRecord:
+    return StatusRecord.from_model(
+        GameStatus(
+            status="ok",
+            filename="game.txt",
+            turn=turn,
+            deck=[Card(name="Fidel", side="USSR", ops=2)] * 40,
+        )
+    )
+
+
+class TestSnapshotStore(unittest.TestCase):
+    """Test cases for SnapshotStore"""
+
+    def setUp(self) -> None:
+        """Create a store directory and a log file"""
+        self.test_dir = tempfile.mkdtemp()
+        self.store = SnapshotStore(os.path.join(self.test_dir, "snapshots"))
+        self.log_path = os.path.join(self.test_dir, "game.txt")
+        with open(self.log_path, "w") as f:
+            f.write("Turn 1\n")
+
+    def tearDown(self) -> None:
+        """Remove the store directory"""
+        self.store.flush()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_round_trip(self) -> None:
+        """Test that a stored status loads back for the same fingerprint"""
+        self.store.save(self.log_path, (1, 2), _status(4))
+
+        loaded = self.store.load(self.log_path, (1, 2))
+
+        self.assertEqual(loaded, _status(4))
+        self.assertEqual(self.store.stats()["hits"], 1)
+
+    def test_stale_fingerprint_misses(self) -> None:
+        """Test that a snapshot of older log contents is not returned"""
+        self.store.save(self.log_path, (1, 2), _status(4))
+
+        self.assertIsNone(self.store.load(self.log_path, (1, 3)))
+        self.assertIsNone(self.store.load(os.path.join(self.test_dir, "other.txt"), (1, 2)))
+
+    def test_corrupt_snapshot_is_ignored(self) -> None:
+        """Test that unreadable files are treated as misses"""
+        self.store.save(self.log_path, (1, 2), _status(4))
+        (snapshot,) = os.listdir(self.store.directory)
+        with open(os.path.join(self.store.directory, snapshot), "wb") as f:
+            f.write(b"TSS\x01not zlib")
+
+        self.assertIsNone(self.store.load(self.log_path, (1, 2)))
+
+    def test_least_recently_used_snapshots_are_evicted(self) -> None:
+        """Test that the store stays within its entry limit"""
+        store = SnapshotStore(self.store.directory, max_entries=2)
+        for i in range(3):
+            path = os.path.join(self.test_dir, f"game-{i}.txt")
+            store.save(path, (i, i), _status(i))
+            # Distinct access times even on filesystems with coarse timestamps
+            accessed = time.time() - 100 + i
+            os.utime(store._file_for(path), (accessed, accessed))
+
+        self.assertEqual(store.stats()["entries"], 2)
+        self.assertIsNone(store.load(os.path.join(self.test_dir, "game-0.txt"), (0, 0)))
+
+    def test_cache_loads_from_store_after_restart(self) -> None:
+        """Test that a new cache (a restarted backend) skips the parser"""
+        parsed: list[str] = []
+
+        def parse(path: str) -> GameStatus:
+            parsed.append(path)
+            return _status(7).to_model()
+
+        GameStateCache(parse=parse, store=self.store).get_status(self.log_path)
+        self.store.flush()
+        self.assertEqual(self.store.stats()["entries"], 0)
+        cache = GameStateCache(parse=parse, store=self.store)
+        cache.get_status(self.log_path)
+        cache.persist()
+        restarted = GameStateCache(parse=parse, store=self.store)
+
+        self.assertEqual(restarted.get_status(self.log_path).turn, 7)
+        self.assertEqual(parsed, [self.log_path] * 2)
+
+    def test_cache_stores_a_state_once_idle(self) -> None:
+        """Test that a log is stored once it stops changing, not on every change"""
+        now = [1000.0]
+        cache = GameStateCache(
+            parse=lambda path: _status(1).to_model(),
+            clock=lambda: now[0],
+            store=self.store,
+            persist_after=10,
+        )
+        for turn in range(3):
+            with open(self.log_path, "a") as f:
+                f.write(f"Turn {turn}\n")
+            cache.get_status(self.log_path)
+            now[0] += 1
+        self.store.flush()
+        self.assertEqual(self.store.stats()["entries"], 0)
+
+        now[0] += 10
+        cache.get_status(self.log_path)
+        self.store.flush()
+
+        self.assertEqual(self.store.stats()["entries"], 1)
+        fingerprint = file_fingerprint(self.log_path)
+        assert fingerprint is not None
+        self.assertIsNotNone(self.store.load(self.log_path, fingerprint))
+
+    def test_cache_stores_evicted_states(self) -> None:
+        """Test that a state leaving the cache is stored first"""
+        cache = GameStateCache(
+            max_entries=1, parse=lambda path: _status(1).to_model(), store=self.store
+        )
+        other = os.path.join(self.test_dir, "other.txt")
+        with open(other, "w") as f:
+            f.write("Turn 1\n")
+
+        cache.get_status(self.log_path)
+        cache.get_status(other)
+        self.store.flush()
+
+        evicted, kept = file_fingerprint(self.log_path), file_fingerprint(other)
+        assert evicted is not None and kept is not None
+        self.assertIsNotNone(self.store.load(self.log_path, evicted))
+        self.assertIsNone(self.store.load(other, kept))
+
+    def test_cache_reads_store_only_for_unknown_logs(self) -> None:
+        """Test that a log that changed since it was cached is parsed without a store lookup"""
+        cache = GameStateCache(parse=lambda path: _status(1).to_model(), store=self.store)
+        cache.get_status(self.log_path)
+        with open(self.log_path, "a") as f:
+            f.write("Turn 2\n")
+
+        cache.get_status(self.log_path)
+
+        self.assertEqual(self.store.stats()["misses"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
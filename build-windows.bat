@@ -30,7 +30,8 @@ python -m PyInstaller --onefile ^
     --collect-all twilight_log_parser ^
     --clean ^
     --strip ^
-    app.py
+    --name app ^
+    main.py
 
 cd ..
 
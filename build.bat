@@ -44,7 +44,8 @@ python -m PyInstaller --onefile ^
     --collect-all werkzeug ^
     --collect-all twilight_log_parser ^
     --clean ^
-    app.py
+    --name app ^
+    main.py
 
 if not exist "dist\app.exe" (
     echo Backend build failed - app.exe not found
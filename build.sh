@@ -93,7 +93,8 @@ if [[ "$OSTYPE" == "darwin"* ]]; then
         --clean \
         ${PYTHON_LIB:+--add-binary "$PYTHON_LIB:."} \
         --strip \
-        app.py
+        --name app \
+        main.py
     
     # Also build Windows version if we're building for Windows
     if [[ "$1" == "--windows" || "$1" == "-w" ]]; then
@@ -125,7 +126,8 @@ if [[ "$OSTYPE" == "darwin"* ]]; then
                 --collect-all twilight_log_parser \
                 --clean \
                 --strip \
-                app.py
+                --name app \
+                main.py
         else
             echo "Warning: wine not available, cannot build Windows backend on macOS"
             echo "Creating placeholder Windows executable..."
@@ -159,7 +161,8 @@ else
         --collect-all twilight_log_parser \
         --clean \
         --strip \
-        app.py
+        --name app \
+        main.py
 fi
 
 if [ ! -f "dist/app" ]; then
@@ -11,7 +11,7 @@ if not exist "frontend\package.json" (
     echo ❌ Error: Please run this script from the project root directory
     exit /b 1
 )
-if not exist "backend\app.py" (
+if not exist "backend\main.py" (
     echo ❌ Error: Please run this script from the project root directory
     exit /b 1
 )
@@ -40,9 +40,9 @@ if not exist "frontend\node_modules" (
     cd ..
 )
 
-echo 🔧 Starting backend server on port 5001...
+echo 🔧 Starting backend server on port 8000...
 cd backend
-start "Backend Server" python app.py
+start "Backend Server" python main.py
 cd ..
 
 REM Wait a moment for backend to start
@@ -60,7 +60,7 @@ cd ..
 echo ✅ Frontend server starting...
 echo.
 echo 🌐 Development servers are running:
-echo    Backend: http://localhost:5001
+echo    Backend: http://localhost:8000
 echo    Frontend: http://localhost:3000
 echo.
 echo Press any key to stop both servers...
@@ -8,7 +8,7 @@ set -e  # Exit on any error
 echo "🚀 Starting Twilight Struggle Helper in development mode..."
 
 # Check if we're in the right directory
-if [ ! -f "frontend/package.json" ] || [ ! -f "backend/app.py" ]; then
+if [ ! -f "frontend/package.json" ] || [ ! -f "backend/main.py" ]; then
     echo "❌ Error: Please run this script from the project root directory"
     exit 1
 fi
@@ -74,13 +74,13 @@ sleep 3
 echo "✅ Frontend server starting..."
 
 # Start backend server
-echo "🔧 Starting backend server on port 5001..."
+echo "🔧 Starting backend server on port 8000..."
 cd backend
-python app.py
+python main.py
 
 # Wait for both processes
 echo "🌐 Development servers are running:"
-echo "   Backend: http://localhost:5001"
+echo "   Backend: http://localhost:8000"
 echo "   Frontend: http://localhost:3000"
 echo ""
 echo "Press Ctrl+C to stop both servers"
@@ -235,7 +235,7 @@ function startBackend() {
     setTimeout(() => {
         // Get the correct backend path for the platform
         const backendPath = isDev
-            ? path.join(__dirname, '../../backend/app.py')
+            ? path.join(__dirname, '../../backend/main.py')
             : path.join(process.resourcesPath, 'backend', 'app' + (process.platform === 'win32' ? '.exe' : ''));
 
         log('Starting backend with path:', backendPath);
@@ -238,6 +238,27 @@ describe('useGameState', () => {
         ]);
     });
 
+    it('fetchGameStatus resolves to the poll hint', async () => {
+        mockedApiService.fetchGameStatus.mockResolvedValue({
+            status: 'active',
+            deck: [],
+            discarded: [],
+            removed: [],
+            cards_in_hands: [],
+            your_hand: [],
+            opponent_hand: [],
+            pollAfterMs: 15000,
+        });
+        const { result } = renderHook(() => useGameState());
+
+        let pollAfterMs: number | undefined;
+        await act(async () => {
+            pollAfterMs = await result.current.fetchGameStatus();
+        });
+
+        expect(pollAfterMs).toBe(15000);
+    });
+
     it('handleResetState resets hands', async () => {
         mockedApiService.resetState.mockResolvedValue({
             status: 'active',
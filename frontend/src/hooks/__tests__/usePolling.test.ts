@@ -1,4 +1,4 @@
-import { renderHook } from '@testing-library/react';
+import { act, renderHook } from '@testing-library/react';
 import { usePolling } from '../usePolling';
 
 describe('usePolling', () => {
@@ -116,6 +116,73 @@ describe('usePolling', () => {
         expect(result.current.isPolling).toBe(true);
     });
 
+    describe('poll hints', () => {
+        beforeEach(() => {
+            jest.useFakeTimers();
+        });
+
+        afterEach(() => {
+            jest.useRealTimers();
+        });
+
+        const advance = async (ms: number): Promise<void> => {
+            await act(async () => {
+                jest.advanceTimersByTime(ms);
+                // Let the awaited callback settle and schedule the next poll
+                await Promise.resolve();
+                await Promise.resolve();
+            });
+        };
+
+        it('waits for the delay the callback returns before polling again', async () => {
+            const callback = jest.fn().mockResolvedValue(5000);
+            renderHook(() => usePolling({ interval: 1000, isPaused: false, callback }));
+
+            await advance(1000);
+            expect(callback).toHaveBeenCalledTimes(1);
+
+            await advance(4999);
+            expect(callback).toHaveBeenCalledTimes(1);
+
+            await advance(1);
+            expect(callback).toHaveBeenCalledTimes(2);
+        });
+
+        it('falls back to the interval without a hint', async () => {
+            const callback = jest.fn().mockResolvedValue(undefined);
+            renderHook(() => usePolling({ interval: 1000, isPaused: false, callback }));
+
+            await advance(1000);
+            await advance(1000);
+
+            expect(callback).toHaveBeenCalledTimes(2);
+        });
+
+        it('keeps polling at the interval after a failed poll', async () => {
+            const callback = jest.fn().mockRejectedValue(new Error('offline'));
+            renderHook(() => usePolling({ interval: 1000, isPaused: false, callback }));
+
+            await advance(1000);
+            await advance(1000);
+
+            expect(callback).toHaveBeenCalledTimes(2);
+        });
+
+        it('stops polling when paused', async () => {
+            const callback = jest.fn().mockResolvedValue(1000);
+            const { rerender } = renderHook(
+                ({ isPaused }) => usePolling({ interval: 1000, isPaused, callback }),
+                { initialProps: { isPaused: false } },
+            );
+
+            await advance(1000);
+            rerender({ isPaused: true });
+            await advance(5000);
+
+            expect(callback).toHaveBeenCalledTimes(1);
+        });
+    });
+
     it('handles very long intervals', () => {
         const { result } = renderHook(() =>
             usePolling({
@@ -21,7 +21,8 @@ interface UseGameStateReturn {
     errorMessage: string | null;
     setGameStatus: (status: GameStatus) => void;
     clearGameStatus: (data?: Partial<GameStatus>) => void;
-    fetchGameStatus: () => Promise<void>;
+    // Resolves to the backend's recommended delay before the next poll, if it sent one
+    fetchGameStatus: () => Promise<number | undefined>;
     handleResetState: () => Promise<void>;
     removeCardFromHands: (card: Card) => void;
     handleCardClick: (card: Card) => void;
@@ -119,7 +120,7 @@ export const useGameState = (): UseGameStateReturn => {
         [gameStatus],
     );
 
-    const fetchGameStatus = useCallback(async (): Promise<void> => {
+    const fetchGameStatus = useCallback(async (): Promise<number | undefined> => {
         try {
             const data = await apiService.fetchGameStatus();
 
@@ -136,7 +137,7 @@ export const useGameState = (): UseGameStateReturn => {
                     yourHand: data.your_hand || [],
                     opponentHand: data.opponent_hand || [],
                 });
-                return;
+                return data.pollAfterMs;
             }
 
             // Clear any previous error message when successful
@@ -196,10 +197,12 @@ export const useGameState = (): UseGameStateReturn => {
                     opponentHand: currentOpponentHand,
                 };
             });
+            return data.pollAfterMs;
         } catch (error) {
             setCurrentFilename(null);
             clearGameStatus();
         }
+        return undefined;
     }, [clearGameStatus]);
 
     const handleResetState = useCallback(async (): Promise<void> => {
@@ -1,9 +1,11 @@
 import { useEffect, useRef, useState } from 'react';
 
 interface UsePollingOptions {
+    // Delay between polls, unless the callback recommends another one
     interval: number;
     isPaused: boolean;
-    callback: () => void;
+    // May return (or resolve to) the delay before the next poll in milliseconds
+    callback: () => unknown;
 }
 
 export const usePolling = ({
@@ -11,27 +13,44 @@ export const usePolling = ({
     isPaused,
     callback,
 }: UsePollingOptions): { isPolling: boolean } => {
-    const intervalRef = useRef<ReturnType<typeof setInterval> | null>(null);
+    const timeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
     const [isPolling, setIsPolling] = useState(false);
 
     useEffect(() => {
-        if (isPaused) {
-            if (intervalRef.current) {
-                clearInterval(intervalRef.current);
-                intervalRef.current = null;
+        const clear = (): void => {
+            if (timeoutRef.current) {
+                clearTimeout(timeoutRef.current);
+                timeoutRef.current = null;
             }
+        };
+
+        if (isPaused) {
+            clear();
             setIsPolling(false);
             return;
         }
 
-        intervalRef.current = setInterval(callback, interval);
+        let cancelled = false;
+        const poll = async (): Promise<void> => {
+            let next: unknown;
+            try {
+                next = await callback();
+            } catch (error) {
+                next = undefined;
+            }
+            if (!cancelled) {
+                // Follow the backend's hint (X-Poll-After), falling back to the fixed interval
+                const delay = typeof next === 'number' && next > 0 ? next : interval;
+                timeoutRef.current = setTimeout(poll, delay);
+            }
+        };
+
+        timeoutRef.current = setTimeout(poll, interval);
         setIsPolling(true);
 
         return () => {
-            if (intervalRef.current) {
-                clearInterval(intervalRef.current);
-                intervalRef.current = null;
-            }
+            cancelled = true;
+            clear();
             setIsPolling(false);
         };
     }, [interval, isPaused, callback]);
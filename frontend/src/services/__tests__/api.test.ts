@@ -1,9 +1,14 @@
-import { apiService } from '../api';
+import { apiService, parsePollAfter } from '../api';
 import type { GameStatusResponse } from '../api';
 
 // Mock fetch globally
 global.fetch = jest.fn();
 
+// Minimal stand-in for the Headers of a fetch response
+const headers = (values: Record<string, string>): Pick<Headers, 'get'> => ({
+    get: (name: string): string | null => values[name] ?? null,
+});
+
 describe('apiService', () => {
     beforeEach(() => {
         jest.clearAllMocks();
@@ -35,6 +40,26 @@ describe('apiService', () => {
             expect(result).toEqual(mockGameStatus);
         });
 
+        it('reads the poll hint from the X-Poll-After header', async () => {
+            const mockResponse = {
+                ok: true,
+                headers: headers({ 'X-Poll-After': '15000' }),
+                json: jest.fn().mockResolvedValue(mockGameStatus),
+            };
+            (global.fetch as jest.Mock).mockResolvedValue(mockResponse);
+
+            const result = await apiService.fetchGameStatus();
+
+            expect(result).toEqual({ ...mockGameStatus, pollAfterMs: 15000 });
+        });
+
+        it('ignores a missing or invalid poll hint', async () => {
+            expect(parsePollAfter(headers({}))).toBeUndefined();
+            expect(parsePollAfter(headers({ 'X-Poll-After': 'soon' }))).toBeUndefined();
+            expect(parsePollAfter(headers({ 'X-Poll-After': '0' }))).toBeUndefined();
+            expect(parsePollAfter(undefined)).toBeUndefined();
+        });
+
         it('throws error when response is not ok', async () => {
             const mockResponse = {
                 ok: false,
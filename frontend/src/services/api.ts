@@ -2,6 +2,9 @@ import type { Card } from '../types';
 
 const API_BASE_URL = 'http://localhost:8000';
 
+// Header with the backend's recommended delay before the next poll, in milliseconds
+export const POLL_AFTER_HEADER = 'X-Poll-After';
+
 export interface ApiResponse<T> {
     success?: boolean;
     error?: string;
@@ -19,15 +22,26 @@ export interface GameStatusResponse {
     opponent_hand: Card[];
     filename?: string | null;
     error?: string;
+    // From the X-Poll-After header; not part of the response body
+    pollAfterMs?: number;
 }
 
+export const parsePollAfter = (
+    headers: Pick<Headers, 'get'> | undefined,
+): number | undefined => {
+    const value = Number(headers?.get(POLL_AFTER_HEADER));
+    return Number.isFinite(value) && value > 0 ? value : undefined;
+};
+
 export const apiService = {
     async fetchGameStatus(): Promise<GameStatusResponse> {
         const response = await fetch(`${API_BASE_URL}/api/current-status`);
         if (!response.ok) {
             throw new Error(`HTTP error! status: ${response.status}`);
         }
-        return await response.json();
+        const data: GameStatusResponse = await response.json();
+        const pollAfterMs = parsePollAfter(response.headers);
+        return pollAfterMs === undefined ? data : { ...data, pollAfterMs };
     },
 
     async resetState(): Promise<GameStatusResponse> {